@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk store imports: synchronous file-by-file reads vs the prefetching thread pool.
+
+Usage:
+    python scripts/benchmarks/bench_import.py [--typhoon-dir typhoon_data] [--latency-ms 2] [--workers 4,16,32]
+
+Network filesystems add a round trip to every open/read, which a local page-cached tree hides, so
+each read sleeps `--latency-ms` first (0 measures the local tree as it is). Before timing, the
+script checks that every mode fills the store identically, and that an import interrupted partway
+and rerun (with checkpoints) ends in the same store as an uninterrupted one. Every event's store
+timeline must also match parsing its folder.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+Fetch = Optional[Callable[[List[Path]], Iterator[bytes]]]
+
+
+class Interrupted(Exception):
+    pass
+
+
+def slow_reader(latency: float, fail_after: Optional[int] = None) -> Callable[[Path], bytes]:
+    calls = [0]
+
+    def read(path: Path) -> bytes:
+        calls[0] += 1
+        if fail_after is not None and calls[0] > fail_after:
+            raise Interrupted(f"simulated failure reading {path.name}")
+        if latency:
+            time.sleep(latency)
+        return path.read_bytes()
+
+    return read
+
+
+def import_tree(
+    store_path: Path, event_dirs: Dict[str, Path], workers: int, read: Callable[[Path], bytes], checkpoint_every: int = 0
+) -> int:
+    """Load every event into the store the way `bulk_import.py` does; returns the files loaded."""
+    pool = ThreadPoolExecutor(max_workers=workers) if workers else None
+    fetch: Fetch = lambda paths: map(read, paths)  # noqa: E731
+    if pool is not None:
+        fetch = lambda paths: builder.prefetch_files(pool, paths, 4 * workers, read)  # noqa: E731
+    files = 0
+    try:
+        with closing(builder.open_store(store_path)) as conn:
+            for event_id, event_dir in sorted(event_dirs.items()):
+                files += builder.ingest_event(conn, event_id, event_dir, fetch, checkpoint_every)[0]
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return files
+
+
+def store_contents(store_path: Path) -> Tuple[List[Tuple], ...]:
+    with closing(sqlite3.connect(store_path)) as conn:
+        return (
+            conn.execute(
+                "SELECT o.event, s.name, o.minute, o.mean, o.gust, o.direction FROM observations o "
+                "JOIN stations s USING (station) ORDER BY 1, 2, 3"
+            ).fetchall(),
+            conn.execute("SELECT event, name, size, mtime_ns, rows FROM loaded_files ORDER BY 1, 2").fetchall(),
+            conn.execute("SELECT * FROM event_quality ORDER BY 1").fetchall(),
+        )
+
+
+def assert_consistent(scratch: Path, event_dirs: Dict[str, Path], workers: List[int]) -> None:
+    reference = scratch / "sync.sqlite"
+    total = import_tree(reference, event_dirs, 0, slow_reader(0))
+    expected = store_contents(reference)
+    for count in workers:
+        path = scratch / f"pool-{count}.sqlite"
+        import_tree(path, event_dirs, count, slow_reader(0))
+        if store_contents(path) != expected:
+            raise AssertionError(f"{count} I/O workers: store differs from the synchronous import")
+
+    resumed = scratch / "resumed.sqlite"
+    try:
+        import_tree(resumed, event_dirs, max(workers), slow_reader(0, fail_after=total // 2), checkpoint_every=25)
+        raise AssertionError("the simulated failure did not interrupt the import")
+    except Interrupted:
+        pass
+    with closing(sqlite3.connect(resumed)) as conn:
+        committed = conn.execute("SELECT COUNT(*) FROM loaded_files").fetchone()[0]
+    rest = import_tree(resumed, event_dirs, max(workers), slow_reader(0), checkpoint_every=25)
+    if store_contents(resumed) != expected or committed + rest != total:
+        raise AssertionError("an interrupted and resumed import differs from an uninterrupted one")
+
+    with closing(builder.open_store(reference, readonly=True)) as conn:
+        for event_id, event_dir in sorted(event_dirs.items()):
+            from_store = builder.load_store_timeline(conn, event_id)
+            from_csv = builder.load_station_timelines(event_dir)
+            columns = ("minutes", "means", "gusts")  # compared as bytes, since NaN != NaN
+            if any(getattr(from_store, name).tobytes() != getattr(from_csv, name).tobytes() for name in columns):
+                raise AssertionError(f"{event_id}: store timeline differs from parsing the folder")
+            if from_store.quality != from_csv.quality:
+                raise AssertionError(f"{event_id}: store data-quality report differs from parsing the folder")
+    print(
+        f"[ok] {total} files: {len(workers)} pool sizes match the synchronous import; resumed after "
+        f"{committed} checkpointed files to the same store; store timelines match the CSVs"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk imports into the observation store.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated per-file read latency (0 = none)")
+    parser.add_argument("--workers", type=builder.parse_grid, default="4,16,32", help="I/O pool sizes to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed imports per mode (best and median are reported)")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[2]
+    event_dirs = builder.discover_event_directories((project_root / args.typhoon_dir).resolve())
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        scratch = Path(scratch_dir)
+        assert_consistent(scratch, event_dirs, args.workers)
+
+        results: Dict[str, List[float]] = {}
+        for count in [0, *args.workers]:
+            label = "synchronous" if count == 0 else f"{count} I/O workers"
+            samples = []
+            for attempt in range(args.repeat):
+                store_path = scratch / f"timed-{count}-{attempt}.sqlite"
+                start = time.perf_counter()
+                files = import_tree(store_path, event_dirs, count, slow_reader(args.latency_ms / 1000))
+                samples.append(time.perf_counter() - start)
+            results[label] = samples
+            print(
+                f"{label:>16}: best {min(samples) * 1000:8.1f} ms  median {statistics.median(samples) * 1000:8.1f} ms  "
+                f"({files / min(samples):,.0f} files/s)"
+            )
+    fastest = min(results, key=lambda label: min(results[label]))
+    print(
+        f"[done] {fastest} is {min(results['synchronous']) / min(results[fastest]):.2f}x the synchronous import "
+        f"at {args.latency_ms:g} ms per-file latency (best of {args.repeat})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark CSV ingestion: legacy `csv.DictReader` path vs the columnar `read_station_columns` path.
+
+Usage:
+    python scripts/benchmarks/bench_ingest.py [--typhoon-dir typhoon_data] [--repeat 5]
+
+Both paths read every event folder under the typhoon directory. The script checks that they agree
+on every timestamp/station cell before printing timings, so a speed-up can never hide a regression.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+
+def legacy_to_float(value: str) -> Optional[float]:
+    value = value.strip()
+    if not value or value.upper() == "N/A":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def legacy_read(event_dir: Path) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+    """The pre-columnar ingestion loop: one dict per CSV row, filtered after the fact."""
+    timeline_data: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+    for csv_path in sorted(event_dir.glob("*.csv")):
+        with csv_path.open("r", encoding="utf-8-sig") as handle:
+            for row in csv.DictReader(handle):
+                timestamp_value = row["Date time"].strip()
+                station_name = row["Automatic Weather Station"].strip()
+                if station_name not in builder.STATION_BY_CSV:
+                    continue
+                cell = timeline_data.setdefault(timestamp_value, {})
+                cell[station_name] = {
+                    "mean": legacy_to_float(row["10-Minute Mean Speed(km/hour)"]),
+                    "gust": legacy_to_float(row["10-Minute Maximum Gust(km/hour)"]),
+                }
+    return timeline_data
+
+
+def assert_equivalent(event_dir: Path) -> None:
+    legacy = legacy_read(event_dir)
+    columns = builder.read_station_columns(event_dir)
+    if sorted(legacy) != columns.timestamps:
+        raise AssertionError(f"{event_dir.name}: timestamp index differs")
+    for row, timestamp in enumerate(columns.timestamps):
+        for index, ref in enumerate(builder.REFERENCE_STATIONS):
+            cell = legacy[timestamp].get(ref["csvName"], {})
+            got = (
+                builder.optional_speed(columns.means[index][row]),
+                builder.optional_speed(columns.gusts[index][row]),
+            )
+            if got != (cell.get("mean"), cell.get("gust")):
+                raise AssertionError(f"{event_dir.name} {timestamp} {ref['csvName']}: {got} != {cell}")
+
+
+def time_pass(reader, event_dirs: List[Path]) -> float:
+    start = time.perf_counter()
+    for event_dir in event_dirs:
+        reader(event_dir)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CSV ingestion paths.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes per path (best and median are reported)")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[2]
+    typhoon_root = (project_root / args.typhoon_dir).resolve()
+    event_dirs = sorted(builder.discover_event_directories(typhoon_root).values())
+    file_count = sum(1 for event_dir in event_dirs for _ in event_dir.glob("*.csv"))
+
+    for event_dir in event_dirs:
+        assert_equivalent(event_dir)
+    print(f"[ok] both paths agree on {len(event_dirs)} events / {file_count} CSV files")
+
+    results = {}
+    for label, reader in (("dictreader", legacy_read), ("columnar", builder.read_station_columns)):
+        time_pass(reader, event_dirs)  # warm the OS page cache
+        samples = [time_pass(reader, event_dirs) for _ in range(args.repeat)]
+        results[label] = samples
+        print(
+            f"{label:>10}: best {min(samples) * 1000:8.1f} ms  median {statistics.median(samples) * 1000:8.1f} ms  "
+            f"({file_count / min(samples):,.0f} files/s)"
+        )
+    speedup = min(results["dictreader"]) / min(results["columnar"])
+    print(f"[done] columnar ingestion is {speedup:.2f}x faster (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
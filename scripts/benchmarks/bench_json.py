@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark event JSON serialisation: one `json.dumps(indent=2)` string vs the streamed writer.
+
+Usage:
+    python scripts/benchmarks/bench_json.py [--typhoon-dir typhoon_data] [--repeat 3]
+
+Every event is first round-tripped: the streamed bytes (indented and minified, stdlib and orjson
+when installed) must equal the legacy string and decode back to the fully materialised payload.
+Timings then cover payload construction plus serialisation and writing to a scratch directory; peak
+memory is the tracemalloc peak of one pass over the largest event.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+Event = Tuple[Dict[str, object], builder.EventTimeline]
+
+
+def legacy_write(path: Path, event_meta: Dict[str, object], timeline: builder.EventTimeline) -> None:
+    """The pre-streaming path: the full object graph, then one big string, then one write."""
+    payload = builder.build_event_payload(event_meta, timeline)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def streamed_write(path: Path, event_meta: Dict[str, object], timeline: builder.EventTimeline) -> None:
+    payload = builder.build_event_payload(event_meta, timeline, readings=False)
+    builder.write_event_json(path, payload, timeline)
+
+
+def assert_round_trip(event_meta: Dict[str, object], timeline: builder.EventTimeline) -> None:
+    full = builder.build_event_payload(event_meta, timeline)
+    lazy = builder.build_event_payload(event_meta, timeline, readings=False)
+    for compact in (False, True):
+        legacy = (
+            json.dumps(full, ensure_ascii=False, separators=(",", ":"))
+            if compact
+            else json.dumps(full, ensure_ascii=False, indent=2)
+        ).encode("utf-8")
+        streamed = b"".join(builder.iter_event_json(lazy, timeline, compact))
+        if streamed != legacy:
+            raise AssertionError(f"{event_meta['id']}: streamed bytes differ (compact={compact})")
+        if json.loads(streamed) != full:
+            raise AssertionError(f"{event_meta['id']}: streamed JSON does not decode to the payload")
+
+
+def time_pass(writer: Callable, events: List[Event], scratch: Path) -> float:
+    start = time.perf_counter()
+    for event_meta, timeline in events:
+        writer(scratch / f"{event_meta['id']}.json", event_meta, timeline)
+    return time.perf_counter() - start
+
+
+def peak_kb(writer: Callable, event: Event, scratch: Path) -> float:
+    event_meta, timeline = event
+    tracemalloc.start()
+    writer(scratch / f"{event_meta['id']}.json", event_meta, timeline)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark event JSON serialisation.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per path (best and median are reported)")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[2]
+    typhoon_root = (project_root / args.typhoon_dir).resolve()
+    metadata = builder.build_metadata(project_root, typhoon_root)
+    events: List[Event] = []
+    for event_id, event_dir in sorted(builder.discover_event_directories(typhoon_root).items()):
+        timeline = builder.load_station_timelines(event_dir)
+        if event_id in metadata and len(timeline):
+            events.append((metadata[event_id], timeline))
+
+    encoders = [("stdlib", None), ("orjson", builder.orjson)] if builder.orjson is not None else [("stdlib", None)]
+    installed = builder.orjson
+    paths: List[Tuple[str, Callable, object]] = [("legacy", legacy_write, None)]
+    paths += [(f"streamed/{label}", streamed_write, module) for label, module in encoders]
+    try:
+        for label, module in encoders:
+            builder.orjson = module
+            for event_meta, timeline in events:
+                assert_round_trip(event_meta, timeline)
+        print(f"[ok] streamed output round-trips for {len(events)} events ({', '.join(label for label, _ in encoders)})")
+
+        largest = max(events, key=lambda event: len(event[1]))
+        results: Dict[str, List[float]] = {}
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            scratch = Path(scratch_dir)
+            for label, writer, module in paths:
+                builder.orjson = module
+                time_pass(writer, events, scratch)  # warm caches
+                samples = [time_pass(writer, events, scratch) for _ in range(args.repeat)]
+                results[label] = samples
+                print(
+                    f"{label:>16}: best {min(samples) * 1000:8.1f} ms  median {statistics.median(samples) * 1000:8.1f} ms  "
+                    f"peak {peak_kb(writer, largest, scratch):8.0f} KB ({largest[0]['id']})"
+                )
+    finally:
+        builder.orjson = installed
+    fastest = min((label for label in results if label != "legacy"), key=lambda label: min(results[label]))
+    print(f"[done] {fastest} is {min(results['legacy']) / min(results[fastest]):.2f}x the legacy path (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
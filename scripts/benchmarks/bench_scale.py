@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark on synthetic `typhoon_data/`-shaped archives.
+
+Usage:
+    python scripts/benchmarks/bench_scale.py [--scales 10,100,1000] [--days-per-event 2] [--stations-per-csv 30]
+        [--jobs 1] [--work-dir /tmp/t8-bench] [--compare scripts/benchmarks/results/<previous>.json]
+
+Each scale multiplies today's archive (11 events, roughly 2 days of 10-minute CSVs each) by that
+factor. The generator writes one `*-latest_10min_wind.csv` per interval in the HKO schema
+(`Date time,Automatic Weather Station,...`), with the eight reference stations plus filler stations,
+and a matching `time_of_signal_8.md` / `casualty_and_lost_of_signal_8.md` pair. Storms start in 1960
+and peak mid-event, and the wind field comes from a seeded RNG, so the same arguments always produce
+the same tree and a realistic mix of tiers.
+
+For every scale the script times `load_station_timelines`, `detect_tier` and `build_event_payload`
+event by event, then runs the builder's `main()` end to end into a scratch output folder. Results
+(plus peak RSS and the generator settings) are saved as JSON under `scripts/benchmarks/results/`;
+`--compare` prints the ratios against an earlier results file. Generated trees are kept in
+`--work-dir` and reused when their settings match, because a 1000× archive takes a while to write.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:  # Unix only; peak RSS is left out of the results elsewhere
+    import resource
+except ImportError:  # pragma: no cover - depends on the platform
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+BASELINE_EVENTS = 11
+CSV_HEADER = (
+    "Date time,Automatic Weather Station,10-Minute Mean Wind Direction(Compass points),"
+    "10-Minute Mean Speed(km/hour),10-Minute Maximum Gust(km/hour)\n"
+)
+FILLER_STATIONS = [
+    "Central Pier", "Green Island", "Hong Kong Airport", "King's Park", "Lamma Island", "Ngong Ping",
+    "North Point", "Peng Chau", "Sha Chau", "Shek Kong", "Stanley", "Star Ferry", "Tai Mei Tuk",
+    "Tai Po Kau", "Tap Mun", "Tate's Cairn", "Tseung Kwan O", "Tuen Mun", "Waglan Island",
+    "Wetland Park", "Wong Chuk Hang", "Tai Mo Shan",
+]
+DIRECTIONS = ("North", "Northeast", "East", "Southeast", "South", "Southwest", "West", "Northwest")
+TREE_SETTINGS_FILENAME = ".synthetic-settings.json"
+
+
+def synthetic_name(index: int) -> str:
+    """`Synth-aaaa`, `Synth-aaab`, ...: letters only, so `event_id_for_directory` keeps the whole name."""
+    letters = ""
+    for _ in range(4):
+        index, digit = divmod(index, 26)
+        letters = chr(ord("a") + digit) + letters
+    return f"Synth-{letters}"
+
+
+def write_event(event_dir: Path, start: datetime, intervals: int, stations: List[str], rng: random.Random) -> None:
+    event_dir.mkdir(parents=True)
+    peak = rng.uniform(45, 110)
+    centre = intervals * rng.uniform(0.35, 0.65)
+    spread = max(intervals * rng.uniform(0.05, 0.2), 1.0)
+    lull = rng.random() < 0.3  # eye passage: a dip in the middle of the peak
+    exposure = {name: rng.uniform(0.55, 1.1) for name in stations}
+    direction = rng.randrange(len(DIRECTIONS))
+    for step in range(intervals):
+        moment = start + timedelta(minutes=10 * step)
+        distance = (step - centre) / spread
+        strength = peak / (1 + distance * distance)
+        if lull and abs(distance) < 0.25:
+            strength *= 0.45
+        if step % 36 == 0:
+            direction = (direction + rng.choice((-1, 0, 1))) % len(DIRECTIONS)
+        stamp = moment.strftime("%Y%m%d%H%M")
+        lines = [CSV_HEADER]
+        for name in stations:
+            if rng.random() < 0.01:
+                lines.append(f"{stamp},{name},N/A,N/A,N/A\n")
+                continue
+            mean = max(0, round(strength * exposure[name] + rng.gauss(0, 4)))
+            gust = mean + round(abs(rng.gauss(15, 6)))
+            lines.append(f"{stamp},{name},{DIRECTIONS[direction]},{mean},{gust}\n")
+        published = moment + timedelta(minutes=8)
+        (event_dir / f"{published:%Y%m%d-%H%M}-latest_10min_wind.csv").write_text("".join(lines), encoding="utf-8")
+
+
+def signal_row(name: str, issued: datetime, cancelled: datetime) -> str:
+    def fmt(value: datetime) -> str:
+        return f"{value:%H:%M}, {value.day} {value:%b %Y}"
+
+    hours, minutes = divmod(int((cancelled - issued).total_seconds() // 60), 60)
+    return f"| {name} (合成) | {issued.year} | {fmt(issued)} | {fmt(cancelled)} | {hours}h {minutes:02d}m | No | Synthetic |"
+
+
+def generate_archive(root: Path, events: int, days_per_event: float, stations_per_csv: int, seed: int) -> None:
+    """Write `events` synthetic event folders plus matching metadata tables under `root`."""
+    rng = random.Random(seed)
+    stations = [ref["csvName"] for ref in builder.REFERENCE_STATIONS]
+    stations += FILLER_STATIONS[: max(stations_per_csv - len(stations), 0)]
+    intervals = max(int(days_per_event * 144), 1)
+    signal_lines = [
+        "| Storm | Year | Signal 8 Issued | Signal 8 Replaced/Cancelled | Duration | Signal 10 | Notes |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    casualty_lines = [
+        "| Name | Year | Deaths | Missing | Injured | Shipwreck (oceangoing) | Destroyed Small Boats | Damaged Small Boats |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    span_days = max(366 * 65, int(events * days_per_event * 2))  # 1960 onwards, never overlapping
+    for index in range(events):
+        name = synthetic_name(index)
+        offset = timedelta(days=span_days * index / events)
+        start = (datetime(1960, 6, 1) + offset).replace(hour=0, minute=0) + timedelta(minutes=10 * rng.randrange(144))
+        write_event(root / f"{name} {start:%Y%m%d}", start, intervals, stations, rng)
+        issued = start + timedelta(minutes=10 * int(intervals * rng.uniform(0.15, 0.4)))
+        cancelled = start + timedelta(minutes=10 * int(intervals * rng.uniform(0.6, 0.9)))
+        signal_lines.append(signal_row(name, issued, cancelled))
+        if rng.random() < 0.5:
+            casualty_lines.append(
+                f"| {name} | {issued.year} | {rng.randrange(3)} | 0 | {rng.randrange(20)} | 0 | {rng.randrange(3)} | {rng.randrange(6)} |"
+            )
+    (root / "time_of_signal_8.md").write_text(
+        "Synthetic Signal No. 8 Records\n==============================\n" + "\n".join(signal_lines) + "\n", encoding="utf-8"
+    )
+    (root / "casualty_and_lost_of_signal_8.md").write_text("\n".join(casualty_lines) + "\n", encoding="utf-8")
+
+
+def prepare_archive(work_dir: Path, scale: float, settings: Dict[str, object]) -> Path:
+    """Return a synthetic tree for `settings`, regenerating it only when the saved settings differ."""
+    root = work_dir / f"scale-{scale:g}"
+    marker = root / TREE_SETTINGS_FILENAME
+    if marker.exists() and json.loads(marker.read_text(encoding="utf-8")) == settings:
+        print(f"[info] reusing {root}")
+        return root
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+    started = time.perf_counter()
+    generate_archive(
+        root,
+        int(settings["events"]),  # type: ignore[arg-type]
+        float(settings["daysPerEvent"]),  # type: ignore[arg-type]
+        int(settings["stationsPerCsv"]),  # type: ignore[arg-type]
+        int(settings["seed"]),  # type: ignore[arg-type]
+    )
+    marker.write_text(json.dumps(settings), encoding="utf-8")
+    print(f"[info] generated {settings['events']} events in {root} ({time.perf_counter() - started:.1f} s)")
+    return root
+
+
+def peak_rss_kb() -> Optional[int]:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None
+
+
+def time_stages(archive: Path) -> Dict[str, object]:
+    """Per-event stage timings, one event in memory at a time (as the builder itself does)."""
+    metadata = builder.build_metadata(Path(__file__).resolve().parents[2], archive)
+    totals = {"load_station_timelines": 0.0, "detect_tier": 0.0, "build_event_payload": 0.0}
+    files = intervals = 0
+    tiers = {1: 0, 2: 0, 3: 0}
+    for event_id, event_dir in sorted(builder.discover_event_directories(archive).items()):
+        started = time.perf_counter()
+        timeline = builder.load_station_timelines(event_dir)
+        loaded = time.perf_counter()
+        tier_info = builder.detect_tier(timeline)
+        detected = time.perf_counter()
+        builder.build_event_payload(metadata[event_id], timeline, tier_info=tier_info)
+        built = time.perf_counter()
+        totals["load_station_timelines"] += loaded - started
+        totals["detect_tier"] += detected - loaded
+        totals["build_event_payload"] += built - detected
+        files += sum(1 for _ in event_dir.glob("*.csv"))
+        intervals += len(timeline)
+        tiers[tier_info["detectedTier"]] += 1  # type: ignore[index]
+    return {
+        "files": files,
+        "intervals": intervals,
+        "tierMix": tiers,
+        "stagesMs": {stage: round(seconds * 1000, 1) for stage, seconds in totals.items()},
+    }
+
+
+def time_end_to_end(archive: Path, output: Path, jobs: int) -> float:
+    if output.exists():
+        shutil.rmtree(output)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # one progress line per event would swamp the report
+        builder.main(["--typhoon-dir", str(archive), "--output-dir", str(output), "--jobs", str(jobs)])
+    return time.perf_counter() - started
+
+
+def print_comparison(current: List[Dict[str, object]], previous_path: Path) -> None:
+    previous = {
+        run["scale"]: run for run in json.loads(previous_path.read_text(encoding="utf-8"))["runs"]
+    }
+    print(f"[info] compared with {previous_path} (ratio < 1.00 = faster now)")
+    for run in current:
+        before = previous.get(run["scale"])
+        if before is None:
+            continue
+        now_ms = dict(run["stagesMs"], main=run["mainMs"])  # type: ignore[arg-type]
+        then_ms = dict(before["stagesMs"], main=before["mainMs"])
+        ratios = ", ".join(
+            f"{stage} {now_ms[stage] / then_ms[stage]:.2f}" for stage in now_ms if then_ms.get(stage)
+        )
+        print(f"    {run['scale']:g}x: {ratios}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scaling benchmark on synthetic typhoon archives.")
+    parser.add_argument("--scales", default="10,100,1000", help="Comma-separated multiples of today's event count")
+    parser.add_argument("--days-per-event", type=float, default=2.0, help="Days of 10-minute CSVs per event")
+    parser.add_argument("--stations-per-csv", type=int, default=30, help="Station rows per CSV (≥8 keeps every reference station)")
+    parser.add_argument("--seed", type=int, default=8, help="RNG seed for the synthetic wind field")
+    parser.add_argument("--jobs", type=int, default=1, help="--jobs passed to the end-to-end main() run")
+    parser.add_argument("--work-dir", default=str(Path(tempfile.gettempdir()) / "t8-bench"), help="Where synthetic trees live")
+    parser.add_argument("--results-dir", default=str(Path(__file__).resolve().parent / "results"), help="Where result JSON is saved")
+    parser.add_argument("--compare", help="Earlier results file to print ratios against")
+    args = parser.parse_args()
+
+    work_dir = Path(args.work_dir).resolve()
+    runs: List[Dict[str, object]] = []
+    for scale in builder.parse_grid(args.scales, float):
+        settings = {
+            "events": max(round(BASELINE_EVENTS * scale), 1),
+            "daysPerEvent": args.days_per_event,
+            "stationsPerCsv": args.stations_per_csv,
+            "seed": args.seed,
+        }
+        archive = prepare_archive(work_dir, scale, settings)
+        stages = time_stages(archive)
+        main_seconds = time_end_to_end(archive, work_dir / f"out-{scale:g}", args.jobs)
+        run = {"scale": scale, **settings, **stages, "mainMs": round(main_seconds * 1000, 1), "peakRssKb": peak_rss_kb()}
+        runs.append(run)
+        stage_text = "  ".join(f"{stage} {ms:.0f} ms" for stage, ms in stages["stagesMs"].items())  # type: ignore[union-attr]
+        print(
+            f"[ok] {scale:g}x ({settings['events']} events, {stages['files']} files): {stage_text}  "
+            f"main {main_seconds * 1000:.0f} ms  ({stages['files'] / main_seconds:,.0f} files/s end to end)"
+        )
+
+    results_dir = Path(args.results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    results_path = results_dir / f"bench_scale-{datetime.now():%Y%m%d-%H%M%S}.json"
+    results_path.write_text(
+        json.dumps(
+            {
+                "createdAt": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "numpy": builder.np is not None,
+                "jobs": args.jobs,
+                "runs": runs,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"[done] results -> {results_path}")
+    if args.compare:
+        print_comparison(runs, Path(args.compare))
+
+
+if __name__ == "__main__":
+    main()
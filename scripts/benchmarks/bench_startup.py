@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark library start-up: importing the builder, loading metadata and load_event + evaluate calls.
+
+Usage:
+    python scripts/benchmarks/bench_startup.py [--event ragasa] [--calls 200] [--repeat 5]
+
+First checks that the disk-cached metadata equals a fresh parse of the tables and that `evaluate`
+returns the event JSON's `ruleEvaluations`. Then reports: a cold `import build_event_data` in a
+fresh interpreter (and which heavy modules it pulled in), `build_metadata` with and without its
+cache, and the per-call cost of `evaluate(load_event(...))` once the event's timeline is memoised.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+HEAVY_MODULES = ("numpy", "orjson", "brotli", "argparse", "sqlite3", "concurrent.futures", "statistics", "tracemalloc")
+IMPORT_PROBE = (
+    "import sys, time; start = time.perf_counter(); import build_event_data; "
+    "print(time.perf_counter() - start); print(','.join(sorted(set(sys.argv[1:]) & sys.modules.keys())))"
+)
+
+
+def cold_import(scripts_dir: Path) -> List[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE, *HEAVY_MODULES],
+        cwd=scripts_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split("\n")
+
+
+def best_ms(func: Callable[[], object], repeat: int, calls: int = 1) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - start) * 1000 / calls)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark builder import and library start-up.")
+    parser.add_argument("--event", default="ragasa", help="Event id for the load_event/evaluate loop")
+    parser.add_argument("--calls", type=int, default=200, help="load_event + evaluate calls per timed pass")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes (best and median are reported)")
+    args = parser.parse_args()
+
+    root = builder.PROJECT_ROOT
+    typhoon_root = root / "typhoon_data"
+    tables = builder.metadata_tables(root, typhoon_root)
+    if builder.build_metadata(root, typhoon_root) != builder.parse_metadata(*tables):
+        raise AssertionError("cached metadata differs from a fresh parse")
+    event = builder.load_event(args.event)
+    rules = builder.load_tier_rules(root / builder.DEFAULT_TIER_RULES)
+    payload = builder.build_event_payload(event.meta, event.timeline, readings=False, rules=rules)
+    if builder.evaluate(event) != payload["ruleEvaluations"]:
+        raise AssertionError(f"{args.event}: evaluate() differs from the event's ruleEvaluations")
+    print(f"[ok] cached metadata and evaluate() match the build for {args.event}")
+
+    imports = [cold_import(Path(builder.__file__).parent) for _ in range(args.repeat)]
+    samples = [float(lines[0]) * 1000 for lines in imports]
+    loaded = imports[0][1] or "none"
+    print(f"{'cold import':>22}: best {min(samples):7.1f} ms  median {statistics.median(samples):7.1f} ms  (heavy modules loaded: {loaded})")
+    for label, func in (
+        ("metadata (parse)", lambda: builder.parse_metadata(*tables)),
+        ("metadata (cached)", lambda: builder.build_metadata(root, typhoon_root)),
+        ("load_event+evaluate", lambda: builder.evaluate(builder.load_event(args.event), rules)),
+    ):
+        samples = best_ms(func, args.repeat, args.calls)
+        print(f"{label:>22}: best {min(samples):7.2f} ms  median {statistics.median(samples):7.2f} ms  per call")
+
+
+if __name__ == "__main__":
+    main()
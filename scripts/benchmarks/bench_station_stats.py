@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-station statistics: `station_statistics` on the timeline vs scanning `stationReadings`.
+
+Usage:
+    python scripts/benchmarks/bench_station_stats.py [--typhoon-dir typhoon_data] [--repeat 5]
+
+First checks, for every event and with and without NumPy, that `station_statistics` equals a
+naive interval-by-interval scan of the event's `stationReadings` and that `summarize_peak` still
+picks the same station as that scan. Then times both per event and compares the bytes a summary
+card needs: the event's JSON against its share of `stations.json`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+
+def scan_readings(readings: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Per-station statistics the way a client derives them from the verbose JSON."""
+    summary = []
+    for position, ref in enumerate(builder.REFERENCE_STATIONS):
+        means, gusts, exceeding = [], [], []
+        for reading in readings:
+            station = reading["stations"][position]  # type: ignore[index]
+            if station["meanSpeedKmh"] is not None:
+                means.append((station["meanSpeedKmh"], reading["timestamp"]))
+            if station["gustKmh"] is not None:
+                gusts.append((station["gustKmh"], reading["timestamp"]))
+            if station["meetsThreshold"]:
+                exceeding.append(reading["timestamp"])
+        peak_mean = min(means, key=lambda item: (-item[0], item[1])) if means else (None, None)
+        peak_gust = min(gusts, key=lambda item: (-item[0], item[1])) if gusts else (None, None)
+        summary.append(
+            {
+                "stationId": ref["stationId"],
+                "nameEn": ref["nameEn"],
+                "nameZh": ref["nameZh"],
+                "intervalsReported": len(means),
+                "peakMeanKmh": peak_mean[0],
+                "peakMeanAt": peak_mean[1],
+                "peakGustKmh": peak_gust[0],
+                "peakGustAt": peak_gust[1],
+                "minutesAtOrAboveThreshold": len(exceeding) * builder.INTERVAL_MINUTES,
+                "firstExceedance": exceeding[0] if exceeding else None,
+                "lastExceedance": exceeding[-1] if exceeding else None,
+            }
+        )
+    return summary
+
+
+def scan_peak(readings: List[Dict[str, object]]) -> Optional[str]:
+    """Station holding the highest mean; ties go to the earliest interval, then station order."""
+    best: Optional[float] = None
+    station_id = None
+    for reading in readings:
+        for station in reading["stations"]:  # type: ignore[union-attr]
+            value = station["meanSpeedKmh"]
+            if value is not None and (best is None or value > best):
+                best, station_id = value, station["stationId"]
+    return station_id
+
+
+def best_ms(func: Callable[[], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark precomputed per-station statistics.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per event (best and median are reported)")
+    args = parser.parse_args()
+
+    project_root = builder.PROJECT_ROOT
+    typhoon_root = (project_root / args.typhoon_dir).resolve()
+    metadata = builder.build_metadata(project_root, typhoon_root)
+    event_dirs = builder.discover_event_directories(typhoon_root)
+    numpy_module = builder.np
+
+    events = []
+    for event_id, event_dir in sorted(event_dirs.items()):
+        timeline = builder.load_station_timelines(event_dir)
+        if not len(timeline):
+            continue
+        payload = builder.build_event_payload(metadata[event_id], timeline)
+        readings = json.loads(json.dumps(payload["stationReadings"]))
+        expected = scan_readings(readings)
+        for module in (numpy_module, None) if numpy_module is not None else (None,):
+            builder.np = module
+            if builder.station_statistics(timeline) != expected:
+                raise AssertionError(f"{event_id}: station_statistics differs from scanning stationReadings (numpy={module is not None})")
+            peak = builder.summarize_peak(timeline)
+            if (peak["stationId"] if peak else None) != scan_peak(readings):
+                raise AssertionError(f"{event_id}: summarize_peak differs from scanning stationReadings")
+        builder.np = numpy_module
+        events.append((event_id, timeline, payload, readings))
+    print(f"[ok] station_statistics and summarize_peak match a readings scan for {len(events)} events")
+
+    contributions = [builder.event_analytics(payload, timeline) for _, timeline, payload, _ in events]
+    index_bytes = len(builder.encode_json(builder.build_station_index(contributions), compact=True))
+    for event_id, timeline, payload, readings in events:
+        fast = best_ms(lambda: builder.station_statistics(timeline), args.repeat)
+        slow = best_ms(lambda: scan_readings(readings), args.repeat)
+        event_bytes = len(builder.encode_json(payload, compact=True))
+        print(
+            f"{event_id:>8}: {len(timeline):4} intervals  timeline {min(fast):6.3f} ms (median {statistics.median(fast):6.3f})  "
+            f"readings scan {min(slow):7.3f} ms  {min(slow) / min(fast):6.1f}x  "
+            f"event JSON {event_bytes / 1024:6.1f} KB vs {index_bytes / len(events) / 1024:4.1f} KB of stations.json"
+        )
+    print(f"[done] stations.json holds all {len(events)} events in {index_bytes / 1024:.1f} KB (minified)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Differential check + benchmark for the run-length tier engine.
+
+Usage:
+    python scripts/benchmarks/bench_tier_engine.py [--typhoon-dir typhoon_data] [--repeat 3]
+
+Every event under the typhoon directory is parsed once and its per-interval station counts are
+computed once per threshold. `detect_tier` is then compared against the original interval-by-interval
+scan (persistence loop + Tier 2 state machine, reproduced below) over a grid of thresholds, station
+counts and persistence lengths, and both engines are timed on that grid from the shared counts.
+Any disagreement aborts with the first differing event/setting.
+
+The declarative rule engine gets the same treatment. Every rule set in the rules file, plus generated
+variants (gust metric, station weights, rolling windows), is checked against a per-interval scan of
+the raw readings, with and without NumPy. Then all rule sets evaluated together by the compiled
+engine are timed against one naive scan per rule set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import build_event_data as builder  # noqa: E402
+
+THRESHOLDS = (41, 50, 55, 60, 63, 70, 80)
+STATION_COUNTS = (1, 2, 3, 4, 5, 6, 8)
+PERSISTENCE_LENGTHS = (1, 2, 3, 4, 6)
+
+
+def legacy_windows(timeline, counts, min_stations: int) -> List[Dict[str, object]]:
+    windows: List[Dict[str, object]] = []
+    current: Optional[Dict[str, object]] = None
+    for index, count in enumerate(counts):
+        stamp = timeline.stamps[index]
+        if count >= min_stations:
+            if current is None:
+                current = {"start": stamp, "end": stamp, "first": index, "intervals": 0, "maxCount": count}
+            current["end"] = stamp
+            current["intervals"] += 1
+            current["maxCount"] = max(current["maxCount"], count)
+        elif current:
+            windows.append(current)
+            current = None
+    if current:
+        windows.append(current)
+    return windows
+
+
+def legacy_detect_tier(timeline, threshold: float, min_stations: int, min_intervals: int, counts) -> Dict[str, object]:
+    """The pre-RLE engine: one Python pass per interval for windows, another for the Tier 2 state machine."""
+    windows = legacy_windows(timeline, counts, min_stations)
+    converted = [builder.convert_window(w) for w in windows]
+    tier1_window = next((w for w in windows if w["intervals"] >= min_intervals), None)
+    if tier1_window:
+        return {
+            "detectedTier": 1,
+            "initialDetection": timeline.minutes[tier1_window["first"]],
+            "persistenceWindows": converted,
+            "tier1Window": builder.convert_window(tier1_window),
+            "tier2Pattern": None,
+        }
+    state = "search"
+    initial = lull = remerge = None
+    for index, count in enumerate(counts):
+        stamp = timeline.stamps[index]
+        meets = count >= min_stations
+        if state == "search":
+            if meets:
+                initial = {"start": stamp, "end": stamp, "first": index, "intervals": 1}
+                state = "initial"
+        elif state == "initial":
+            if meets:
+                initial["end"] = stamp
+                initial["intervals"] += 1
+            else:
+                lull = {"start": stamp, "end": stamp, "intervals": 1}
+                state = "lull"
+        elif state == "lull":
+            if meets:
+                remerge = {"start": stamp, "end": stamp, "intervals": 1}
+                state = "reemerge"
+            else:
+                lull["end"] = stamp
+                lull["intervals"] += 1
+        elif state == "reemerge":
+            if meets:
+                remerge["end"] = stamp
+                remerge["intervals"] += 1
+            else:
+                break
+    if state == "reemerge" and initial and lull and remerge:
+        return {
+            "detectedTier": 2,
+            "initialDetection": timeline.minutes[initial["first"]],
+            "persistenceWindows": converted,
+            "tier1Window": None,
+            "tier2Pattern": {
+                "initialBurst": builder.convert_window(initial),
+                "lull": builder.convert_window(lull),
+                "reemergence": builder.convert_window(remerge),
+            },
+        }
+    return {
+        "detectedTier": 3,
+        "initialDetection": None,
+        "persistenceWindows": converted,
+        "tier1Window": None,
+        "tier2Pattern": None,
+    }
+
+
+RULE_VARIANTS = (
+    builder.TierRule(id="gust-80", metric="gust", threshold=80),
+    builder.TierRule(id="weighted", threshold=55, min_stations=3.5, weights=(0.5, 1, 1.5, 1, 1, 1, 2, 0)),
+    builder.TierRule(id="rolling", threshold=50, min_stations=3, window=4, min_active=3),
+    builder.TierRule(
+        id="weighted-rolling", metric="gust", threshold=70, weights=(1, 1, 1, 1, 2, 2, 2, 2), window=3, min_active=1
+    ),
+)
+
+
+def naive_rule(timeline, rule: builder.TierRule) -> Tuple[List[float], bytes]:
+    """Score and active mask for one rule, reading every cell through the timeline accessors."""
+    weights = rule.weights or (1,) * len(timeline.stations)
+    reading = timeline.mean if rule.metric == "mean" else timeline.gust
+    scores: List[float] = []
+    for index in range(len(timeline)):
+        score = 0
+        for station, weight in enumerate(weights):
+            value = reading(index, station)
+            if value is not None and value >= rule.threshold and weight:
+                score += weight
+        scores.append(score)
+    base = [score >= rule.min_stations for score in scores]
+    mask = bytes(sum(base[max(0, index - rule.window + 1):index + 1]) >= rule.min_active for index in range(len(base)))
+    return scores, mask
+
+
+def naive_rules(timeline, rules: Sequence[builder.TierRule]) -> None:
+    for rule in rules:
+        scores, mask = naive_rule(timeline, rule)
+        legacy_detect_tier(timeline, None, 1, rule.min_intervals, mask)
+
+
+def check_rules(timelines, metadata, rules: Sequence[builder.TierRule]) -> int:
+    checked = 0
+    for use_numpy in (True, False) if builder.np is not None else (False,):
+        installed = builder.np
+        builder.np = installed if use_numpy else None
+        try:
+            engine = builder.TierRuleEngine(rules)
+            for event_id, timeline in timelines.items():
+                masks = engine.station_masks(timeline)
+                results = engine.evaluate(timeline, metadata.get(event_id, {}))
+                for rule, stage in zip(rules, engine.stages):
+                    meets, counts = masks[rule.metric, rule.threshold]
+                    scores, mask = stage(meets, counts, len(timeline))
+                    expected_scores, expected_mask = naive_rule(timeline, rule)
+                    if list(scores) != expected_scores or mask != expected_mask:
+                        raise AssertionError(f"{event_id} rule {rule.id} (numpy={use_numpy}): mask differs")
+                    expected = legacy_detect_tier(timeline, None, 1, rule.min_intervals, mask)
+                    result = results[rule.id]
+                    detection = expected["initialDetection"]
+                    if result["detectedTier"] != expected["detectedTier"] or result["initialDetection"] != (
+                        builder.minutes_iso(detection) if detection is not None else None
+                    ):
+                        raise AssertionError(f"{event_id} rule {rule.id} (numpy={use_numpy}): tier differs")
+                    checked += 1
+        finally:
+            builder.np = installed
+    return checked
+
+
+def run_grid(engine, timelines, counts_by_event) -> float:
+    start = time.perf_counter()
+    for event_id, timeline in timelines.items():
+        counts_by_threshold = counts_by_event[event_id]
+        for threshold, min_stations, min_intervals in itertools.product(THRESHOLDS, STATION_COUNTS, PERSISTENCE_LENGTHS):
+            engine(timeline, threshold, min_stations, min_intervals, counts_by_threshold[threshold])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Differential check and benchmark for detect_tier.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the settings grid per engine")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[2]
+    typhoon_root = (project_root / args.typhoon_dir).resolve()
+    timelines = {
+        event_id: builder.load_station_timelines(event_dir)
+        for event_id, event_dir in sorted(builder.discover_event_directories(typhoon_root).items())
+    }
+
+    counts_by_event = {
+        event_id: {threshold: builder.interval_counts(timeline, threshold) for threshold in THRESHOLDS}
+        for event_id, timeline in timelines.items()
+    }
+
+    grid = list(itertools.product(THRESHOLDS, STATION_COUNTS, PERSISTENCE_LENGTHS))
+    tiers = {1: 0, 2: 0, 3: 0}
+    for event_id, timeline in timelines.items():
+        for setting in grid:
+            expected = legacy_detect_tier(timeline, *setting, builder.interval_counts(timeline, setting[0]))
+            actual = builder.detect_tier(timeline, *setting)
+            if actual != expected:
+                raise AssertionError(f"{event_id} at (threshold, stations, intervals)={setting}: engines disagree")
+            tiers[actual["detectedTier"]] += 1
+    print(
+        f"[ok] RLE engine matches the legacy scan on {len(timelines)} events × {len(grid)} settings "
+        f"(tier mix {tiers[1]}/{tiers[2]}/{tiers[3]})"
+    )
+
+    project_rules = project_root / builder.DEFAULT_TIER_RULES
+    rules = (builder.load_tier_rules(project_rules) if project_rules.exists() else ()) + RULE_VARIANTS
+    metadata = builder.build_metadata(project_root, typhoon_root)
+    checked = check_rules(timelines, metadata, rules)
+    print(f"[ok] compiled rule engine matches the per-interval scan ({checked} event × rule set × path checks)")
+
+    legacy = min(run_grid(legacy_detect_tier, timelines, counts_by_event) for _ in range(args.repeat))
+    rle = min(run_grid(builder.detect_tier, timelines, counts_by_event) for _ in range(args.repeat))
+    evaluations = len(timelines) * len(grid)
+    print(f"    legacy: {legacy * 1000:8.1f} ms  ({legacy / evaluations * 1e6:7.1f} µs/evaluation)")
+    print(f"       rle: {rle * 1000:8.1f} ms  ({rle / evaluations * 1e6:7.1f} µs/evaluation)")
+    print(f"[done] RLE engine is {legacy / rle:.2f}x faster")
+
+    engine = builder.compile_tier_rules(rules)
+    timed = []
+    for evaluate in (
+        lambda: [naive_rules(timeline, rules) for timeline in timelines.values()],
+        lambda: [engine.evaluate(timeline, metadata.get(event_id, {})) for event_id, timeline in timelines.items()],
+    ):
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            evaluate()
+            samples.append(time.perf_counter() - start)
+        timed.append(min(samples))
+    print(f"     naive: {timed[0] * 1000:8.1f} ms  ({len(rules)} rule sets, one scan each)")
+    print(f"  compiled: {timed[1] * 1000:8.1f} ms  (shared station masks, one pipeline per rule set)")
+    print(f"[done] compiled rule engine is {timed[0] / timed[1]:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@
 HK Signal 8 Transparency Portal - CSV → JSON builder.
 
 Usage:
-    python scripts/build_event_data.py [--typhoon-dir typhoon_data] [--output-dir data]
+    python scripts/build_event_data.py [--typhoon-dir typhoon_data] [--output-dir data] [--incremental] [--jobs N]
+    python scripts/build_event_data.py --sweep [--sweep-thresholds 55,63] [--sweep-stations 3,4] [--sweep-persistence 2,3]
 
 The script:
 1. Parses the official metadata tables (`time_of_signal_8.md`, casualty table, PRD event table).
@@ -11,26 +12,105 @@ The script:
    fully ordered 10-minute timeline.
 3. Detects Tier 1 (persistence) or Tier 2 (wind-lull-wind) behaviour, computes early-warning
    minutes, persistence windows, and highlight bullets.
-4. Emits `data/index.json` plus `data/events/<eventId>.json` so the static site can stay backend-free.
+4. Emits `data/index.json` plus `data/events/<eventId>.json` (and the compact `<eventId>.bin` column blob)
+   so the static site can stay backend-free.
 
 Drop new CSVs, keep the metadata tables up to date, and rerun this script to refresh all JSON output.
+Every run also records a build manifest (CSV hashes + metadata hash per event); with `--incremental`
+only events whose inputs changed are re-parsed, and `index.json` is rebuilt from the cached summaries.
+`--jobs N` fans the per-event work out across a process pool; output is byte-identical to a serial run.
+`--write-snapshot` stores the parsed reference timelines in one memory-mappable file that `--snapshot` builds
+read from, parsing only CSVs added since.
+`--profile` writes per-stage and per-event timings, memory peaks and row counts to `build-profile.json`.
+`--sweep` parses each event once and writes a tier/early-warning/persistence matrix over a grid of
+(threshold, station count, persistence length) settings to `data/sensitivity/<eventId>.json`.
+
+The module doubles as a library (`load_event`, `evaluate`, `build_all`). Importing it is cheap:
+NumPy, orjson, Brotli and the heavier stdlib modules load on first use, and the parsed metadata
+tables are cached on disk.
 """
 
 from __future__ import annotations
 
-import argparse
 import csv
+import hashlib
+import importlib
+import importlib.util
+import io
 import json
+import math
+import mmap
+import os
 import re
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import closing, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+
+class LazyModule:
+    """Stand-in for a module global that is imported on first attribute access.
+
+    The first access imports the module and rebinds the global to it, so later lookups are direct.
+    """
+
+    def __init__(self, module_name: str, binding: str) -> None:
+        self._module_name = module_name
+        self._binding = binding
+
+    def __getattr__(self, attr: str) -> object:
+        module = importlib.import_module(self._module_name)
+        if globals().get(self._binding) is self:
+            globals()[self._binding] = module
+        return getattr(module, attr)
+
+
+def optional_module(module_name: str, binding: str) -> Optional[LazyModule]:
+    """A `LazyModule` when `module_name` is installed, else None (checked without importing it)."""
+    return LazyModule(module_name, binding) if importlib.util.find_spec(module_name) is not None else None
+
+
+# only needed by the CLI, the store, --jobs, --profile, analytics or --hashed-assets
+argparse = LazyModule("argparse", "argparse")
+futures = LazyModule("concurrent.futures", "futures")
+gzip = LazyModule("gzip", "gzip")
+platform = LazyModule("platform", "platform")
+sqlite3 = LazyModule("sqlite3", "sqlite3")
+statistics = LazyModule("statistics", "statistics")
+tracemalloc = LazyModule("tracemalloc", "tracemalloc")
+
+try:  # Unix only; peak RSS is simply omitted from --profile reports elsewhere
+    import resource
+except ImportError:  # pragma: no cover - depends on the platform
+    resource = None
+
+# optional: vectorised analytics when NumPy is installed, stdlib otherwise
+np = optional_module("numpy", "np")
+# optional: faster JSON encoding; the stdlib encoder produces the same documents
+orjson = optional_module("orjson", "orjson")
+# optional: .br variants for --hashed-assets when the Brotli bindings are installed
+brotli = optional_module("brotli", "brotli")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
 HKT = timezone(timedelta(hours=8))
+HKT_OFFSET_MINUTES = 8 * 60
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 T8_THRESHOLD_KMH = 63
 MIN_REFERENCE_STATIONS = 4
 MIN_PERSISTENCE_INTERVALS = 3  # 3 × 10-minute windows ≈ 30 minutes
+INTERVAL_MINUTES = 10
+GAP_POLICIES = ("break", "bridge", "interpolate")
+DEFAULT_GAP_POLICY = "break"
+MAX_INTERPOLATED_INTERVALS = 3  # `interpolate` fills gaps of up to 30 minutes; longer ones break
 
 REFERENCE_STATIONS: List[Dict[str, str]] = [
     {"stationId": "cheung-chau", "csvName": "Cheung Chau", "nameEn": "Cheung Chau", "nameZh": "長洲"},
@@ -43,6 +123,17 @@ REFERENCE_STATIONS: List[Dict[str, str]] = [
     {"stationId": "tsing-yi", "csvName": "Tsing Yi", "nameEn": "Tsing Yi", "nameZh": "青衣"},
 ]
 STATION_BY_CSV = {entry["csvName"]: entry for entry in REFERENCE_STATIONS}
+STATION_COLUMN_BY_CSV = {entry["csvName"]: index for index, entry in enumerate(REFERENCE_STATIONS)}
+
+CSV_TIMESTAMP_COLUMN = "Date time"
+CSV_STATION_COLUMN = "Automatic Weather Station"
+CSV_MEAN_COLUMN = "10-Minute Mean Speed(km/hour)"
+CSV_GUST_COLUMN = "10-Minute Maximum Gust(km/hour)"
+CSV_DIRECTION_COLUMN = "10-Minute Mean Wind Direction(Compass points)"
+MISSING = float("nan")
+WIND_DIRECTIONS = ("", "North", "Northeast", "East", "Southeast", "South", "Southwest", "West", "Northwest", "Variable", "Calm")
+DIRECTION_CODES = {name: code for code, name in enumerate(WIND_DIRECTIONS) if name}  # 0 = missing/unknown
+RUN_PATTERN = re.compile(rb"\x01+")
 
 SIGNAL_HEADER = [
     "Storm",
@@ -75,6 +166,54 @@ CASUALTY_HEADER = [
     "Destroyed Small Boats",
     "Damaged Small Boats",
 ]
+METADATA_CACHE_FILENAME = ".metadata-cache.json"  # under typhoon_data/, keyed by the tables' hashes
+SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+STORM_NAME_PATTERN = re.compile(r"(.+?)\s*\((.+)\)")  # "Chaba (暹芭)"
+DIRECTORY_NAME_PATTERN = re.compile(r"[-A-Za-z]+")
+CSV_NAME_STAMP_PATTERN = re.compile(r"(\d{8})-(\d{4})-")  # "20220701-1858-latest_10min_wind.csv"
+SIGNAL10_FULL_PATTERN = re.compile(
+    r"(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+\s+\d{4})\s+to\s+(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+\s+\d{4})"
+)
+SIGNAL10_RANGE_PATTERN = re.compile(
+    r"(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+(?:\s+\d{4})?)\s+to\s+(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+(?:\s+\d{4})?)"
+)
+SIGNAL10_CLOCK_PATTERN = re.compile(r"(\d{2}:\d{2})-(\d{2}:\d{2})")
+
+EVENT_SUFFIXES = {"json": ".json", "binary": ".bin"}
+EVENT_FORMATS = ("json", "binary", "both")
+BINARY_MAGIC = b"T8EV"
+BINARY_VERSION = 2  # v2: signed epoch-minute times, so pre-1970 storms encode
+BINARY_PREFIX = struct.Struct("<4sHHI")  # magic, version, reserved, header length
+
+PYRAMID_DIRNAME = "pyramids"
+NETWORK_DIRNAME = "network"
+PYRAMID_LEVELS = (30, 60, 180)  # minutes
+READINGS_CHUNK = 64  # intervals encoded per write when streaming an event's stationReadings
+ASSET_MANIFEST_FILENAME = "asset-manifest.json"
+ASSET_HASH_LENGTH = 16
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+INDEX_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+DEFAULT_TIER_RULES = "scripts/tier_rules.json"
+RULE_FIELDS = {
+    "id",
+    "label",
+    "signal",
+    "metric",
+    "thresholdKmh",
+    "minStations",
+    "minPersistenceIntervals",
+    "stationWeights",
+    "rollingWindow",
+}
+RULE_METRICS = {"mean": "means", "gust": "gusts"}
+RULE_SIGNALS = (8, 10)
+ANALYTICS_FILENAME = "analytics.json"
+STATION_INDEX_FILENAME = "stations.json"
+EARLY_WARNING_BIN_MINUTES = 60
+PROFILE_FILENAME = "build-profile.json"
+MANIFEST_FILENAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
 
 TIER_LABELS = {
     1: "Tier 1: Sustained T8 Wind Speed Verified",
@@ -84,28 +223,244 @@ TIER_LABELS = {
 
 
 @dataclass
-class StationReading:
-    station_id: str
-    name_en: str
-    name_zh: str
-    mean_speed: Optional[float]
-    gust_speed: Optional[float]
-    meets_threshold: bool
+class StationColumns:
+    """Columnar reference-station store for one event.
+
+    `timestamps` holds the sorted 12-digit HKT stamps; `means[i]` / `gusts[i]` are the columns for
+    `REFERENCE_STATIONS[i]`, aligned with `timestamps`. Missing or N/A readings are NaN.
+    """
+
+    timestamps: List[str]
+    means: List[array]
+    gusts: List[array]
+    source_files: int = 0
+    source_rows: int = 0
+    duplicate_readings: int = 0  # station readings repeated by a later file for the same timestamp
+    conflicting_readings: int = 0  # ...of which the later file changed the mean or gust
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
 
 
 @dataclass
-class IntervalReading:
-    dt: datetime
-    stations: List[StationReading]
-    stations_meeting_threshold: int
+class EventTimeline:
+    """Event-level columnar model of the reference network.
+
+    Times are epoch minutes (`minutes`, UTC-based, so HKT offsets never enter arithmetic) with the
+    public ISO-8601 HKT string of each interval formatted once into `stamps`. `means`, `gusts` and
+    `meets` are N×S matrices (N intervals, S = len(stations)) kept in flat station-major buffers:
+    `means[s * N + i]` is station `s` at interval `i`, so every station's series is one contiguous
+    slice. Missing readings are NaN. `counts[i]` is the number of stations meeting `threshold` at
+    interval `i`. Station metadata is stored once in `stations`. Rows sit on the fixed 10-minute grid
+    produced by `align_series`, whose data-quality report is kept in `quality`.
+    """
+
+    minutes: array
+    stamps: List[str]
+    means: array
+    gusts: array
+    meets: bytearray
+    counts: array
+    stations: Sequence[Dict[str, str]] = field(default_factory=lambda: REFERENCE_STATIONS)
+    threshold: float = T8_THRESHOLD_KMH
+    quality: Dict[str, object] = field(default_factory=dict)
+
+    @classmethod
+    def from_columns(
+        cls, columns: StationColumns, threshold: float = T8_THRESHOLD_KMH, gap_policy: str = DEFAULT_GAP_POLICY
+    ) -> "EventTimeline":
+        minutes = array("q", map(stamp_minutes, columns.timestamps))
+        stamps = list(map(stamp_iso, columns.timestamps))
+        duplicates = (columns.duplicate_readings, columns.conflicting_readings)
+        return cls.from_station_series(minutes, stamps, columns.means, columns.gusts, threshold, gap_policy, duplicates)
+
+    @classmethod
+    def from_station_series(
+        cls,
+        minutes: array,
+        stamps: List[str],
+        mean_columns: Sequence[array],
+        gust_columns: Sequence[array],
+        threshold: float = T8_THRESHOLD_KMH,
+        gap_policy: str = DEFAULT_GAP_POLICY,
+        duplicates: Tuple[int, int] = (0, 0),
+    ) -> "EventTimeline":
+        """Assemble a timeline from sorted epoch minutes and one mean/gust column per reference station.
+
+        The series are aligned to the 10-minute grid first (see `align_series`); `duplicates` is the
+        `(duplicate, conflicting)` reading count of the source, reported in `quality`.
+        """
+        minutes, stamps, mean_columns, gust_columns, quality = align_series(
+            minutes, stamps, mean_columns, gust_columns, gap_policy, duplicates
+        )
+        means = array("d")
+        gusts = array("d")
+        for column in mean_columns:
+            means.extend(column)
+        for column in gust_columns:
+            gusts.extend(column)
+        meets, counts = threshold_mask(means, len(minutes), threshold)
+        return cls(
+            minutes=minutes,
+            stamps=stamps,
+            means=means,
+            gusts=gusts,
+            meets=meets,
+            counts=counts,
+            threshold=threshold,
+            quality=quality,
+        )
 
-    @property
-    def timestamp(self) -> str:
-        return self.dt.isoformat(timespec="minutes")
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def timestamp(self, index: int) -> str:
+        return self.stamps[index]
+
+    def mean(self, index: int, station: int) -> Optional[float]:
+        return optional_speed(self.means[station * len(self.minutes) + index])
+
+    def gust(self, index: int, station: int) -> Optional[float]:
+        return optional_speed(self.gusts[station * len(self.minutes) + index])
+
+    def meets_threshold(self, index: int, station: int) -> bool:
+        return bool(self.meets[station * len(self.minutes) + index])
+
+
+@lru_cache(maxsize=4096)
+def day_minutes(day: str) -> int:
+    """Epoch minutes of HKT midnight for a `YYYYMMDD` day (cached: every interval of a day shares it)."""
+    ordinal = date(int(day[0:4]), int(day[4:6]), int(day[6:8])).toordinal()
+    return (ordinal - EPOCH_ORDINAL) * 1440 - HKT_OFFSET_MINUTES
+
+
+def stamp_minutes(stamp: str) -> int:
+    """Epoch minutes for a 12-digit HKT `YYYYMMDDHHMM` stamp, parsed by slicing rather than strptime."""
+    if len(stamp) != 12 or not stamp.isdigit():
+        raise ValueError(f"expected a YYYYMMDDHHMM timestamp, got {stamp!r}")
+    hour, minute = int(stamp[8:10]), int(stamp[10:12])
+    if hour > 23 or minute > 59:
+        raise ValueError(f"expected a YYYYMMDDHHMM timestamp, got {stamp!r}")
+    return day_minutes(stamp[:8]) + hour * 60 + minute
+
+
+def stamp_iso(stamp: str) -> str:
+    """ISO-8601 HKT string for a validated `YYYYMMDDHHMM` stamp (same text as `isoformat(timespec="minutes")`)."""
+    return f"{stamp[0:4]}-{stamp[4:6]}-{stamp[6:8]}T{stamp[8:10]}:{stamp[10:12]}+08:00"
+
+
+def datetime_minutes(value: datetime) -> int:
+    """Epoch minutes for an aware datetime."""
+    return int(value.timestamp()) // 60
+
+
+@lru_cache(maxsize=4096)
+def day_iso(days: int) -> str:
+    return date.fromordinal(days + EPOCH_ORDINAL).isoformat()
+
+
+def minutes_iso(minutes: int) -> str:
+    """ISO-8601 HKT string for epoch minutes (the inverse of `stamp_minutes`, formatted)."""
+    days, minute_of_day = divmod(minutes + HKT_OFFSET_MINUTES, 1440)
+    return f"{day_iso(days)}T{minute_of_day // 60:02d}:{minute_of_day % 60:02d}+08:00"
+
+
+def as_matrix(buffer: array, intervals: int) -> "np.ndarray":
+    """Zero-copy N×S NumPy view of a station-major buffer (NumPy must be available)."""
+    return np.frombuffer(buffer, dtype=np.float64).reshape(-1, intervals).T
+
+
+def threshold_mask(means: array, intervals: int, threshold: float) -> Tuple[bytearray, array]:
+    """Station-major ≥threshold mask plus the per-interval count (`array('B')`) of stations meeting it.
+
+    NaN never meets the threshold.
+    """
+    if intervals == 0:
+        return bytearray(), array("B")
+    if np is not None:
+        mask = np.frombuffer(means, dtype=np.float64) >= threshold
+        counts = mask.reshape(-1, intervals).sum(axis=0, dtype=np.uint8)
+        return bytearray(mask.tobytes()), array("B", counts.tobytes())
+    meets = bytearray(value >= threshold for value in means)
+    rows = [meets[start:start + intervals] for start in range(0, len(meets), intervals)]
+    return meets, array("B", map(sum, zip(*rows)))
+
+
+def align_series(
+    minutes: array,
+    stamps: List[str],
+    mean_columns: Sequence[array],
+    gust_columns: Sequence[array],
+    policy: str = DEFAULT_GAP_POLICY,
+    duplicates: Tuple[int, int] = (0, 0),
+) -> Tuple[array, List[str], Sequence[array], Sequence[array], Dict[str, object]]:
+    """Put sorted observations on the fixed 10-minute grid and apply the gap `policy`.
+
+    Slot `i` is epoch minute `origin + 10·i`, with the first observation floored to the grid as
+    origin, so an interval's row is plain arithmetic. Off-grid stamps are floored onto the grid, and
+    a later stamp in the same slot wins. Empty slots are gaps:
+    - `break` keeps them as empty rows, so no run spans them;
+    - `bridge` drops them, so the intervals either side count as consecutive;
+    - `interpolate` fills gaps of up to `MAX_INTERPOLATED_INTERVALS` linearly per station (longer
+      ones break).
+    Series already on a gap-free grid are returned as they are. Also returns the data-quality report.
+    """
+    observed = len(minutes)
+    origin = minutes[0] - minutes[0] % INTERVAL_MINUTES if observed else 0
+    slots = [(minute - origin) // INTERVAL_MINUTES for minute in minutes]
+    gaps = [(previous + 1, slot) for previous, slot in zip(slots, slots[1:]) if slot - previous > 1]
+    off_grid = sum(1 for minute in minutes if minute % INTERVAL_MINUTES)
+    colliding = sum(1 for previous, slot in zip(slots, slots[1:]) if slot == previous)
+    long_gap = MAX_INTERPOLATED_INTERVALS if policy == "interpolate" else 0
+    completeness = {
+        ref["stationId"]: round(sum(1 for value in column if value == value) / observed, 4) if observed else None
+        for ref, column in zip(REFERENCE_STATIONS, mean_columns)
+    }
+    if gaps or off_grid or colliding:
+        row_of_slot = {slot: row for row, slot in enumerate(slots)}
+        grid = sorted(row_of_slot) if policy == "bridge" else range(slots[-1] + 1)
+        rows = [row_of_slot.get(slot) for slot in grid]
+        minutes = array("q", (origin + INTERVAL_MINUTES * slot for slot in grid))
+        stamps = [minutes_iso(minute) for minute in minutes]
+        mean_columns = [array("d", (column[row] if row is not None else MISSING for row in rows)) for column in mean_columns]
+        gust_columns = [array("d", (column[row] if row is not None else MISSING for row in rows)) for column in gust_columns]
+        for start, stop in gaps if policy == "interpolate" else ():
+            if stop - start > long_gap:
+                continue
+            for column in (*mean_columns, *gust_columns):
+                before, after = column[start - 1], column[stop]
+                if before == before and after == after:
+                    for step in range(1, stop - start + 1):
+                        column[start + step - 1] = round(before + (after - before) * step / (stop - start + 1), 1)
+    quality: Dict[str, object] = {
+        "gapPolicy": policy,
+        "intervalMinutes": INTERVAL_MINUTES,
+        "expectedIntervals": slots[-1] + 1 if observed else 0,
+        "observedIntervals": len(set(slots)),
+        "missingIntervals": sum(stop - start for start, stop in gaps),
+        "gapCount": len(gaps),
+        "longestGapMinutes": max((stop - start for start, stop in gaps), default=0) * INTERVAL_MINUTES,
+        "interpolatedIntervals": sum(stop - start for start, stop in gaps if stop - start <= long_gap),
+        "offGridStamps": off_grid,
+        "collidingStamps": colliding,
+        "duplicateReadings": duplicates[0],
+        "conflictingReadings": duplicates[1],
+        "stationCompleteness": completeness,
+        "gaps": [
+            {
+                "start": minutes_iso(origin + INTERVAL_MINUTES * start),
+                "end": minutes_iso(origin + INTERVAL_MINUTES * (stop - 1)),
+                "intervals": stop - start,
+                "handling": "break" if policy == "interpolate" and stop - start > long_gap else policy,
+            }
+            for start, stop in gaps
+        ],
+    }
+    return minutes, stamps, mean_columns, gust_columns, quality
 
 
 def slugify(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return SLUG_PATTERN.sub("-", text.lower()).strip("-")
 
 
 def parse_markdown_table(path: Path, expected_header: List[str]) -> List[Dict[str, str]]:
@@ -129,6 +484,7 @@ def parse_markdown_table(path: Path, expected_header: List[str]) -> List[Dict[st
     return rows
 
 
+@lru_cache(maxsize=1024)
 def parse_dt(value: str, fmt: str) -> datetime:
     return datetime.strptime(value, fmt).replace(tzinfo=HKT)
 
@@ -141,10 +497,7 @@ def parse_optional_signal10(row: Dict[str, str], official_start: datetime) -> Tu
     if row.get("Signal 10", "").strip().lower() != "yes":
         return None, None
     notes = row.get("Notes", "")
-    full_pattern = re.compile(
-        r"(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+\s+\d{4})\s+to\s+(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+\s+\d{4})"
-    )
-    match = full_pattern.search(notes)
+    match = SIGNAL10_FULL_PATTERN.search(notes)
     if match:
         start = parse_dt(f"{match.group(1)}, {match.group(2)}", "%H:%M, %d %b %Y")
         end = parse_dt(f"{match.group(3)}, {match.group(4)}", "%H:%M, %d %b %Y")
@@ -159,10 +512,7 @@ def parse_optional_signal10(row: Dict[str, str], official_start: datetime) -> Tu
             dt_value += timedelta(days=1)
         return dt_value
 
-    range_pattern = re.compile(
-        r"(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+(?:\s+\d{4})?)\s+to\s+(\d{2}:\d{2}),\s*(\d{1,2}\s+\w+(?:\s+\d{4})?)"
-    )
-    match = range_pattern.search(notes)
+    match = SIGNAL10_RANGE_PATTERN.search(notes)
     if match:
         start_dt = _parse_partial(match.group(1), match.group(2), official_start)
         end_dt = _parse_partial(match.group(3), match.group(4), start_dt)
@@ -170,8 +520,7 @@ def parse_optional_signal10(row: Dict[str, str], official_start: datetime) -> Tu
             end_dt += timedelta(days=1)
         return start_dt.isoformat(timespec="minutes"), end_dt.isoformat(timespec="minutes")
 
-    simple_pattern = re.compile(r"(\d{2}:\d{2})-(\d{2}:\d{2})")
-    match = simple_pattern.search(notes)
+    match = SIGNAL10_CLOCK_PATTERN.search(notes)
     if not match:
         return None, None
     start_time = datetime.strptime(match.group(1), "%H:%M").time()
@@ -186,16 +535,58 @@ def parse_optional_signal10(row: Dict[str, str], official_start: datetime) -> Tu
 
 
 def split_names(value: str) -> Tuple[str, str]:
-    match = re.match(r"(.+?)\s*\((.+)\)", value)
+    match = STORM_NAME_PATTERN.match(value)
     if match:
         return match.group(1).strip(), match.group(2).strip()
     return value.strip(), ""
 
 
-def build_metadata(project_root: Path) -> Dict[str, Dict[str, object]]:
-    signal_rows = parse_markdown_table(project_root / "typhoon_data" / "time_of_signal_8.md", SIGNAL_HEADER)
-    casualty_rows = parse_markdown_table(project_root / "typhoon_data" / "casualty_and_lost_of_signal_8.md", CASUALTY_HEADER)
-    prd_rows = parse_markdown_table(project_root / "# HKO Signal 8 Transparency Portal.md", PRD_EVENT_HEADER)
+def metadata_tables(project_root: Path, typhoon_root: Path) -> Tuple[Path, Path, Path]:
+    """The signal, casualty and PRD tables `build_metadata` reads."""
+    return (
+        typhoon_root / "time_of_signal_8.md",
+        typhoon_root / "casualty_and_lost_of_signal_8.md",
+        project_root / "# HKO Signal 8 Transparency Portal.md",
+    )
+
+
+def build_metadata(
+    project_root: Path, typhoon_root: Optional[Path] = None, cache: bool = True
+) -> Dict[str, Dict[str, object]]:
+    """Merge the signal, casualty and PRD tables; the first two are read from `typhoon_root`.
+
+    The result is cached in `typhoon_root/.metadata-cache.json` under the SHA-256 of the three
+    tables and of this script, so repeated builds and library calls skip the parse until a table
+    (or the parser) changes. An unwritable cache is simply not used.
+    """
+    typhoon_root = typhoon_root or project_root / "typhoon_data"
+    tables = metadata_tables(project_root, typhoon_root)
+    if not cache:
+        return parse_metadata(*tables)
+    digest = hashlib.sha256(builder_hash().encode("ascii"))
+    for path in tables:
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    key = digest.hexdigest()
+    cache_path = typhoon_root / METADATA_CACHE_FILENAME
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached.get("key") == key:
+            return cached["metadata"]
+    except (OSError, ValueError):
+        pass
+    metadata = parse_metadata(*tables)
+    try:
+        with atomic_write(cache_path) as handle:
+            handle.write(encode_json({"key": key, "metadata": metadata}, compact=True))
+    except OSError:
+        pass
+    return metadata
+
+
+def parse_metadata(signal_path: Path, casualty_path: Path, prd_path: Path) -> Dict[str, Dict[str, object]]:
+    signal_rows = parse_markdown_table(signal_path, SIGNAL_HEADER)
+    casualty_rows = parse_markdown_table(casualty_path, CASUALTY_HEADER)
+    prd_rows = parse_markdown_table(prd_path, PRD_EVENT_HEADER)
 
     metadata: Dict[str, Dict[str, object]] = {}
     for row in signal_rows:
@@ -256,158 +647,864 @@ def build_metadata(project_root: Path) -> Dict[str, Dict[str, object]]:
     return metadata
 
 
+def event_id_for_directory(name: str) -> Optional[str]:
+    match = DIRECTORY_NAME_PATTERN.search(name)
+    if not match:
+        return None
+    return slugify(match.group(0))
+
+
+def csv_name_minutes(name: str) -> Optional[int]:
+    """Epoch minutes of a CSV's `YYYYMMDD-HHMM-` name prefix (HKT), or None when it has none."""
+    match = CSV_NAME_STAMP_PATTERN.match(name)
+    if match is None:
+        return None
+    try:
+        return stamp_minutes(match.group(1) + match.group(2))
+    except ValueError:
+        return None
+
+
+def signal_window(event_meta: Dict[str, object], margin_hours: float) -> Tuple[int, int]:
+    """Epoch minutes `[start, end]` of the official Signal 8 period widened by `margin_hours` each side."""
+    margin = round(margin_hours * 60)
+    start = datetime_minutes(datetime.fromisoformat(event_meta["officialSignal8Start"]))  # type: ignore[arg-type]
+    end = datetime_minutes(datetime.fromisoformat(event_meta["officialSignal8End"]))  # type: ignore[arg-type]
+    return start - margin, end + margin
+
+
+def select_csv_files(csv_names: Sequence[str], window: Tuple[int, int]) -> Tuple[List[str], List[str]]:
+    """Split CSV names into `(kept, skipped)` by the time in their names, keeping the given order.
+
+    Names are indexed by their stamp and the window is cut out with two bisections; files whose
+    name carries no stamp are always kept, since only their rows could say when they are from.
+    """
+    minutes = [csv_name_minutes(name) for name in csv_names]
+    stamped = sorted((minute, name) for name, minute in zip(csv_names, minutes) if minute is not None)
+    stamps = [minute for minute, _ in stamped]
+    outside = {name for _, name in stamped[:bisect_left(stamps, window[0])]}
+    outside.update(name for _, name in stamped[bisect_right(stamps, window[1]):])
+    return [name for name in csv_names if name not in outside], [name for name in csv_names if name in outside]
+
+
+def describe_skipped(event_id: str, skipped: Sequence[str], total: int, margin_hours: float) -> str:
+    return (
+        f"[info] {event_id}: skipped {len(skipped)} of {total} CSVs stamped more than {margin_hours:g} h outside "
+        f"the Signal 8 period ({skipped[0]} ... {skipped[-1]})"
+    )
+
+
 def discover_event_directories(typhoon_root: Path) -> Dict[str, Path]:
     event_dirs: Dict[str, Path] = {}
     for entry in typhoon_root.iterdir():
         if not entry.is_dir():
             continue
-        match = re.search(r"[-A-Za-z]+", entry.name)
-        if not match:
+        event_id = event_id_for_directory(entry.name)
+        if not event_id:
             continue
-        event_id = slugify(match.group(0))
         event_dirs[event_id] = entry
     return event_dirs
 
 
-def to_float(value: str) -> Optional[float]:
-    value = value.strip()
-    if not value or value.upper() == "N/A":
-        return None
+def parse_speed(value: str) -> float:
     try:
         return float(value)
-    except ValueError:
-        return None
+    except ValueError:  # blank, "N/A" or otherwise unparseable
+        return MISSING
+
+
+def same_speed(first: float, second: float) -> bool:
+    return first == second or (first != first and second != second)  # NaN (missing) equals NaN here
+
+
+def optional_speed(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+@lru_cache(maxsize=None)
+def resolve_csv_columns(header: Tuple[str, ...]) -> Tuple[int, int, int, int]:
+    """Map a CSV header to (timestamp, station, mean, gust) column positions."""
+    names = [cell.strip() for cell in header]
+    wanted = (CSV_TIMESTAMP_COLUMN, CSV_STATION_COLUMN, CSV_MEAN_COLUMN, CSV_GUST_COLUMN)
+    missing = [column for column in wanted if column not in names]
+    if missing:
+        raise ValueError(f"CSV header is missing column(s): {', '.join(missing)}")
+    return tuple(names.index(column) for column in wanted)  # type: ignore[return-value]
+
+
+def read_csv_rows(csv_path: Path) -> Iterable[Tuple[str, int, float, float]]:
+    """Yield `(timestamp, station column, mean, gust)` for every reference-station row of one CSV.
+
+    Rows are read positionally; non-reference stations are dropped before any float parsing.
+    """
+    with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            ts_col, station_col, mean_col, gust_col = resolve_csv_columns(tuple(header))
+        except ValueError as exc:
+            raise ValueError(f"{csv_path}: {exc}") from None
+        width = max(ts_col, station_col, mean_col, gust_col) + 1
+        station_by_csv = STATION_COLUMN_BY_CSV
+        for row in reader:
+            if len(row) < width:
+                continue
+            station = station_by_csv.get(row[station_col].strip())
+            if station is None:
+                continue
+            yield row[ts_col].strip(), station, parse_speed(row[mean_col]), parse_speed(row[gust_col])
+
+
+@lru_cache(maxsize=None)
+def resolve_direction_column(header: Tuple[str, ...]) -> Optional[int]:
+    names = [cell.strip() for cell in header]
+    return names.index(CSV_DIRECTION_COLUMN) if CSV_DIRECTION_COLUMN in names else None
+
+
+def read_csv_observations(csv_path: Path) -> Iterable[Tuple[str, str, float, float, Optional[str]]]:
+    """Yield `(timestamp, station name, mean, gust, direction)` for every station row of one CSV."""
+    with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+        yield from csv_observations(csv.reader(handle), csv_path)
+
+
+def parse_csv_observations(data: bytes, csv_path: Path) -> Iterable[Tuple[str, str, float, float, Optional[str]]]:
+    """`read_csv_observations` for a file whose bytes were already read (see `prefetch_files`)."""
+    return csv_observations(csv.reader(io.StringIO(data.decode("utf-8-sig"), newline="")), csv_path)
+
+
+def csv_observations(reader: Iterator[List[str]], csv_path: Path) -> Iterator[Tuple[str, str, float, float, Optional[str]]]:
+    header = next(reader, None)
+    if header is None:
+        return
+    try:
+        ts_col, station_col, mean_col, gust_col = resolve_csv_columns(tuple(header))
+    except ValueError as exc:
+        raise ValueError(f"{csv_path}: {exc}") from None
+    direction_col = resolve_direction_column(tuple(header))
+    width = max(ts_col, station_col, mean_col, gust_col, direction_col or 0) + 1
+    for row in reader:
+        if len(row) < width:
+            continue
+        direction = row[direction_col].strip() if direction_col is not None else ""
+        yield (
+            row[ts_col].strip(),
+            row[station_col].strip(),
+            parse_speed(row[mean_col]),
+            parse_speed(row[gust_col]),
+            direction if direction and direction.upper() != "N/A" else None,
+        )
+
+
+def prefetch_files(
+    pool: "futures.Executor", paths: Sequence[Path], depth: int, read: Callable[[Path], bytes] = Path.read_bytes
+) -> Iterator[bytes]:
+    """Yield the contents of `paths`, in order, while up to `depth` later files are read on `pool`.
+
+    A bounded producer/consumer pipeline: the caller parses one file while the pool's threads fetch
+    the next ones, so per-file I/O latency (network filesystems) overlaps parsing, and at most
+    `depth` files are held in memory ahead of the consumer.
+    """
+    remaining = iter(paths)
+    pending = deque(pool.submit(read, path) for path in islice(remaining, depth))
+    try:
+        while pending:
+            data = pending.popleft().result()
+            following = next(remaining, None)
+            if following is not None:
+                pending.append(pool.submit(read, following))
+            yield data
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def read_station_columns(event_dir: Path, csv_names: Optional[Sequence[str]] = None) -> StationColumns:
+    """Stream every CSV in `event_dir` (or just `csv_names`, in name order) into a `StationColumns` store.
+
+    When several files carry the same timestamp/station, the later file (by name) wins.
+    """
+    columns = StationColumns(
+        timestamps=[], means=[array("d") for _ in REFERENCE_STATIONS], gusts=[array("d") for _ in REFERENCE_STATIONS]
+    )
+    return merge_csv_files(columns, event_csv_paths(event_dir, csv_names))
+
 
+def event_csv_paths(event_dir: Path, csv_names: Optional[Sequence[str]] = None) -> List[Path]:
+    if csv_names is None:
+        return sorted(event_dir.glob("*.csv"))
+    return [event_dir / name for name in sorted(csv_names)]
 
-def load_station_timelines(event_dir: Path) -> List[IntervalReading]:
-    timeline_data: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
-    for csv_path in sorted(event_dir.glob("*.csv")):
-        with csv_path.open("r", encoding="utf-8-sig") as handle:
-            reader = csv.DictReader(handle)
-            timestamp_value: Optional[str] = None
-            for row in reader:
-                timestamp_value = row["Date time"].strip()
-                station_name = row["Automatic Weather Station"].strip()
-                if station_name not in STATION_BY_CSV:
-                    continue
-                mean_speed = to_float(row["10-Minute Mean Speed(km/hour)"])
-                gust_speed = to_float(row["10-Minute Maximum Gust(km/hour)"])
-                cell = timeline_data.setdefault(timestamp_value, {})
-                cell[station_name] = {"mean": mean_speed, "gust": gust_speed}
-            # Some files may be empty; nothing to do if timestamp_value is None
-    readings: List[IntervalReading] = []
-    for timestamp_key in sorted(timeline_data.keys()):
-        dt = datetime.strptime(timestamp_key, "%Y%m%d%H%M").replace(tzinfo=HKT)
-        stations: List[StationReading] = []
-        cell = timeline_data[timestamp_key]
-        for ref in REFERENCE_STATIONS:
-            row = cell.get(ref["csvName"], {})
-            mean_speed = row.get("mean")
-            gust_speed = row.get("gust")
-            meets = mean_speed is not None and mean_speed >= T8_THRESHOLD_KMH
-            stations.append(
-                StationReading(
-                    station_id=ref["stationId"],
-                    name_en=ref["nameEn"],
-                    name_zh=ref["nameZh"],
-                    mean_speed=mean_speed,
-                    gust_speed=gust_speed,
-                    meets_threshold=meets,
+
+def merge_csv_files(columns: StationColumns, csv_paths: Iterable[Path]) -> StationColumns:
+    """Fold the reference rows of `csv_paths`, in order, into `columns` and return them sorted.
+
+    `columns` is updated in place, so each file overrides what came before it.
+    """
+    timestamps, means, gusts = columns.timestamps, columns.means, columns.gusts
+    row_by_timestamp = {timestamp: index for index, timestamp in enumerate(timestamps)}
+    width = len(means)
+    # written[row * width + station]: readings already present count as written when they hold a value
+    written = bytearray(
+        means[station][index] == means[station][index] or gusts[station][index] == gusts[station][index]
+        for index in range(len(timestamps))
+        for station in range(width)
+    )
+    duplicates, conflicts = columns.duplicate_readings, columns.conflicting_readings
+    files = rows = 0
+    for csv_path in csv_paths:
+        files += 1
+        for timestamp, station, mean_speed, gust_speed in read_csv_rows(csv_path):
+            rows += 1
+            index = row_by_timestamp.get(timestamp)
+            if index is None:
+                index = row_by_timestamp[timestamp] = len(timestamps)
+                timestamps.append(timestamp)
+                for column in means:
+                    column.append(MISSING)
+                for column in gusts:
+                    column.append(MISSING)
+                written.extend(bytes(width))
+            cell = index * width + station
+            if written[cell]:
+                duplicates += 1
+                if not same_speed(means[station][index], mean_speed) or not same_speed(gusts[station][index], gust_speed):
+                    conflicts += 1
+            written[cell] = 1
+            means[station][index] = mean_speed
+            gusts[station][index] = gust_speed
+    columns = sort_station_columns(columns)
+    columns.source_files, columns.source_rows = files, rows
+    columns.duplicate_readings, columns.conflicting_readings = duplicates, conflicts
+    return columns
+
+
+def sort_station_columns(columns: StationColumns) -> StationColumns:
+    """Return `columns` with rows in timestamp order (the same object when already sorted)."""
+    timestamps = columns.timestamps
+    order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+    if order == list(range(len(timestamps))):
+        return columns
+    return StationColumns(
+        timestamps=[timestamps[i] for i in order],
+        means=[array("d", (column[i] for i in order)) for column in columns.means],
+        gusts=[array("d", (column[i] for i in order)) for column in columns.gusts],
+    )
+
+
+def load_station_timelines(
+    event_dir: Path, gap_policy: str = DEFAULT_GAP_POLICY, csv_names: Optional[Sequence[str]] = None
+) -> EventTimeline:
+    return EventTimeline.from_columns(read_station_columns(event_dir, csv_names), gap_policy=gap_policy)
+
+
+@dataclass
+class StationSeries:
+    """One station's readings aligned with `NetworkColumns.sorted_timestamps()`."""
+
+    name: str
+    means: array
+    gusts: array
+    directions: bytearray  # codes into WIND_DIRECTIONS
+
+
+@dataclass
+class NetworkColumns:
+    """Every station in an event's CSVs, kept as a compact observation log.
+
+    Station names are interned once (`stations[code]`), and each reading is one entry in parallel
+    typed arrays: interval row, station code, mean, gust and a `WIND_DIRECTIONS` code. Per-station
+    series aligned to the sorted timestamps are only built, then cached, when `series()` asks, so a
+    consumer that needs two stations never pays for thirty. The first `series()` call buckets the
+    log entries by station in one pass; later calls only walk their own station's entries.
+    """
+
+    stations: List[str] = field(default_factory=list)
+    station_codes: Dict[str, int] = field(default_factory=dict)
+    timestamps: List[str] = field(default_factory=list)
+    row_by_timestamp: Dict[str, int] = field(default_factory=dict)
+    rows: array = field(default_factory=lambda: array("I"))
+    station_log: array = field(default_factory=lambda: array("H"))
+    mean_log: array = field(default_factory=lambda: array("d"))
+    gust_log: array = field(default_factory=lambda: array("d"))
+    direction_log: bytearray = field(default_factory=bytearray)
+    _positions: Optional[array] = field(default=None, repr=False)
+    _entries: Optional[List[array]] = field(default=None, repr=False)
+    _series: Dict[int, StationSeries] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, timestamp: str, station: str, mean_speed: float, gust_speed: float, direction: Optional[str]) -> None:
+        row = self.row_by_timestamp.get(timestamp)
+        if row is None:
+            row = self.row_by_timestamp[timestamp] = len(self.timestamps)
+            self.timestamps.append(timestamp)
+        code = self.station_codes.get(station)
+        if code is None:
+            code = self.station_codes[station] = len(self.stations)
+            self.stations.append(station)
+        self.rows.append(row)
+        self.station_log.append(code)
+        self.mean_log.append(mean_speed)
+        self.gust_log.append(gust_speed)
+        self.direction_log.append(DIRECTION_CODES.get(direction, 0) if direction else 0)
+        self._positions = None
+        self._entries = None
+        self._series.clear()
+
+    def sorted_timestamps(self) -> List[str]:
+        return sorted(self.timestamps)
+
+    def positions(self) -> array:
+        """Sorted position of every interval row (computed once per log state)."""
+        if self._positions is None:
+            order = sorted(range(len(self.timestamps)), key=self.timestamps.__getitem__)
+            positions = array("I", bytes(4 * len(order)))
+            for position, row in enumerate(order):
+                positions[row] = position
+            self._positions = positions
+        return self._positions
+
+    def station_entries(self) -> List[array]:
+        """Log entry indices per station code, in log order (computed once per log state)."""
+        if self._entries is None:
+            entries = [array("I") for _ in self.stations]
+            for entry, code in enumerate(self.station_log):
+                entries[code].append(entry)
+            self._entries = entries
+        return self._entries
+
+    def series(self, station: str) -> StationSeries:
+        """Materialise one station's series; for repeated timestamp/station readings the later file wins."""
+        code = self.station_codes[station]
+        cached = self._series.get(code)
+        if cached is not None:
+            return cached
+        size = len(self.timestamps)
+        means = array("d", [MISSING]) * size
+        gusts = array("d", [MISSING]) * size
+        directions = bytearray(size)
+        positions = self.positions()
+        for entry in self.station_entries()[code]:
+            position = positions[self.rows[entry]]
+            means[position] = self.mean_log[entry]
+            gusts[position] = self.gust_log[entry]
+            directions[position] = self.direction_log[entry]
+        series = self._series[code] = StationSeries(name=station, means=means, gusts=gusts, directions=directions)
+        return series
+
+
+def read_network_columns(event_dir: Path, csv_names: Optional[Sequence[str]] = None) -> NetworkColumns:
+    """All-stations counterpart of `read_station_columns` (wind direction included)."""
+    network = NetworkColumns()
+    for csv_path in event_csv_paths(event_dir, csv_names):
+        for observation in read_csv_observations(csv_path):
+            network.add(*observation)
+    return network
+
+
+def build_network_payload(event_id: str, network: NetworkColumns) -> Dict[str, object]:
+    """Columnar JSON for every station of an event: speeds plus `WIND_DIRECTIONS` codes."""
+    reference = set(STATION_COLUMN_BY_CSV)
+    stations = []
+    for name in sorted(network.stations):
+        series = network.series(name)
+        stations.append(
+            {
+                "stationId": slugify(name),
+                "name": name,
+                "reference": name in reference,
+                "meanSpeedKmh": [optional_speed(value) for value in series.means],
+                "gustKmh": [optional_speed(value) for value in series.gusts],
+                "directionCode": list(series.directions),
+            }
+        )
+    return {
+        "eventId": event_id,
+        "directions": list(WIND_DIRECTIONS),
+        "timestamps": [stamp_iso(stamp) for stamp in network.sorted_timestamps()],
+        "stations": stations,
+    }
+
+
+SNAPSHOT_MAGIC = b"T8SN"
+SNAPSHOT_VERSION = 2  # v2: per-event duplicate/conflict counts in the header
+SNAPSHOT_COLUMNS = (("time", "int32"), ("mean", "float32"), ("gust", "float32"))
+DEFAULT_SNAPSHOT = "typhoon_data/.reference-snapshot.bin"
+STORE_VERSION = 2  # v2: per-event duplicate/conflict counts in event_quality
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stations (
+    station INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS loaded_files (
+    event TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    PRIMARY KEY (event, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS observations (
+    event TEXT NOT NULL,
+    station INTEGER NOT NULL REFERENCES stations (station),
+    minute INTEGER NOT NULL,
+    mean REAL,
+    gust REAL,
+    direction TEXT,
+    PRIMARY KEY (event, station, minute)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS observations_by_station_minute ON observations (station, minute);
+CREATE TABLE IF NOT EXISTS event_quality (
+    event TEXT PRIMARY KEY,
+    duplicates INTEGER NOT NULL,
+    conflicts INTEGER NOT NULL
+);
+"""
+
+
+def open_store(path: Path, readonly: bool = False) -> sqlite3.Connection:
+    """Open the SQLite observation store (created on first use, WAL journal for writers)."""
+    if readonly:
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, STORE_VERSION):
+        conn.close()
+        raise ValueError(f"{path}: observation store version {version}, expected {STORE_VERSION}; delete it to rebuild")
+    conn.executescript(STORE_SCHEMA)
+    conn.execute(f"PRAGMA user_version={STORE_VERSION}")
+    return conn
+
+
+def store_station_ids(conn: sqlite3.Connection) -> Dict[str, int]:
+    return dict(conn.execute("SELECT name, station FROM stations"))
+
+
+def csv_signatures(event_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """`(size, mtime_ns)` of every CSV in `event_dir`, keyed by file name in sorted order.
+
+    Uses one `scandir` pass and plain name sorting (the same files and order as `glob("*.csv")`).
+    """
+    with os.scandir(event_dir) as entries:
+        found = [(entry.name, entry.stat()) for entry in entries if entry.name.endswith(".csv") and entry.name[0] != "."]
+    return {name: (stat.st_size, stat.st_mtime_ns) for name, stat in sorted(found, key=lambda item: item[0])}
+
+
+def ingest_event(
+    conn: sqlite3.Connection,
+    event_id: str,
+    event_dir: Path,
+    fetch: Optional[Callable[[List[Path]], Iterator[bytes]]] = None,
+    checkpoint_every: int = 0,
+) -> Tuple[int, int]:
+    """Load new or changed CSVs of one event into the store; returns `(files loaded, rows loaded)`.
+
+    Files already recorded in `loaded_files` with the same size and mtime are skipped, so re-running
+    is a no-op. New files that sort after everything loaded are appended; a rewritten, removed or
+    earlier-sorting file reloads the event, so "the later file wins" holds exactly as when parsing
+    the folder. Repeated reference-station readings are counted into `event_quality` the same way
+    `merge_csv_files` counts them.
+
+    `fetch(paths)` yields the bytes of each path in order (e.g. `prefetch_files`); by default each
+    file is read as it is parsed. With `checkpoint_every`, the load commits after every that many
+    files, `loaded_files` and `event_quality` included, so an interrupted import resumes from the
+    last checkpoint (the committed files are a prefix, so the rest is appended).
+    """
+    signatures = csv_signatures(event_dir)
+    loaded = {
+        name: (size, mtime_ns)
+        for name, size, mtime_ns in conn.execute(
+            "SELECT name, size, mtime_ns FROM loaded_files WHERE event = ?", (event_id,)
+        )
+    }
+    changed = [name for name, signature in signatures.items() if loaded.get(name) != signature]
+    removed = loaded.keys() - signatures.keys()
+    if not changed and not removed:
+        return 0, 0
+    newest = max(loaded, default="")
+    reload = bool(removed) or any(name in loaded or name < newest for name in changed)
+
+    station_ids = store_station_ids(conn)
+    latest: Dict[Tuple[int, int], Tuple[Optional[float], Optional[float]]] = {}
+    files = rows = duplicates = conflicts = 0
+    stream: Optional[Iterator[bytes]] = None
+
+    def checkpoint() -> None:
+        nonlocal duplicates, conflicts
+        conn.execute(
+            "INSERT INTO event_quality VALUES (?, ?, ?) ON CONFLICT (event) DO UPDATE SET "
+            "duplicates = duplicates + excluded.duplicates, conflicts = conflicts + excluded.conflicts",
+            (event_id, duplicates, conflicts),
+        )
+        conn.commit()
+        duplicates = conflicts = 0
+
+    try:
+        if reload:
+            conn.execute("DELETE FROM observations WHERE event = ?", (event_id,))
+            conn.execute("DELETE FROM loaded_files WHERE event = ?", (event_id,))
+            conn.execute("DELETE FROM event_quality WHERE event = ?", (event_id,))
+            changed = list(signatures)
+        else:
+            reference = [station_ids[name] for name in STATION_BY_CSV if name in station_ids]
+            placeholders = ", ".join("?" * len(reference))
+            for station, minute, mean_speed, gust_speed in conn.execute(
+                f"SELECT station, minute, mean, gust FROM observations WHERE event = ? AND station IN ({placeholders})",
+                (event_id, *reference),
+            ):
+                latest[station, minute] = (mean_speed, gust_speed)
+        paths = [event_dir / name for name in changed]
+        if fetch is None:
+            sources: Iterable[Iterable[Tuple[str, str, float, float, Optional[str]]]] = map(read_csv_observations, paths)
+        else:
+            stream = fetch(paths)
+            sources = map(parse_csv_observations, stream, paths)
+        for name, observations in zip(changed, sources):
+            batch = []
+            for timestamp, station_name, mean_speed, gust_speed, direction in observations:
+                station = station_ids.get(station_name)
+                if station is None:
+                    station = station_ids[station_name] = conn.execute(
+                        "INSERT INTO stations (name) VALUES (?)", (station_name,)
+                    ).lastrowid
+                row = (
+                    event_id,
+                    station,
+                    stamp_minutes(timestamp),
+                    optional_speed(mean_speed),
+                    optional_speed(gust_speed),
+                    direction,
                 )
+                if station_name in STATION_BY_CSV:
+                    previous = latest.get((station, row[2]))
+                    if previous is not None:
+                        duplicates += 1
+                        conflicts += previous != row[3:5]
+                    latest[station, row[2]] = row[3:5]
+                batch.append(row)
+            conn.executemany("INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?, ?, ?)", batch)
+            conn.execute(
+                "INSERT OR REPLACE INTO loaded_files VALUES (?, ?, ?, ?, ?)", (event_id, name, *signatures[name], len(batch))
             )
-        count = sum(1 for s in stations if s.meets_threshold)
-        readings.append(IntervalReading(dt=dt, stations=stations, stations_meeting_threshold=count))
-    return readings
-
-
-def build_persistence_windows(readings: List[IntervalReading]) -> List[Dict[str, object]]:
-    windows: List[Dict[str, object]] = []
-    current: Optional[Dict[str, object]] = None
-    for interval in readings:
-        meets = interval.stations_meeting_threshold >= MIN_REFERENCE_STATIONS
-        if meets:
-            if current is None:
-                current = {
-                    "start_dt": interval.dt,
-                    "end_dt": interval.dt,
-                    "intervals": 0,
-                    "maxCount": interval.stations_meeting_threshold,
-                }
-            current["end_dt"] = interval.dt
-            current["intervals"] += 1
-            current["maxCount"] = max(current["maxCount"], interval.stations_meeting_threshold)
-        else:
-            if current:
-                windows.append(current)
-                current = None
-    if current:
-        windows.append(current)
-    return windows
+            files += 1
+            rows += len(batch)
+            if checkpoint_every and files % checkpoint_every == 0:
+                checkpoint()
+        checkpoint()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        if hasattr(stream, "close"):
+            stream.close()  # type: ignore[union-attr]  # stop a prefetching generator's pending reads
+    return files, rows
+
+
+def load_store_timeline(
+    conn: sqlite3.Connection,
+    event_id: str,
+    threshold: float = T8_THRESHOLD_KMH,
+    gap_policy: str = DEFAULT_GAP_POLICY,
+) -> EventTimeline:
+    """Build an event's `EventTimeline` from the store (same result as parsing its CSV folder)."""
+    station_ids = store_station_ids(conn)
+    column_by_station = {
+        station_ids[ref["csvName"]]: index for index, ref in enumerate(REFERENCE_STATIONS) if ref["csvName"] in station_ids
+    }
+    minutes = array("q")
+    means = [array("d") for _ in REFERENCE_STATIONS]
+    gusts = [array("d") for _ in REFERENCE_STATIONS]
+    if column_by_station:
+        placeholders = ", ".join("?" * len(column_by_station))
+        rows = conn.execute(
+            f"SELECT minute, station, mean, gust FROM observations "
+            f"WHERE event = ? AND station IN ({placeholders}) ORDER BY minute",
+            (event_id, *column_by_station),
+        )
+        for minute, station, mean_speed, gust_speed in rows:
+            if not minutes or minutes[-1] != minute:
+                minutes.append(minute)
+                for column in means:
+                    column.append(MISSING)
+                for column in gusts:
+                    column.append(MISSING)
+            column = column_by_station[station]
+            means[column][-1] = MISSING if mean_speed is None else mean_speed
+            gusts[column][-1] = MISSING if gust_speed is None else gust_speed
+    stamps = [minutes_iso(minute) for minute in minutes]
+    quality = conn.execute("SELECT duplicates, conflicts FROM event_quality WHERE event = ?", (event_id,)).fetchone()
+    return EventTimeline.from_station_series(minutes, stamps, means, gusts, threshold, gap_policy, quality or (0, 0))
+
+
+def minutes_stamp(minutes: int) -> str:
+    """12-digit HKT `YYYYMMDDHHMM` stamp for epoch minutes (the CSV form of `minutes_iso`)."""
+    days, minute_of_day = divmod(minutes + HKT_OFFSET_MINUTES, 1440)
+    return f"{date.fromordinal(EPOCH_ORDINAL + days):%Y%m%d}{minute_of_day // 60:02d}{minute_of_day % 60:02d}"
+
+
+def snapshot_block(columns: StationColumns) -> Optional[bytes]:
+    """One event's snapshot columns (see `write_snapshot`), or None when float32 would round a reading."""
+    values = [array("i", map(stamp_minutes, columns.timestamps))]
+    for source in (columns.means, columns.gusts):
+        packed = array("f", [value for column in source for value in column])
+        if array("d", packed).tobytes() != b"".join(column.tobytes() for column in source):
+            return None
+        values.append(packed)
+    if sys.byteorder != "little":
+        for column in values:
+            column.byteswap()
+    return b"".join(column.tobytes() for column in values)
+
+
+def write_snapshot(path: Path, event_dirs: Dict[str, Path], workers: int = 1) -> Tuple[int, int]:
+    """Parse every event folder once and write the reference-station timelines to one `T8SN` file.
+
+    Layout (little-endian): the 12-byte `T8EV`-style prefix (`T8SN`, version u16, reserved u16,
+    header length u32), a UTF-8 JSON header padded to a 4-byte boundary, then one block per event.
+    The header lists the station order and, per event, its directory, interval count N, the block
+    offset (relative to the end of the header), its duplicate/conflicting reading counts and the
+    `(size, mtime_ns)` of every CSV it was read from. Each block holds `time` (i32 epoch minutes, N), `mean` and `gust` (f32, station-major
+    S×N, NaN for missing). Events whose readings float32 cannot hold exactly are left out (they are
+    parsed from CSV as before). Returns `(events, intervals)`.
+    """
+    event_ids = sorted(event_dirs)
+    signatures = {event_id: csv_signatures(event_dirs[event_id]) for event_id in event_ids}
+    parsed = run_jobs(read_station_columns, [(event_dirs[event_id],) for event_id in event_ids], workers)
+    entries: List[Dict[str, object]] = []
+    blocks: List[bytes] = []
+    offset = intervals = 0
+    for event_id, columns in zip(event_ids, parsed):
+        block = snapshot_block(columns)
+        if block is None:
+            print(f"[warn] {event_id} has readings float32 cannot hold exactly; leaving it out of the snapshot.")
+            continue
+        entries.append(
+            {
+                "id": event_id,
+                "directory": event_dirs[event_id].name,
+                "intervals": len(columns),
+                "offset": offset,
+                "duplicateReadings": columns.duplicate_readings,
+                "conflictingReadings": columns.conflicting_readings,
+                "files": {name: list(signature) for name, signature in signatures[event_id].items()},
+            }
+        )
+        blocks.append(block)
+        offset += len(block)
+        intervals += len(columns)
+    header = {
+        "stations": [ref["csvName"] for ref in REFERENCE_STATIONS],
+        "columns": [list(column) for column in SNAPSHOT_COLUMNS],
+        "events": entries,
+    }
+    encoded = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (-(BINARY_PREFIX.size + len(encoded)) % 4)
+    with atomic_write(path) as handle:
+        handle.write(BINARY_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(encoded)))
+        handle.write(encoded)
+        for block in blocks:
+            handle.write(block)
+    return len(entries), intervals
+
+
+@dataclass
+class ReferenceSnapshot:
+    """Read-only memory map of a `T8SN` snapshot; `data` is a view of everything after the header."""
+
+    path: Path
+    events: Dict[str, Dict[str, object]]
+    data: memoryview
+    handle: mmap.mmap
+
+    def close(self) -> None:
+        self.data.release()
+        self.handle.close()
+
+
+def open_snapshot(path: Path) -> ReferenceSnapshot:
+    """Map a snapshot written by `write_snapshot`; only its JSON header is decoded up front."""
+    with path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, _, header_length = BINARY_PREFIX.unpack_from(mapped)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        mapped.close()
+        raise ValueError(f"{path}: not a T8SN v{SNAPSHOT_VERSION} snapshot; rerun --write-snapshot")
+    data_start = BINARY_PREFIX.size + header_length
+    header = json.loads(mapped[BINARY_PREFIX.size:data_start].decode("utf-8"))
+    if header["stations"] != [ref["csvName"] for ref in REFERENCE_STATIONS]:
+        mapped.close()
+        raise ValueError(f"{path}: snapshot was written for other reference stations; rerun --write-snapshot")
+    events = {entry["id"]: entry for entry in header["events"]}
+    return ReferenceSnapshot(path=path, events=events, data=memoryview(mapped)[data_start:], handle=mapped)
+
+
+def load_snapshot_timeline(
+    snapshot: ReferenceSnapshot,
+    event_id: str,
+    event_dir: Path,
+    threshold: float = T8_THRESHOLD_KMH,
+    gap_policy: str = DEFAULT_GAP_POLICY,
+) -> Optional[EventTimeline]:
+    """Build an event's `EventTimeline` from the snapshot (same result as parsing its CSV folder).
+
+    CSVs added since the snapshot that sort after every snapshotted file are parsed and layered on
+    top. Returns None, so the caller parses the folder, when the event is missing from the snapshot
+    or any of its files was rewritten, removed or added in front of the others.
+    """
+    entry = snapshot.events.get(event_id)
+    if entry is None or entry["directory"] != event_dir.name:
+        return None
+    signatures = csv_signatures(event_dir)
+    loaded: Dict[str, List[int]] = entry["files"]  # type: ignore[assignment]
+    if any(signatures.get(name) != tuple(signature) for name, signature in loaded.items()):
+        return None
+    newer = [name for name in signatures if name not in loaded]
+    if newer and newer[0] < max(loaded, default=""):
+        return None
+
+    intervals = int(entry["intervals"])  # type: ignore[arg-type]
+    cells = intervals * len(REFERENCE_STATIONS)
+    start = int(entry["offset"])  # type: ignore[arg-type]
+    block = snapshot.data[start:start + 4 * (intervals + 2 * cells)]
+    if sys.byteorder != "little":
+        block = memoryview(bytearray(block))
+        for typecode, lo, hi in (("i", 0, intervals), ("f", intervals, intervals + 2 * cells)):
+            swapped = array(typecode, block[4 * lo:4 * hi])
+            swapped.byteswap()
+            block[4 * lo:4 * hi] = swapped.tobytes()
+    minutes = array("q", block[:4 * intervals].cast("i"))
+    readings = block[4 * intervals:].cast("f")
+    means = [array("d", readings[s * intervals:(s + 1) * intervals]) for s in range(len(REFERENCE_STATIONS))]
+    gusts = [
+        array("d", readings[cells + s * intervals:cells + (s + 1) * intervals]) for s in range(len(REFERENCE_STATIONS))
+    ]
+    readings.release()
+    block.release()
+    duplicates = (int(entry["duplicateReadings"]), int(entry["conflictingReadings"]))  # type: ignore[arg-type]
+    if newer:
+        columns = StationColumns(
+            timestamps=[minutes_stamp(minute) for minute in minutes],
+            means=means,
+            gusts=gusts,
+            duplicate_readings=duplicates[0],
+            conflicting_readings=duplicates[1],
+        )
+        columns = merge_csv_files(columns, [event_dir / name for name in newer])
+        return EventTimeline.from_columns(columns, threshold, gap_policy)
+    stamps = [minutes_iso(minute) for minute in minutes]
+    return EventTimeline.from_station_series(minutes, stamps, means, gusts, threshold, gap_policy, duplicates)
+
+
+@lru_cache(maxsize=None)
+def count_table(min_stations: int) -> bytes:
+    return bytes(int(count >= min_stations) for count in range(256))
+
+
+def interval_mask(counts: array, min_stations: int = MIN_REFERENCE_STATIONS) -> bytes:
+    """One byte per interval: 1 when at least `min_stations` stations meet the threshold."""
+    return counts.tobytes().translate(count_table(min_stations))
+
+
+def mask_runs(mask: bytes) -> List[Tuple[int, int]]:
+    """Run-length encode an interval mask into `(start, stop)` pairs for every run of set intervals."""
+    return [match.span() for match in RUN_PATTERN.finditer(mask)]
+
+
+def interval_counts(timeline: EventTimeline, threshold: Optional[float] = None) -> array:
+    """Per-interval station counts, recomputed only when `threshold` differs from the timeline's own."""
+    if threshold is None or threshold == timeline.threshold:
+        return timeline.counts
+    return threshold_mask(timeline.means, len(timeline), threshold)[1]
+
+
+def run_window(timeline: EventTimeline, start: int, stop: int) -> Dict[str, object]:
+    return {"start": timeline.stamps[start], "end": timeline.stamps[stop - 1], "intervals": stop - start}
+
+
+def runs_to_windows(timeline: EventTimeline, runs: List[Tuple[int, int]], counts: array) -> List[Dict[str, object]]:
+    return [{**run_window(timeline, start, stop), "maxCount": max(counts[start:stop])} for start, stop in runs]
+
+
+def build_persistence_windows(
+    timeline: EventTimeline,
+    min_stations: int = MIN_REFERENCE_STATIONS,
+    counts: Optional[array] = None,
+) -> List[Dict[str, object]]:
+    counts = timeline.counts if counts is None else counts
+    return runs_to_windows(timeline, mask_runs(interval_mask(counts, min_stations)), counts)
 
 
 def convert_window(window: Dict[str, object]) -> Dict[str, object]:
     intervals = int(window["intervals"])
     max_count = window.get("maxCount")
     return {
-        "start": window["start_dt"].isoformat(timespec="minutes"),
-        "end": window["end_dt"].isoformat(timespec="minutes"),
+        "start": window["start"],
+        "end": window["end"],
         "intervalCount": intervals,
         "minutes": intervals * 10,
         "maxStationCount": max_count,
     }
 
 
-def detect_tier(readings: List[IntervalReading]) -> Dict[str, object]:
-    windows = build_persistence_windows(readings)
-    tier1_window = next((w for w in windows if w["intervals"] >= MIN_PERSISTENCE_INTERVALS), None)
-    if tier1_window:
+def classify_runs(runs: List[Tuple[int, int]], min_intervals: int = MIN_PERSISTENCE_INTERVALS) -> Tuple[int, Optional[int]]:
+    """Tier for a list of mask runs plus the index of the run whose start is the initial detection."""
+    for index, (start, stop) in enumerate(runs):
+        if stop - start >= min_intervals:
+            return 1, index
+    if len(runs) >= 2:
+        return 2, 0
+    return 3, None
+
+
+def detect_tier(
+    timeline: EventTimeline,
+    threshold: Optional[float] = None,
+    min_stations: int = MIN_REFERENCE_STATIONS,
+    min_intervals: int = MIN_PERSISTENCE_INTERVALS,
+    counts: Optional[array] = None,
+    runs: Optional[List[Tuple[int, int]]] = None,
+) -> Dict[str, object]:
+    """Classify an event from the run-length encoding of its "≥min_stations at threshold" mask.
+
+    Persistence windows are the runs themselves; Tier 1 is the first run of at least `min_intervals`.
+    Failing that, Tier 2 (wind-lull-wind) needs a second run: the first run is the initial burst, the
+    gap after it the lull, and the second run the reemergence. Callers evaluating many settings can
+    pass precomputed `counts` for `threshold` to skip recounting, and callers that maintain the runs
+    incrementally (the live tail) can pass `runs` as well. `initialDetection` is in epoch minutes.
+    """
+    if counts is None:
+        counts = interval_counts(timeline, threshold)
+    if runs is None:
+        runs = mask_runs(interval_mask(counts, min_stations))
+    windows = runs_to_windows(timeline, runs, counts)
+    tier, run_index = classify_runs(runs, min_intervals)
+    if tier == 1:
+        tier1_window = windows[run_index]
         return {
             "detectedTier": 1,
-            "initialDetection": tier1_window["start_dt"],
+            "initialDetection": timeline.minutes[runs[run_index][0]],
             "persistenceWindows": [convert_window(w) for w in windows],
             "tier1Window": convert_window(tier1_window),
             "tier2Pattern": None,
         }
 
-    # Tier 2 state machine
-    state = "search"
-    initial = lull = remerge = None
-    for interval in readings:
-        meets = interval.stations_meeting_threshold >= MIN_REFERENCE_STATIONS
-        if state == "search":
-            if meets:
-                initial = {"start_dt": interval.dt, "end_dt": interval.dt, "intervals": 1}
-                state = "initial"
-        elif state == "initial":
-            if meets:
-                initial["end_dt"] = interval.dt
-                initial["intervals"] += 1
-            else:
-                lull = {"start_dt": interval.dt, "end_dt": interval.dt, "intervals": 1}
-                state = "lull"
-        elif state == "lull":
-            if meets:
-                remerge = {"start_dt": interval.dt, "end_dt": interval.dt, "intervals": 1}
-                state = "reemerge"
-            else:
-                lull["end_dt"] = interval.dt
-                lull["intervals"] += 1
-        elif state == "reemerge":
-            if meets:
-                remerge["end_dt"] = interval.dt
-                remerge["intervals"] += 1
-            else:
-                break
-    if state == "reemerge" and initial and lull and remerge:
+    if tier == 2:
+        (burst_start, burst_stop), (reemerge_start, reemerge_stop) = runs[0], runs[1]
         return {
             "detectedTier": 2,
-            "initialDetection": initial["start_dt"],
+            "initialDetection": timeline.minutes[burst_start],
             "persistenceWindows": [convert_window(w) for w in windows],
             "tier1Window": None,
             "tier2Pattern": {
-                "initialBurst": convert_window(initial),
-                "lull": convert_window(lull),
-                "reemergence": convert_window(remerge),
+                "initialBurst": convert_window(run_window(timeline, burst_start, burst_stop)),
+                "lull": convert_window(run_window(timeline, burst_stop, reemerge_start)),
+                "reemergence": convert_window(run_window(timeline, reemerge_start, reemerge_stop)),
             },
         }
 
@@ -420,25 +1517,309 @@ def detect_tier(readings: List[IntervalReading]) -> Dict[str, object]:
     }
 
 
-def minutes_delta(later: datetime, earlier: datetime) -> int:
-    return int((later - earlier).total_seconds() // 60)
+@dataclass(frozen=True)
+class TierRule:
+    """One declarative tier rule set from the rules file (see `load_tier_rules`).
+
+    An interval is active when the weighted number of reference stations whose `metric` reaches
+    `threshold` is at least `min_stations` and, with a rolling window, when at least `min_active` of
+    the last `window` intervals were. Tiers then follow the usual run classification with
+    `min_intervals`, and early warning is measured from the official start of `signal`.
+    """
+
+    id: str
+    label: str = ""
+    signal: int = 8
+    metric: str = "mean"
+    threshold: float = T8_THRESHOLD_KMH
+    min_stations: float = MIN_REFERENCE_STATIONS
+    min_intervals: int = MIN_PERSISTENCE_INTERVALS
+    weights: Tuple[float, ...] = ()  # per reference station; empty = every station counts once
+    window: int = 1
+    min_active: int = 1
+
+
+def parse_tier_rule(spec: Dict[str, object]) -> TierRule:
+    unknown = spec.keys() - RULE_FIELDS
+    if unknown:
+        raise ValueError(f"unknown key(s) {', '.join(sorted(unknown))}")
+    rule_id = spec.get("id")
+    if not isinstance(rule_id, str) or not rule_id or slugify(rule_id) != rule_id:
+        raise ValueError("`id` must be a lowercase slug such as `t8-gust`")
+    if spec.get("metric", "mean") not in RULE_METRICS:
+        raise ValueError(f"`metric` must be one of {', '.join(RULE_METRICS)}")
+    if spec.get("signal", 8) not in RULE_SIGNALS:
+        raise ValueError(f"`signal` must be one of {', '.join(map(str, RULE_SIGNALS))}")
+    weights: Tuple[float, ...] = ()
+    if spec.get("stationWeights"):
+        by_station: Dict[str, float] = spec["stationWeights"]  # type: ignore[assignment]
+        unknown = by_station.keys() - {ref["stationId"] for ref in REFERENCE_STATIONS}
+        if unknown:
+            raise ValueError(f"unknown station(s) in `stationWeights`: {', '.join(sorted(unknown))}")
+        weights = tuple(float(by_station.get(ref["stationId"], 1)) for ref in REFERENCE_STATIONS)
+    window: Dict[str, int] = spec.get("rollingWindow") or {}  # type: ignore[assignment]
+    rule = TierRule(
+        id=rule_id,
+        label=str(spec.get("label", "")),
+        signal=int(spec.get("signal", 8)),  # type: ignore[arg-type]
+        metric=str(spec.get("metric", "mean")),
+        threshold=parse_number(str(spec.get("thresholdKmh", T8_THRESHOLD_KMH))),
+        min_stations=parse_number(str(spec.get("minStations", MIN_REFERENCE_STATIONS))),
+        min_intervals=int(spec.get("minPersistenceIntervals", MIN_PERSISTENCE_INTERVALS)),  # type: ignore[arg-type]
+        weights=weights,
+        window=int(window.get("intervals", 1)),
+        min_active=int(window.get("minActive", 1)),
+    )
+    if rule.min_stations <= 0 or rule.min_intervals < 1:
+        raise ValueError("`minStations` must be positive and `minPersistenceIntervals` at least 1")
+    if not 1 <= rule.min_active <= rule.window:
+        raise ValueError("`rollingWindow` needs 1 ≤ minActive ≤ intervals")
+    return rule
 
 
-def summarize_peak(readings: List[IntervalReading]) -> Optional[Dict[str, object]]:
-    peak = None
-    for interval in readings:
-        for station in interval.stations:
-            if station.mean_speed is None:
-                continue
-            if not peak or station.mean_speed > peak["speed"]:
-                peak = {
-                    "stationId": station.station_id,
-                    "nameEn": station.name_en,
-                    "nameZh": station.name_zh,
-                    "speed": station.mean_speed,
-                    "timestamp": interval.timestamp,
-                }
-    return peak
+def load_tier_rules(path: Path) -> Tuple[TierRule, ...]:
+    """Parse and validate a rules file (`{"ruleSets": [...]}`); errors name the file and rule set."""
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise ValueError(f"{path}: {exc}") from None
+    rules: List[TierRule] = []
+    for position, spec in enumerate(document.get("ruleSets", []), start=1):
+        try:
+            rules.append(parse_tier_rule(spec))
+        except (TypeError, ValueError, AttributeError) as exc:
+            raise ValueError(f"{path}: rule set {position} ({spec.get('id', '?')}): {exc}") from None
+    ids = [rule.id for rule in rules]
+    duplicates = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+    if duplicates:
+        raise ValueError(f"{path}: duplicate rule set id(s): {', '.join(duplicates)}")
+    return tuple(rules)
+
+
+RuleStage = Callable[[bytearray, array, int], Tuple[Sequence[float], bytes]]
+
+
+def compile_weighted_score(weights: Tuple[float, ...], min_stations: float) -> RuleStage:
+    """Station-weighted score per interval plus its ≥min_stations mask.
+
+    Both paths add the weights station by station in the same order, so scores match bit for bit.
+    """
+
+    def stage(meets: bytearray, counts: array, intervals: int) -> Tuple[Sequence[float], bytes]:
+        if np is not None:
+            rows = np.frombuffer(meets, dtype=np.uint8).reshape(len(weights), intervals)
+            total = np.zeros(intervals)
+            for station, weight in enumerate(weights):
+                if weight:
+                    total += weight * rows[station]
+            return array("d", total.tobytes()), (total >= min_stations).astype(np.uint8).tobytes()
+        total = array("d", bytes(8 * intervals))
+        for station, weight in enumerate(weights):
+            if weight:
+                for index, meets_threshold in enumerate(meets[station * intervals:(station + 1) * intervals]):
+                    if meets_threshold:
+                        total[index] += weight
+        return total, bytes(value >= min_stations for value in total)
+
+    return stage
+
+
+def rolling_mask(mask: bytes, window: int, min_active: int) -> bytes:
+    """1 where at least `min_active` of the last `window` intervals (this one included) are set."""
+    if np is not None:
+        active = np.concatenate(([0], np.cumsum(np.frombuffer(mask, dtype=np.uint8), dtype=np.int64)))
+        ends = np.arange(1, len(mask) + 1)
+        return ((active[ends] - active[np.maximum(ends - window, 0)]) >= min_active).astype(np.uint8).tobytes()
+    rolled = bytearray(len(mask))
+    running = 0
+    for index, value in enumerate(mask):
+        running += value
+        if index >= window:
+            running -= mask[index - window]
+        rolled[index] = running >= min_active
+    return bytes(rolled)
+
+
+def compile_rule(rule: TierRule) -> RuleStage:
+    """Turn a rule into a `(station mask, counts, N) -> (score, interval mask)` pipeline.
+
+    Unweighted rules reuse the shared per-interval counts and a 256-entry translate table; weights
+    and rolling windows only add their own step when the rule asks for them.
+    """
+    if rule.weights:
+        score = compile_weighted_score(rule.weights, rule.min_stations)
+    else:
+        table = count_table(min(math.ceil(rule.min_stations), 255))
+
+        def score(meets: bytearray, counts: array, intervals: int) -> Tuple[Sequence[float], bytes]:
+            return counts, counts.tobytes().translate(table)
+
+    if rule.window == 1:
+        return score
+
+    def stage(meets: bytearray, counts: array, intervals: int) -> Tuple[Sequence[float], bytes]:
+        values, mask = score(meets, counts, intervals)
+        return values, rolling_mask(mask, rule.window, rule.min_active)
+
+    return stage
+
+
+class TierRuleEngine:
+    """Rule sets compiled once and evaluated together over an event's timeline.
+
+    Every distinct (metric, threshold) station mask is computed once per event and shared by all
+    rules that use it; each rule then runs its compiled pipeline and the run classification of
+    `detect_tier`, so adding a variant is a rules-file change rather than another scan.
+    """
+
+    def __init__(self, rules: Sequence[TierRule]) -> None:
+        self.rules = tuple(rules)
+        self.sources = sorted({(rule.metric, rule.threshold) for rule in self.rules})
+        self.stages = [compile_rule(rule) for rule in self.rules]
+
+    def station_masks(self, timeline: EventTimeline) -> Dict[Tuple[str, float], Tuple[bytearray, array]]:
+        masks = {}
+        for metric, threshold in self.sources:
+            if metric == "mean" and threshold == timeline.threshold:
+                masks[metric, threshold] = (timeline.meets, timeline.counts)
+            else:
+                masks[metric, threshold] = threshold_mask(getattr(timeline, RULE_METRICS[metric]), len(timeline), threshold)
+        return masks
+
+    def evaluate(self, timeline: EventTimeline, event_meta: Dict[str, object]) -> Dict[str, Dict[str, object]]:
+        """Per-rule results keyed by rule id, in rules-file order."""
+        masks = self.station_masks(timeline)
+        results: Dict[str, Dict[str, object]] = {}
+        for rule, stage in zip(self.rules, self.stages):
+            meets, counts = masks[rule.metric, rule.threshold]
+            score, mask = stage(meets, counts, len(timeline))
+            tier_info = detect_tier(timeline, counts=score, runs=mask_runs(mask), min_intervals=rule.min_intervals)
+            results[rule.id] = rule_result(rule, tier_info, mask, event_meta)
+        return results
+
+
+@lru_cache(maxsize=8)
+def compile_tier_rules(rules: Tuple[TierRule, ...]) -> TierRuleEngine:
+    """Compiled engine for `rules`, built once per process (pool workers included)."""
+    return TierRuleEngine(rules)
+
+
+def rule_result(
+    rule: TierRule, tier_info: Dict[str, object], mask: bytes, event_meta: Dict[str, object]
+) -> Dict[str, object]:
+    detection = tier_info["initialDetection"]
+    reference = event_meta.get(f"officialSignal{rule.signal}Start")
+    early_warning = None
+    if detection is not None and reference:
+        early_warning = minutes_delta(detection, datetime_minutes(datetime.fromisoformat(reference)))  # type: ignore[arg-type]
+    windows: List[Dict[str, object]] = tier_info["persistenceWindows"]  # type: ignore[assignment]
+    return {
+        "label": rule.label,
+        "detectedTier": tier_info["detectedTier"],
+        "initialDetection": minutes_iso(detection) if detection is not None else None,  # type: ignore[arg-type]
+        "referenceSignal": rule.signal,
+        "referenceStart": reference,
+        "earlyWarningMinutes": early_warning,
+        "intervalsMeetingRule": mask.count(1),
+        "windowCount": len(windows),
+        "longestPersistenceMinutes": max((window["minutes"] for window in windows), default=0),
+        "tier1Window": tier_info["tier1Window"],
+        "tier2Pattern": tier_info["tier2Pattern"],
+    }
+
+
+def minutes_delta(later: int, earlier: int) -> int:
+    return later - earlier
+
+
+def station_maxima(buffer: array, intervals: int) -> Tuple[List[int], List[Optional[Tuple[float, int]]]]:
+    """Per station of a station-major buffer: the number of readings, and the highest value with its
+    first interval (None when the station reported nothing).
+    """
+    if intervals == 0:
+        return [], []
+    if np is not None:
+        rows = np.frombuffer(buffer, dtype=np.float64).reshape(-1, intervals)
+        missing = np.isnan(rows)
+        best = np.argmax(np.where(missing, -np.inf, rows), axis=1).tolist()
+        reported = (intervals - missing.sum(axis=1)).tolist()
+        return reported, [
+            (float(rows[station, index]), index) if count else None
+            for station, (count, index) in enumerate(zip(reported, best))
+        ]
+    reported = []
+    peaks: List[Optional[Tuple[float, int]]] = []
+    for offset in range(0, len(buffer), intervals):
+        column = buffer[offset:offset + intervals]
+        present = [value for value in column if value == value]
+        reported.append(len(present))
+        best = max(present, default=None)
+        peaks.append(None if best is None else (best, column.index(best)))
+    return reported, peaks
+
+
+def station_statistics(timeline: EventTimeline) -> List[Dict[str, object]]:
+    """Per-station summary of an event, one entry per reference station in station order.
+
+    Read off the station-major buffers in one pass per column: intervals with a mean reading, peak
+    mean and gust with the first interval reaching them, minutes at or above the threshold, and the
+    first and last interval meeting it. Summary cards and tooltips render from these instead of
+    scanning `stationReadings`.
+    """
+    intervals = len(timeline)
+    if intervals == 0:
+        return []
+    reported, mean_peaks = station_maxima(timeline.means, intervals)
+    _, gust_peaks = station_maxima(timeline.gusts, intervals)
+    entries: List[Dict[str, object]] = []
+    for station, ref in enumerate(timeline.stations):
+        offset = station * intervals
+        first = timeline.meets.find(1, offset, offset + intervals)
+        last = timeline.meets.rfind(1, offset, offset + intervals)
+        mean_peak, gust_peak = mean_peaks[station], gust_peaks[station]
+        entries.append(
+            {
+                "stationId": ref["stationId"],
+                "nameEn": ref["nameEn"],
+                "nameZh": ref["nameZh"],
+                "intervalsReported": reported[station],
+                "peakMeanKmh": mean_peak[0] if mean_peak else None,
+                "peakMeanAt": timeline.timestamp(mean_peak[1]) if mean_peak else None,
+                "peakGustKmh": gust_peak[0] if gust_peak else None,
+                "peakGustAt": timeline.timestamp(gust_peak[1]) if gust_peak else None,
+                "minutesAtOrAboveThreshold": timeline.meets.count(1, offset, offset + intervals) * INTERVAL_MINUTES,
+                "firstExceedance": timeline.timestamp(first - offset) if first >= 0 else None,
+                "lastExceedance": timeline.timestamp(last - offset) if last >= 0 else None,
+            }
+        )
+    return entries
+
+
+def summarize_peak(
+    timeline: EventTimeline, summary: Optional[List[Dict[str, object]]] = None
+) -> Optional[Dict[str, object]]:
+    """Highest mean speed across the network; ties go to the earliest interval, then station order.
+
+    Taken from the per-station peaks of `station_statistics` (computed when not passed in).
+    """
+    if summary is None:
+        summary = station_statistics(timeline)
+    candidates = [
+        (-entry["peakMeanKmh"], entry["peakMeanAt"], position)  # type: ignore[operator]
+        for position, entry in enumerate(summary)
+        if entry["peakMeanKmh"] is not None
+    ]
+    if not candidates:
+        return None
+    _, timestamp, position = min(candidates)
+    entry = summary[position]
+    return {
+        "stationId": entry["stationId"],
+        "nameEn": entry["nameEn"],
+        "nameZh": entry["nameZh"],
+        "speed": entry["peakMeanKmh"],
+        "timestamp": timestamp,
+    }
 
 
 def generate_highlights(
@@ -484,40 +1865,55 @@ def generate_highlights(
     return highlights
 
 
-def interval_public_payload(interval: IntervalReading) -> Dict[str, object]:
+def interval_public_payload(timeline: EventTimeline, index: int) -> Dict[str, object]:
+    count = timeline.counts[index]
     return {
-        "timestamp": interval.timestamp,
-        "stationsMeetingThresholdCount": interval.stations_meeting_threshold,
-        "meetsTierThreshold": interval.stations_meeting_threshold >= MIN_REFERENCE_STATIONS,
+        "timestamp": timeline.timestamp(index),
+        "stationsMeetingThresholdCount": count,
+        "meetsTierThreshold": count >= MIN_REFERENCE_STATIONS,
         "stations": [
             {
-                "stationId": s.station_id,
-                "nameEn": s.name_en,
-                "nameZh": s.name_zh,
-                "meanSpeedKmh": s.mean_speed,
-                "gustKmh": s.gust_speed,
-                "meetsThreshold": s.meets_threshold,
+                "stationId": ref["stationId"],
+                "nameEn": ref["nameEn"],
+                "nameZh": ref["nameZh"],
+                "meanSpeedKmh": timeline.mean(index, station),
+                "gustKmh": timeline.gust(index, station),
+                "meetsThreshold": timeline.meets_threshold(index, station),
             }
-            for s in interval.stations
+            for station, ref in enumerate(timeline.stations)
         ],
     }
 
 
-def build_event_payload(event_meta: Dict[str, object], readings: List[IntervalReading]) -> Dict[str, object]:
-    tier_info = detect_tier(readings)
-    official_start = datetime.fromisoformat(event_meta["officialSignal8Start"])  # type: ignore[arg-type]
+def build_event_payload(
+    event_meta: Dict[str, object],
+    timeline: EventTimeline,
+    runs: Optional[List[Tuple[int, int]]] = None,
+    tier_info: Optional[Dict[str, object]] = None,
+    readings: bool = True,
+    rules: Sequence[TierRule] = (),
+) -> Dict[str, object]:
+    """The public event document. With `readings=False`, `stationReadings` is left empty for
+    `iter_event_json` to generate while writing, so the per-interval dicts never exist all at once.
+    `ruleEvaluations` holds the result of every rule set in `rules`, keyed by rule id, and
+    `dataQuality` the timeline's gap/duplicate report.
+    """
+    if tier_info is None:
+        tier_info = detect_tier(timeline, runs=runs)
+    official_start = datetime_minutes(datetime.fromisoformat(event_meta["officialSignal8Start"]))  # type: ignore[arg-type]
     detection_start = tier_info["initialDetection"]
     early_warning = None
     if detection_start is not None:
         early_warning = minutes_delta(detection_start, official_start)
-    peak_station = summarize_peak(readings)
+    station_summary = station_statistics(timeline)
+    peak_station = summarize_peak(timeline, station_summary)
     highlights = generate_highlights(tier_info, early_warning, peak_station)
 
     tier_evaluation = {
         "detectedTier": tier_info["detectedTier"],
         "tierLabel": TIER_LABELS[tier_info["detectedTier"]],
-        "initialDetection": tier_info["initialDetection"].isoformat(timespec="minutes")
-        if tier_info["initialDetection"]
+        "initialDetection": minutes_iso(tier_info["initialDetection"])  # type: ignore[arg-type]
+        if tier_info["initialDetection"] is not None
         else None,
         "persistenceWindows": tier_info["persistenceWindows"],
         "tier1Window": tier_info.get("tier1Window"),
@@ -525,19 +1921,17 @@ def build_event_payload(event_meta: Dict[str, object], readings: List[IntervalRe
         "meetsFourStationPersistence": tier_info["detectedTier"] == 1,
         "stationCountSeries": [
             {
-                "timestamp": interval.timestamp,
-                "stationsMeetingThreshold": interval.stations_meeting_threshold,
+                "timestamp": timeline.timestamp(index),
+                "stationsMeetingThreshold": count,
             }
-            for interval in readings
+            for index, count in enumerate(timeline.counts)
         ],
     }
 
     derived_metrics = {
         "earlyWarningMinutes": early_warning,
-        "totalIntervals": len(readings),
-        "intervalsMeetingThreshold": sum(
-            1 for interval in readings if interval.stations_meeting_threshold >= MIN_REFERENCE_STATIONS
-        ),
+        "totalIntervals": len(timeline),
+        "intervalsMeetingThreshold": sum(1 for count in timeline.counts if count >= MIN_REFERENCE_STATIONS),
         "longestPersistenceMinutes": max(
             (window["minutes"] for window in tier_info["persistenceWindows"]), default=0
         ),
@@ -558,7 +1952,7 @@ def build_event_payload(event_meta: Dict[str, object], readings: List[IntervalRe
             "notes": event_meta.get("notes", []),
             "highlights": highlights,
         },
-        "stationReadings": [interval_public_payload(interval) for interval in readings],
+        "stationReadings": [interval_public_payload(timeline, index) for index in range(len(timeline))] if readings else [],
         "tierEvaluation": tier_evaluation,
         "derivedMetrics": derived_metrics,
     }
@@ -569,71 +1963,1409 @@ def build_event_payload(event_meta: Dict[str, object], readings: List[IntervalRe
     payload["tier"] = tier_info["detectedTier"]
     payload["highlights"] = highlights
     payload["derivedMetrics"]["persistenceWindows"] = tier_info["persistenceWindows"]
+    payload["ruleEvaluations"] = compile_tier_rules(tuple(rules)).evaluate(timeline, event_meta)
+    payload["dataQuality"] = timeline.quality
+    payload["stationStatistics"] = station_summary
     return payload
 
 
-def write_json(path: Path, data: object) -> None:
+def build_event_binary(payload: Dict[str, object], timeline: EventTimeline) -> bytes:
+    """Pack an event into the compact `T8EV` blob served alongside the verbose JSON.
+
+    Layout (little-endian): a 12-byte prefix (`T8EV`, version u16, reserved u16, header length u32),
+    a UTF-8 JSON header padded with spaces to a 4-byte boundary, then the data section holding the
+    columns listed in `header["columns"]` (offsets are relative to the start of the data section):
+    `time` (i32 epoch minutes), `mean` and `gust` (f32, station-major S×N, NaN for missing) and
+    `count` (u8 stations meeting the threshold). The header carries everything in the JSON payload
+    except the per-interval `stationReadings` / `stationCountSeries`, plus the station table once, so
+    clients read the series as typed-array views without parsing them.
+    """
+    columns: List[Tuple[str, str, array]] = [
+        ("time", "int32", array("i", timeline.minutes)),
+        ("mean", "float32", array("f", timeline.means)),
+        ("gust", "float32", array("f", timeline.gusts)),
+        ("count", "uint8", timeline.counts),
+    ]
+    layout = []
+    offset = 0
+    for name, kind, values in columns:
+        layout.append({"name": name, "type": kind, "offset": offset, "length": len(values)})
+        offset += len(values) * values.itemsize
+
+    header: Dict[str, object] = {key: value for key, value in payload.items() if key != "stationReadings"}
+    header["tierEvaluation"] = {
+        key: value for key, value in payload["tierEvaluation"].items() if key != "stationCountSeries"  # type: ignore[union-attr]
+    }
+    header["stations"] = [
+        {"stationId": ref["stationId"], "nameEn": ref["nameEn"], "nameZh": ref["nameZh"]} for ref in timeline.stations
+    ]
+    header["thresholdKmh"] = timeline.threshold
+    header["intervalCount"] = len(timeline)
+    header["columns"] = layout
+    encoded = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (-(BINARY_PREFIX.size + len(encoded)) % 4)
+
+    chunks = [BINARY_PREFIX.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(encoded)), encoded]
+    for _, _, values in columns:
+        if sys.byteorder != "little" and values.itemsize > 1:
+            values = array(values.typecode, values)
+            values.byteswap()
+        chunks.append(values.tobytes())
+    return b"".join(chunks)
+
+
+def read_event_binary(data: bytes) -> Dict[str, object]:
+    """Decode a `T8EV` blob into its header plus `columns` as arrays (the inverse of `build_event_binary`)."""
+    magic, version, _, header_length = BINARY_PREFIX.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"not a T8EV v{BINARY_VERSION} event blob")
+    data_start = BINARY_PREFIX.size + header_length
+    header = json.loads(data[BINARY_PREFIX.size:data_start].decode("utf-8"))
+    typecodes = {"int32": "i", "float32": "f", "uint8": "B"}
+    columns: Dict[str, array] = {}
+    for column in header["columns"]:
+        values = array(typecodes[column["type"]])
+        start = data_start + column["offset"]
+        values.frombytes(data[start:start + column["length"] * values.itemsize])
+        if sys.byteorder != "little" and values.itemsize > 1:
+            values.byteswap()
+        columns[column["name"]] = values
+    header["columns"] = columns
+    return header
+
+
+def pyramid_buckets(timeline: EventTimeline, resolution: int) -> List[int]:
+    """Start index of every `resolution`-minute bucket (aligned to the HKT clock) that has intervals."""
+    starts: List[int] = []
+    previous = None
+    for index, minute in enumerate(timeline.minutes):
+        bucket = (minute + HKT_OFFSET_MINUTES) // resolution
+        if bucket != previous:
+            starts.append(index)
+            previous = bucket
+    return starts
+
+
+def bucket_maxima(buffer: array, intervals: int, starts: List[int]) -> List[List[Optional[float]]]:
+    """Per-station maxima of a station-major buffer over each bucket; None when a bucket is all missing."""
+    if np is not None:
+        reduced = np.fmax.reduceat(as_matrix(buffer, intervals), starts, axis=0).T
+        return [[None if value != value else value for value in row] for row in reduced.tolist()]
+    bounds = list(zip(starts, starts[1:] + [intervals]))
+    return [
+        [
+            max((value for value in buffer[offset + start:offset + stop] if value == value), default=None)
+            for start, stop in bounds
+        ]
+        for offset in range(0, len(buffer), intervals)
+    ]
+
+
+def build_pyramid_level(payload: Dict[str, object], timeline: EventTimeline, resolution: int) -> Dict[str, object]:
+    """One downsampled level: per-bucket max mean, max gust and max stations-meeting-threshold count.
+
+    Buckets are aligned to the HKT clock and labelled by their start; `intervalCount` says how many
+    10-minute intervals actually fell in each one. Station series are station-major, like the `.bin`.
+    """
+    intervals = len(timeline)
+    starts = pyramid_buckets(timeline, resolution)
+    bounds = list(zip(starts, starts[1:] + [intervals]))
+    minutes = [(timeline.minutes[start] + HKT_OFFSET_MINUTES) // resolution * resolution - HKT_OFFSET_MINUTES for start in starts]
+    return {
+        "eventId": payload["metadata"]["id"],  # type: ignore[index]
+        "resolutionMinutes": resolution,
+        "thresholdKmh": timeline.threshold,
+        "officialSignal8Start": payload["metadata"]["officialSignal8Start"],  # type: ignore[index]
+        "initialDetection": payload["tierEvaluation"]["initialDetection"],  # type: ignore[index]
+        "stations": [ref["stationId"] for ref in timeline.stations],
+        "timestamps": [minutes_iso(minute) for minute in minutes],
+        "intervalCount": [stop - start for start, stop in bounds],
+        "maxStationsMeetingThreshold": [max(timeline.counts[start:stop]) for start, stop in bounds],
+        "maxMeanSpeedKmh": bucket_maxima(timeline.means, intervals, starts),
+        "maxGustKmh": bucket_maxima(timeline.gusts, intervals, starts),
+    }
+
+
+def encode_pyramids(
+    payload: Dict[str, object],
+    timeline: EventTimeline,
+    resolutions: Sequence[int],
+) -> Dict[str, bytes]:
+    """Compact JSON per pyramid level, keyed by `<eventId>/<minutes>.json` under the pyramid folder."""
+    event_id = payload["metadata"]["id"]  # type: ignore[index]
+    return {
+        f"{event_id}/{resolution}.json": encode_json(build_pyramid_level(payload, timeline, resolution), compact=True)
+        for resolution in resolutions
+    }
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """Write through a hidden temp file next to `path` and rename it into place once complete.
+
+    The rename is atomic, so a server reading the output directory during a (live) rebuild sees
+    either the old file or the new one, never a partial write.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with partial.open("wb") as handle:
+            yield handle
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    with atomic_write(path) as handle:
+        handle.write(data)
+
+
+def encode_json(data: object, compact: bool = False) -> bytes:
+    """UTF-8 JSON, indented by 2 unless `compact`; orjson is used when installed.
+
+    Both encoders give the same bytes for the portal's documents (orjson only spells float
+    exponents differently, e.g. `1e-5` for `1e-05`, which never occurs in practice).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json(path: Path, data: object, compact: bool = False) -> None:
+    write_bytes(path, encode_json(data, compact))
+
+
+def iter_event_json(payload: Dict[str, object], timeline: EventTimeline, compact: bool = False) -> Iterator[bytes]:
+    """Serialise an event payload chunk by chunk, generating `stationReadings` from `timeline`.
+
+    The bytes equal `encode_json(payload, compact)` with the readings filled in, whatever
+    `payload["stationReadings"]` holds (build it with `readings=False`), but at most
+    `READINGS_CHUNK` intervals are ever materialised or encoded at once.
+    """
+    colon, newline = (b":", b"") if compact else (b": ", b"\n")
+    yield b"{"
+    for position, (key, value) in enumerate(payload.items()):
+        yield (b"," if position else b"") + newline + (b"" if compact else b"  ") + encode_json(key) + colon
+        if key != "stationReadings":
+            yield encode_json(value, compact).replace(b"\n", b"\n  ")
+            continue
+        if not len(timeline):
+            yield b"[]"
+            continue
+        yield b"["
+        for start in range(0, len(timeline), READINGS_CHUNK):
+            # one encoder call per chunk: drop the list's brackets and indent its items one level deeper
+            chunk = encode_json(
+                [interval_public_payload(timeline, index) for index in range(start, min(start + READINGS_CHUNK, len(timeline)))],
+                compact,
+            )
+            body = chunk[1:-1] if compact else chunk[1:-2].replace(b"\n", b"\n  ")
+            yield (b"," if start else b"") + body
+        yield newline + (b"" if compact else b"  ") + b"]"
+    yield newline + b"}"
+
+
+def write_event_json(path: Path, payload: Dict[str, object], timeline: EventTimeline, compact: bool = False) -> int:
+    """Stream an event payload to `path` (atomically, see `iter_event_json`); returns the bytes written."""
+    written = 0
+    with atomic_write(path) as handle:
+        for chunk in iter_event_json(payload, timeline, compact):
+            written += handle.write(chunk)
+    return written
+
+
+def build_index_entry(payload: Dict[str, object]) -> Dict[str, object]:
+    meta = payload["metadata"]
+    return {
+        "id": meta["id"],
+        "nameEn": meta["nameEn"],
+        "nameZh": meta["nameZh"],
+        "year": meta["year"],
+        "tier": payload["tier"],
+        "tierLabel": TIER_LABELS[payload["tier"]],
+        "severity": meta["severity"],
+        "officialSignal8Start": meta["officialSignal8Start"],
+        "officialSignal8End": meta["officialSignal8End"],
+        "officialSignal10Start": meta["officialSignal10Start"],
+        "officialSignal10End": meta["officialSignal10End"],
+        "earlyWarningMinutes": payload["derivedMetrics"]["earlyWarningMinutes"],
+        "casualty": payload.get("casualty"),
+        "propertyLoss": payload.get("propertyLoss"),
+        "highlights": payload["highlights"],
+    }
 
 
 def build_index_payload(event_payloads: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
-    summaries: List[Dict[str, object]] = []
-    for payload in event_payloads:
-        meta = payload["metadata"]
-        summaries.append(
+    return sort_index_entries(build_index_entry(payload) for payload in event_payloads)
+
+
+def sort_index_entries(entries: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+    return sorted(entries, key=lambda row: row["officialSignal8Start"])
+
+
+def first_run_start(counts: array, min_stations: int = MIN_REFERENCE_STATIONS) -> Optional[int]:
+    index = interval_mask(counts, min_stations).find(1)
+    return None if index < 0 else index
+
+
+def event_analytics(payload: Dict[str, object], timeline: EventTimeline) -> Dict[str, object]:
+    """Small per-event contribution to `analytics.json`, taken while the timeline is in memory.
+
+    Everything is read off the station-major buffers: interval leaders (highest mean, ties to
+    station order), the official T8 window's coverage by ≥4-station intervals, and the first mean
+    and gust exceedance per station and for the network. The event's `stationStatistics` (without
+    station names) are carried along for `stations.json`.
+    """
+    intervals = len(timeline)
+    meta = payload["metadata"]  # type: ignore[assignment]
+    peak = payload["derivedMetrics"]["peakStation"]  # type: ignore[index]
+
+    leaders = [0] * len(timeline.stations)
+    if np is not None:
+        matrix = as_matrix(timeline.means, intervals)
+        present = ~np.isnan(matrix).all(axis=1)
+        best = np.argmax(np.where(np.isnan(matrix), -np.inf, matrix)[present], axis=1)
+        for station, count in enumerate(np.bincount(best, minlength=len(leaders)).tolist()):
+            leaders[station] = count
+    else:
+        for index in range(intervals):
+            values = [timeline.means[offset + index] for offset in range(0, len(timeline.means), intervals)]
+            present = [value for value in values if value == value]
+            if present:
+                leaders[values.index(max(present))] += 1
+
+    official_start = datetime_minutes(datetime.fromisoformat(meta["officialSignal8Start"]))  # type: ignore[index]
+    official_end = datetime_minutes(datetime.fromisoformat(meta["officialSignal8End"]))  # type: ignore[index]
+    window_start = bisect_left(timeline.minutes, official_start)
+    window_stop = bisect_right(timeline.minutes, official_end)
+    window_counts = timeline.counts[window_start:window_stop]
+
+    gust_meets, gust_counts = threshold_mask(timeline.gusts, intervals, timeline.threshold)
+    stations: Dict[str, Dict[str, Optional[int]]] = {}
+    for station, ref in enumerate(timeline.stations):
+        offset = station * intervals
+        mean_first = timeline.meets.find(1, offset, offset + intervals)
+        gust_first = gust_meets.find(1, offset, offset + intervals)
+        stations[ref["stationId"]] = {
+            "firstMean": timeline.minutes[mean_first - offset] if mean_first >= 0 else None,
+            "firstGust": timeline.minutes[gust_first - offset] if gust_first >= 0 else None,
+        }
+    network_mean = first_run_start(timeline.counts)
+    network_gust = first_run_start(gust_counts)
+    return {
+        "id": meta["id"],  # type: ignore[index]
+        "tier": payload["tier"],
+        "earlyWarningMinutes": payload["derivedMetrics"]["earlyWarningMinutes"],  # type: ignore[index]
+        "peakStationId": peak["stationId"] if peak else None,  # type: ignore[index]
+        "intervalLeaders": {ref["stationId"]: leaders[station] for station, ref in enumerate(timeline.stations)},
+        "t8Intervals": len(window_counts),
+        "t8IntervalsMeetingThreshold": sum(1 for count in window_counts if count >= MIN_REFERENCE_STATIONS),
+        "stations": stations,
+        "networkFirstMean": timeline.minutes[network_mean] if network_mean is not None else None,
+        "networkFirstGust": timeline.minutes[network_gust] if network_gust is not None else None,
+        "stationStatistics": [
+            {key: value for key, value in entry.items() if key not in ("nameEn", "nameZh")}
+            for entry in payload["stationStatistics"]  # type: ignore[union-attr]
+        ],
+    }
+
+
+def describe_distribution(values: List[int]) -> Dict[str, object]:
+    if not values:
+        return {"count": 0, "min": None, "max": None, "mean": None, "median": None, "quartiles": None}
+    return {
+        "count": len(values),
+        "min": min(values),
+        "max": max(values),
+        "mean": round(statistics.fmean(values), 1),
+        "median": statistics.median(values),
+        "quartiles": statistics.quantiles(values, n=4) if len(values) > 1 else [values[0]] * 3,
+    }
+
+
+def lead_minutes(first_mean: Optional[int], first_gust: Optional[int]) -> Optional[int]:
+    """Minutes by which gusts reached the threshold before the mean did (negative: mean first)."""
+    if first_mean is None or first_gust is None:
+        return None
+    return first_mean - first_gust
+
+
+def build_analytics(contributions: Iterable[Dict[str, object]]) -> Dict[str, object]:
+    """Cross-event statistics, folded over per-event contributions in a single pass."""
+    events = 0
+    early_warnings: List[int] = []
+    early_by_tier: Dict[str, List[int]] = {"1": [], "2": [], "3": []}
+    undetected: List[str] = []
+    peak_events = {ref["stationId"]: 0 for ref in REFERENCE_STATIONS}
+    leader_intervals = {ref["stationId"]: 0 for ref in REFERENCE_STATIONS}
+    coverage: List[Dict[str, object]] = []
+    t8_intervals = t8_meeting = 0
+    station_leads: Dict[str, List[int]] = {ref["stationId"]: [] for ref in REFERENCE_STATIONS}
+    network_leads: List[Dict[str, object]] = []
+
+    for item in contributions:
+        events += 1
+        event_id = item["id"]
+        early = item["earlyWarningMinutes"]
+        if early is None:
+            undetected.append(event_id)  # type: ignore[arg-type]
+        else:
+            early_warnings.append(early)  # type: ignore[arg-type]
+            early_by_tier[str(item["tier"])].append(early)  # type: ignore[arg-type]
+        if item["peakStationId"] in peak_events:
+            peak_events[item["peakStationId"]] += 1  # type: ignore[index]
+        for station_id, count in item["intervalLeaders"].items():  # type: ignore[union-attr]
+            leader_intervals[station_id] = leader_intervals.get(station_id, 0) + count
+        intervals, meeting = item["t8Intervals"], item["t8IntervalsMeetingThreshold"]
+        t8_intervals += intervals  # type: ignore[operator]
+        t8_meeting += meeting  # type: ignore[operator]
+        coverage.append(
             {
-                "id": meta["id"],
-                "nameEn": meta["nameEn"],
-                "nameZh": meta["nameZh"],
-                "year": meta["year"],
-                "tier": payload["tier"],
-                "tierLabel": TIER_LABELS[payload["tier"]],
-                "severity": meta["severity"],
-                "officialSignal8Start": meta["officialSignal8Start"],
-                "officialSignal8End": meta["officialSignal8End"],
-                "officialSignal10Start": meta["officialSignal10Start"],
-                "officialSignal10End": meta["officialSignal10End"],
-                "earlyWarningMinutes": payload["derivedMetrics"]["earlyWarningMinutes"],
-                "casualty": payload.get("casualty"),
-                "propertyLoss": payload.get("propertyLoss"),
-                "highlights": payload["highlights"],
+                "id": event_id,
+                "t8Intervals": intervals,
+                "intervalsMeetingThreshold": meeting,
+                "share": round(meeting / intervals, 4) if intervals else None,  # type: ignore[operator]
+            }
+        )
+        for station_id, firsts in item["stations"].items():  # type: ignore[union-attr]
+            lead = lead_minutes(firsts["firstMean"], firsts["firstGust"])
+            if lead is not None:
+                station_leads.setdefault(station_id, []).append(lead)
+        network_leads.append(
+            {
+                "id": event_id,
+                "firstGustRun": minutes_iso(item["networkFirstGust"]) if item["networkFirstGust"] is not None else None,  # type: ignore[arg-type]
+                "firstMeanRun": minutes_iso(item["networkFirstMean"]) if item["networkFirstMean"] is not None else None,  # type: ignore[arg-type]
+                "gustLeadMinutes": lead_minutes(item["networkFirstMean"], item["networkFirstGust"]),  # type: ignore[arg-type]
             }
         )
-    return sorted(summaries, key=lambda row: row["officialSignal8Start"])
 
+    histogram: List[Dict[str, int]] = []
+    if early_warnings:
+        width = EARLY_WARNING_BIN_MINUTES
+        low = min(early_warnings) // width * width
+        high = max(early_warnings) // width * width
+        for start in range(low, high + width, width):
+            histogram.append(
+                {"from": start, "to": start + width, "events": sum(1 for value in early_warnings if start <= value < start + width)}
+            )
+    total_leading = sum(leader_intervals.values())
+    return {
+        "events": events,
+        "thresholdKmh": T8_THRESHOLD_KMH,
+        "minStations": MIN_REFERENCE_STATIONS,
+        "earlyWarningMinutes": {
+            **describe_distribution(early_warnings),
+            "byTier": {tier: describe_distribution(values) for tier, values in early_by_tier.items()},
+            "histogram": histogram,
+            "undetectedEvents": undetected,
+        },
+        "peakStations": [
+            {
+                "stationId": ref["stationId"],
+                "nameEn": ref["nameEn"],
+                "nameZh": ref["nameZh"],
+                "peakEvents": peak_events[ref["stationId"]],
+                "intervalsLeading": leader_intervals[ref["stationId"]],
+                "intervalShare": round(leader_intervals[ref["stationId"]] / total_leading, 4) if total_leading else None,
+            }
+            for ref in REFERENCE_STATIONS
+        ],
+        "t8Coverage": {
+            "t8Intervals": t8_intervals,
+            "intervalsMeetingThreshold": t8_meeting,
+            "share": round(t8_meeting / t8_intervals, 4) if t8_intervals else None,
+            "events": coverage,
+        },
+        "gustMeanLead": {
+            "network": {
+                **describe_distribution([row["gustLeadMinutes"] for row in network_leads if row["gustLeadMinutes"] is not None]),  # type: ignore[misc]
+                "events": network_leads,
+            },
+            "stations": [
+                {"stationId": station_id, **describe_distribution(leads)} for station_id, leads in station_leads.items()
+            ],
+        },
+    }
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Build HK Signal 8 JSON data.")
-    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
-    parser.add_argument("--output-dir", default="data", help="Where to write the generated JSON")
-    args = parser.parse_args()
 
-    project_root = Path(__file__).resolve().parents[1]
-    typhoon_root = (project_root / args.typhoon_dir).resolve()
-    output_root = (project_root / args.output_dir).resolve()
-    events_output_dir = output_root / "events"
+def station_record(entries: List[Dict[str, object]], metric: str) -> Optional[Dict[str, object]]:
+    """The highest `peak<metric>Kmh` over an event-tagged station's entries; ties go to the earliest time."""
+    candidates = [entry for entry in entries if entry[f"peak{metric}Kmh"] is not None]
+    if not candidates:
+        return None
+    best = min(candidates, key=lambda entry: (-entry[f"peak{metric}Kmh"], entry[f"peak{metric}At"]))  # type: ignore[operator]
+    return {"kmh": best[f"peak{metric}Kmh"], "at": best[f"peak{metric}At"], "eventId": best["eventId"]}
+
+
+def build_station_index(contributions: Iterable[Dict[str, object]]) -> Dict[str, object]:
+    """Global station index: every reference station's per-event statistics plus its all-time records.
+
+    Folded over the same per-event contributions as `analytics.json`, so it is a few KB that summary
+    cards and tooltips can load instead of any event's readings.
+    """
+    events = 0
+    by_station: Dict[str, List[Dict[str, object]]] = {ref["stationId"]: [] for ref in REFERENCE_STATIONS}
+    for item in contributions:
+        events += 1
+        for entry in item["stationStatistics"]:  # type: ignore[union-attr]
+            by_station.setdefault(entry["stationId"], []).append({"eventId": item["id"], **entry})
+
+    names = {ref["stationId"]: ref for ref in REFERENCE_STATIONS}
+    stations = []
+    for station_id, entries in by_station.items():
+        ref = names.get(station_id, {})
+        stations.append(
+            {
+                "stationId": station_id,
+                "nameEn": ref.get("nameEn"),
+                "nameZh": ref.get("nameZh"),
+                "eventsReported": sum(1 for entry in entries if entry["intervalsReported"]),
+                "eventsMeetingThreshold": sum(1 for entry in entries if entry["minutesAtOrAboveThreshold"]),
+                "minutesAtOrAboveThreshold": sum(entry["minutesAtOrAboveThreshold"] for entry in entries),  # type: ignore[misc]
+                "peakMean": station_record(entries, "Mean"),
+                "peakGust": station_record(entries, "Gust"),
+                "events": [{key: value for key, value in entry.items() if key != "stationId"} for entry in entries],
+            }
+        )
+    return {
+        "events": events,
+        "thresholdKmh": T8_THRESHOLD_KMH,
+        "intervalMinutes": INTERVAL_MINUTES,
+        "stations": stations,
+    }
+
+
+def write_precompressed(path: Path, data: bytes, overwrite: bool = False) -> List[str]:
+    """Write `<path>.gz` (and `<path>.br` when Brotli is available) next to `path`; returns the encodings.
+
+    Variants of content-hashed files never change, so they are only written when missing unless
+    `overwrite` is set.
+    """
+    encodings = ["gzip"]
+    gz_path = path.with_name(path.name + ".gz")
+    if overwrite or not gz_path.exists():
+        write_bytes(gz_path, gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        br_path = path.with_name(path.name + ".br")
+        if overwrite or not br_path.exists():
+            write_bytes(br_path, brotli.compress(data, quality=11))
+        encodings.append("br")
+    return encodings
+
+
+def publish_hashed_file(output_root: Path, path: Path) -> Dict[str, object]:
+    """Copy `path` to `<stem>.<sha256-prefix><suffix>` beside it with precompressed variants; returns its asset entry."""
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:ASSET_HASH_LENGTH]
+    hashed_path = path.with_name(f"{path.stem}.{digest}{path.suffix}")
+    if not hashed_path.exists():
+        write_bytes(hashed_path, data)
+    return {
+        "path": hashed_path.relative_to(output_root).as_posix(),
+        "etag": f'"{digest}"',
+        "bytes": len(data),
+        "encodings": write_precompressed(hashed_path, data),
+    }
+
+
+def publish_short_lived(output_root: Path, name: str) -> Dict[str, object]:
+    """Asset entry for a fixed-name document rewritten by every build (re-compressing its variants)."""
+    data = (output_root / name).read_bytes()
+    return {
+        "path": name,
+        "cacheControl": INDEX_CACHE_CONTROL,
+        "etag": f'"{hashlib.sha256(data).hexdigest()[:ASSET_HASH_LENGTH]}"',
+        "encodings": write_precompressed(output_root / name, data, overwrite=True),
+    }
+
+
+def write_asset_manifest(output_root: Path, asset_manifest: Dict[str, object]) -> None:
+    """Add the short-TTL documents (`index.json`, `analytics.json`, `stations.json`) and write the manifest."""
+    asset_manifest["index"] = publish_short_lived(output_root, "index.json")
+    asset_manifest["documents"] = {
+        name: publish_short_lived(output_root, name)
+        for name in (ANALYTICS_FILENAME, STATION_INDEX_FILENAME)
+        if (output_root / name).exists()
+    }
+    write_json(output_root / ASSET_MANIFEST_FILENAME, asset_manifest)
+
+
+def publish_hashed_assets(
+    output_root: Path,
+    index_entries: List[Dict[str, object]],
+    formats: Sequence[str],
+    pyramid_levels: Sequence[int] = (),
+) -> Tuple[List[Dict[str, object]], Dict[str, object]]:
+    """Copy each event output (and its pyramid levels) to a content-hashed name with precompressed variants.
+
+    Returns the index entries extended with an `assets` map (hashed path, ETag, size and encodings per
+    format, plus `pyramids` per level) and the asset manifest. Hashed files are immutable, so existing
+    ones are left untouched and older hashes stay in place for clients still holding a previous
+    `index.json`. The short-TTL documents (`index.json`, `analytics.json`, `stations.json`) are added
+    to the manifest by the caller once written, see `write_asset_manifest`.
+    """
+    events_dir = output_root / "events"
+    published: List[Dict[str, object]] = []
+    manifest_events: Dict[str, Dict[str, object]] = {}
+    for entry in index_entries:
+        event_id = str(entry["id"])
+        assets: Dict[str, object] = {
+            fmt: publish_hashed_file(output_root, events_dir / f"{event_id}{EVENT_SUFFIXES[fmt]}") for fmt in formats
+        }
+        pyramid_dir = output_root / PYRAMID_DIRNAME / event_id
+        levels = [level for level in pyramid_levels if (pyramid_dir / f"{level}.json").exists()]
+        if levels:
+            assets["pyramids"] = {
+                str(level): publish_hashed_file(output_root, pyramid_dir / f"{level}.json") for level in levels
+            }
+        manifest_events[event_id] = assets
+        published.append({**entry, "assets": assets})
+    manifest = {
+        "version": 1,
+        "immutableCacheControl": IMMUTABLE_CACHE_CONTROL,
+        "events": manifest_events,
+    }
+    return published, manifest
 
-    metadata = build_metadata(project_root)
+
+def hash_json(data: object) -> str:
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def tier_rules_hash(rules: Sequence[TierRule]) -> str:
+    """Hash of parsed rule sets, as recorded in the build manifest's `rulesHash`."""
+    return hash_json([asdict(rule) for rule in rules])
+
+
+@lru_cache(maxsize=None)
+def builder_hash() -> str:
+    """Hash of this script, so logic changes invalidate every cached event; read once per process."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def load_manifest(path: Path) -> Dict[str, object]:
+    if not path.exists():
+        return {}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"[warn] unreadable build manifest at {path}, ignoring it.")
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def fingerprint_event(
+    event_dir: Path,
+    event_meta: Dict[str, object],
+    previous: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """Hash an event's inputs, reusing cached digests for files whose size and mtime are unchanged."""
+    previous_files: Dict[str, Dict[str, object]] = (previous or {}).get("files", {})  # type: ignore[assignment]
+    files: Dict[str, Dict[str, object]] = {}
+    for name, (size, mtime_ns) in csv_signatures(event_dir).items():
+        cached = previous_files.get(name)
+        if cached and cached["size"] == size and cached["mtimeNs"] == mtime_ns:
+            digest = cached["sha256"]
+        else:
+            digest = hashlib.sha256((event_dir / name).read_bytes()).hexdigest()
+        files[name] = {"sha256": digest, "size": size, "mtimeNs": mtime_ns}
+    return {
+        "directory": event_dir.name,
+        "metadataHash": hash_json(event_meta),
+        "files": files,
+    }
+
+
+def fingerprint_matches(current: Dict[str, object], cached: Optional[Dict[str, object]]) -> bool:
+    if not cached or "summary" not in cached or "analytics" not in cached:
+        return False
+    if current["directory"] != cached.get("directory") or current["metadataHash"] != cached.get("metadataHash"):
+        return False
+    cached_files: Dict[str, Dict[str, object]] = cached.get("files", {})  # type: ignore[assignment]
+    current_files: Dict[str, Dict[str, object]] = current["files"]  # type: ignore[assignment]
+    if cached_files.keys() != current_files.keys():
+        return False
+    return all(cached_files[name]["sha256"] == entry["sha256"] for name, entry in current_files.items())
+
+
+def event_output_paths(events_dir: Path, event_id: str, formats: Sequence[str]) -> List[Path]:
+    return [events_dir / f"{event_id}{EVENT_SUFFIXES[fmt]}" for fmt in formats]
+
+
+def pyramid_output_paths(output_root: Path, event_id: str, levels: Sequence[int]) -> List[Path]:
+    return [output_root / PYRAMID_DIRNAME / event_id / f"{level}.json" for level in levels]
+
+
+def write_event_outputs(
+    events_dir: Path,
+    payload: Dict[str, object],
+    timeline: EventTimeline,
+    formats: Sequence[str] = ("json",),
+    compact: bool = False,
+) -> int:
+    """Write the event files (`.json` streamed, `.bin` packed in memory); returns the bytes written."""
+    event_id = payload["metadata"]["id"]  # type: ignore[index]
+    written = 0
+    if "json" in formats:
+        written += write_event_json(events_dir / f"{event_id}{EVENT_SUFFIXES['json']}", payload, timeline, compact)
+    if "binary" in formats:
+        data = build_event_binary(payload, timeline)
+        write_bytes(events_dir / f"{event_id}{EVENT_SUFFIXES['binary']}", data)
+        written += len(data)
+    return written
+
+
+class BuildProfiler:
+    """Per-stage wall time, CPU time, tracemalloc peak, peak RSS and item counts for `--profile`.
+
+    Disabled profilers hand out throwaway records, so instrumented code paths cost next to nothing.
+    Stages are not nested: each one resets the tracemalloc peak when it starts.
+    """
+
+    def __init__(self, enabled: bool = False, event: Optional[str] = None) -> None:
+        self.enabled = enabled
+        self.event = event
+        self.records: List[Dict[str, object]] = []
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str, **counts: object) -> Iterator[Dict[str, object]]:
+        record: Dict[str, object] = {"stage": name}
+        if self.event is not None:
+            record["event"] = self.event
+        record.update(counts)
+        if not self.enabled:
+            yield record
+            return
+        tracemalloc.reset_peak()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        yield record
+        record["wallMs"] = round((time.perf_counter() - wall_start) * 1000, 3)
+        record["cpuMs"] = round((time.process_time() - cpu_start) * 1000, 3)
+        record["peakTracedKb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        if resource is not None:
+            record["maxRssKb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        self.records.append(record)
+
+
+def summarize_profile(records: List[Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+    """Aggregate records by stage: summed times and counts, maximum memory figures."""
+    stages: Dict[str, Dict[str, object]] = {}
+    for record in records:
+        totals = stages.setdefault(str(record["stage"]), {"calls": 0})
+        totals["calls"] += 1  # type: ignore[operator]
+        for key, value in record.items():
+            if key in ("stage", "event") or not isinstance(value, (int, float)):
+                continue
+            if key in ("peakTracedKb", "maxRssKb"):
+                totals[key] = max(totals.get(key, 0), value)  # type: ignore[type-var]
+            else:
+                totals[key] = round(totals.get(key, 0) + value, 3)  # type: ignore[operator]
+    return stages
+
+
+def process_event(
+    event_meta: Dict[str, object],
+    dir_path: Path,
+    events_dir: Path,
+    formats: Sequence[str] = ("json",),
+    profile: bool = False,
+    pyramid_levels: Sequence[int] = (),
+    store_path: Optional[Path] = None,
+    all_stations: bool = False,
+    snapshot_path: Optional[Path] = None,
+    minify: bool = False,
+    rules: Sequence[TierRule] = (),
+    gap_policy: str = DEFAULT_GAP_POLICY,
+    csv_names: Optional[Sequence[str]] = None,
+) -> Tuple[Optional[Dict[str, object]], Optional[Dict[str, object]], List[Dict[str, object]]]:
+    """Parse, evaluate and write one event (plus its downsampled pyramid levels, if any).
+
+    The timeline comes from the observation store when `store_path` is given, else from the
+    snapshot at `snapshot_path` when it is still current for the event, else from the CSV folder;
+    `all_stations` also writes the full-network series (always read from the CSVs), and `minify`
+    drops the indentation from the event JSON; `rules` are the tier rule sets to record and
+    `gap_policy` how missing 10-minute slots are aligned (see `align_series`); `csv_names`
+    restricts the CSV reads to those files (see `select_csv_files`). Returns the index
+    summary and analytics contribution (both None when no rows are usable) plus, with `profile`,
+    the per-stage records. Runs inside pool workers, so it only touches its own
+    inputs and output files.
+    """
+    profiler = BuildProfiler(profile, event=str(event_meta["id"]))
+    timeline: Optional[EventTimeline] = None
+    if store_path is not None:
+        with profiler.stage("read_store") as record, closing(open_store(store_path, readonly=True)) as conn:
+            timeline = load_store_timeline(conn, str(event_meta["id"]), gap_policy=gap_policy)
+            record["intervals"] = len(timeline)
+    elif snapshot_path is not None:
+        with profiler.stage("read_snapshot") as record, closing(open_snapshot(snapshot_path)) as snapshot:
+            timeline = load_snapshot_timeline(snapshot, str(event_meta["id"]), dir_path, gap_policy=gap_policy)
+            record.update(current=timeline is not None, intervals=len(timeline) if timeline is not None else 0)
+    if timeline is None:
+        with profiler.stage("read_csv") as record:
+            columns = read_station_columns(dir_path, csv_names)
+            record.update(files=columns.source_files, rows=columns.source_rows)
+        with profiler.stage("build_timeline", intervals=len(columns)):
+            timeline = EventTimeline.from_columns(columns, gap_policy=gap_policy)
+    if not len(timeline):
+        return None, None, profiler.records
+    with profiler.stage("detect_tier", intervals=len(timeline)) as record:
+        tier_info = detect_tier(timeline)
+        record["windows"] = len(tier_info["persistenceWindows"])  # type: ignore[arg-type]
+    with profiler.stage("build_payload", intervals=len(timeline)):
+        payload = build_event_payload(event_meta, timeline, tier_info=tier_info, readings=False, rules=rules)
+    with profiler.stage("serialize", files=len(formats)) as record:
+        record["bytes"] = write_event_outputs(events_dir, payload, timeline, formats, compact=minify)
+    with profiler.stage("pyramids", levels=len(pyramid_levels)) as record:
+        pyramids = encode_pyramids(payload, timeline, pyramid_levels)
+        record["bytes"] = sum(len(data) for data in pyramids.values())
+    network = b""
+    if all_stations:
+        with profiler.stage("network") as record:
+            columns = read_network_columns(dir_path, csv_names)
+            network = encode_json(build_network_payload(str(event_meta["id"]), columns), compact=True)
+            record.update(stations=len(columns.stations), readings=len(columns.rows), bytes=len(network))
+    with profiler.stage("write_files", files=len(pyramids) + bool(network)):
+        for name, data in pyramids.items():
+            write_bytes(events_dir.parent / PYRAMID_DIRNAME / name, data)
+        if network:
+            write_bytes(events_dir.parent / NETWORK_DIRNAME / f"{event_meta['id']}.json", network)
+    with profiler.stage("analytics", intervals=len(timeline)):
+        analytics = event_analytics(payload, timeline)
+    return build_index_entry(payload), analytics, profiler.records
+
+
+def run_jobs(func, jobs: List[Tuple], workers: int) -> Iterable:
+    """Yield `func(*job)` for every job in submission order, serially or across a process pool."""
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield func(*job)
+        return
+    with futures.ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        yield from pool.map(func, *zip(*jobs))
+
+
+def parse_number(value: str) -> float:
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def parse_grid(value: str, cast=int) -> List:
+    try:
+        return sorted({cast(item) for item in value.split(",") if item.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a comma-separated list of numbers, got {value!r}") from None
+
+
+def sweep_threshold(
+    timeline: EventTimeline,
+    official_start: int,
+    threshold: float,
+    station_counts: List[int],
+    persistence_lengths: List[int],
+) -> List[List[List[Optional[int]]]]:
+    """Sensitivity cells for one threshold: `[minStations][minIntervals] -> [tier, earlyWarning, longest]`.
+
+    Counts are computed once for the threshold and runs once per station count; every persistence
+    length is then a cheap classification of the same runs.
+    """
+    counts = interval_counts(timeline, threshold)
+    rows: List[List[List[Optional[int]]]] = []
+    for min_stations in station_counts:
+        runs = mask_runs(interval_mask(counts, min_stations))
+        longest_minutes = max((stop - start for start, stop in runs), default=0) * 10
+        cells: List[List[Optional[int]]] = []
+        for min_intervals in persistence_lengths:
+            tier, run_index = classify_runs(runs, min_intervals)
+            early_warning = None
+            if run_index is not None:
+                early_warning = minutes_delta(timeline.minutes[runs[run_index][0]], official_start)
+            cells.append([tier, early_warning, longest_minutes])
+        rows.append(cells)
+    return rows
+
+
+def load_event_timeline(
+    event_id: str,
+    event_dir: Path,
+    snapshot_path: Optional[Path] = None,
+    gap_policy: str = DEFAULT_GAP_POLICY,
+    csv_names: Optional[Sequence[str]] = None,
+) -> EventTimeline:
+    """An event's timeline from the snapshot when it is current for the event, else from its CSVs
+    (only `csv_names` when given; the snapshot holds whole folders, so it is not used then).
+    """
+    if snapshot_path is not None and csv_names is None:
+        with closing(open_snapshot(snapshot_path)) as snapshot:
+            timeline = load_snapshot_timeline(snapshot, event_id, event_dir, gap_policy=gap_policy)
+        if timeline is not None:
+            return timeline
+    return load_station_timelines(event_dir, gap_policy, csv_names)
+
+
+def run_sweep(
+    metadata: Dict[str, Dict[str, object]],
+    event_dirs: Dict[str, Path],
+    output_dir: Path,
+    thresholds: List[float],
+    station_counts: List[int],
+    persistence_lengths: List[int],
+    workers: int,
+    snapshot_path: Optional[Path] = None,
+    gap_policy: str = DEFAULT_GAP_POLICY,
+    window_margin: Optional[float] = None,
+) -> int:
+    """Parse each event once, evaluate the whole rule grid across `workers`, write one matrix per event.
+
+    With `window_margin` (hours), only CSVs stamped within that margin of the Signal 8 period are read.
+    """
+    event_ids = [event_id for event_id in sorted(event_dirs) if event_id in metadata]
+    jobs = []
+    for event_id in event_ids:
+        csv_names: Optional[List[str]] = None
+        if window_margin is not None:
+            names = list(csv_signatures(event_dirs[event_id]))
+            csv_names, skipped = select_csv_files(names, signal_window(metadata[event_id], window_margin))
+            if skipped:
+                print(describe_skipped(event_id, skipped, len(names), window_margin))
+        jobs.append((event_id, event_dirs[event_id], snapshot_path, gap_policy, csv_names))
+    timelines = dict(zip(event_ids, run_jobs(load_event_timeline, jobs, workers)))
+    event_ids = [event_id for event_id in event_ids if timelines[event_id]]
+
+    jobs = [
+        (
+            timelines[event_id],
+            datetime_minutes(datetime.fromisoformat(metadata[event_id]["officialSignal8Start"])),  # type: ignore[arg-type]
+            threshold,
+            station_counts,
+            persistence_lengths,
+        )
+        for event_id in event_ids
+        for threshold in thresholds
+    ]
+    results = iter(run_jobs(sweep_threshold, jobs, workers))
+    for event_id in event_ids:
+        write_json(
+            output_dir / f"{event_id}.json",
+            {
+                "id": event_id,
+                "officialSignal8Start": metadata[event_id]["officialSignal8Start"],
+                "axes": {
+                    "thresholdKmh": thresholds,
+                    "minStations": station_counts,
+                    "minPersistenceIntervals": persistence_lengths,
+                },
+                "fields": ["tier", "earlyWarningMinutes", "longestPersistenceMinutes"],
+                "matrix": [next(results) for _ in thresholds],
+            },
+            compact=True,
+        )
+    return len(event_ids)
+
+
+@lru_cache(maxsize=32)
+def cached_event_timeline(
+    event_id: str,
+    event_dir: Path,
+    signature: Tuple[Tuple[str, Tuple[int, int]], ...],
+    snapshot_path: Optional[Path],
+    gap_policy: str,
+    csv_names: Optional[Tuple[str, ...]] = None,
+) -> EventTimeline:
+    """`load_event_timeline` memoised on the folder's CSV `signature` (only used as the cache key)."""
+    return load_event_timeline(event_id, event_dir, snapshot_path, gap_policy, csv_names)
+
+
+@dataclass
+class Event:
+    """One event loaded through `load_event`: its metadata row, CSV folder and timeline."""
+
+    meta: Dict[str, object]
+    directory: Path
+    timeline: EventTimeline
+
+    @property
+    def id(self) -> str:
+        return str(self.meta["id"])
+
+
+def load_event(
+    event_id: str,
+    typhoon_dir: Union[str, Path] = "typhoon_data",
+    gap_policy: str = DEFAULT_GAP_POLICY,
+    snapshot: Optional[Union[str, Path]] = None,
+    window_margin: Optional[float] = None,
+) -> Event:
+    """Load one event for programmatic use (relative paths resolve against the project root).
+
+    The timeline is read from `snapshot` when given and current for the event, else from the CSV
+    folder (only files stamped within `window_margin` hours of the Signal 8 period, when given),
+    and is memoised until one of the folder's CSVs changes; treat it as read-only. Raises KeyError
+    when the event has no metadata row or no folder.
+    """
+    typhoon_root = (PROJECT_ROOT / typhoon_dir).resolve()
+    metadata = build_metadata(PROJECT_ROOT, typhoon_root)
     event_dirs = discover_event_directories(typhoon_root)
+    if event_id not in metadata or event_id not in event_dirs:
+        raise KeyError(f"unknown event {event_id!r}: no metadata row or folder under {typhoon_root}")
+    snapshot_path = (PROJECT_ROOT / snapshot).resolve() if snapshot is not None else None
+    signatures = csv_signatures(event_dirs[event_id])
+    csv_names = None
+    if window_margin is not None:
+        csv_names = tuple(select_csv_files(list(signatures), signal_window(metadata[event_id], window_margin))[0])
+    timeline = cached_event_timeline(
+        event_id, event_dirs[event_id], tuple(signatures.items()), snapshot_path, gap_policy, csv_names
+    )
+    return Event(meta=metadata[event_id], directory=event_dirs[event_id], timeline=timeline)
+
+
+def evaluate(
+    event: Event, rules: Union[str, Path, Sequence[TierRule]] = DEFAULT_TIER_RULES
+) -> Dict[str, Dict[str, object]]:
+    """Evaluate tier rule sets against a loaded event; the same mapping as its `ruleEvaluations`.
+
+    `rules` is a rules file (relative to the project root) or already parsed `TierRule`s. Compiled
+    rule sets are cached, so evaluating many events against the same rules compiles them once.
+    """
+    if isinstance(rules, (str, Path)):
+        rules = load_tier_rules((PROJECT_ROOT / rules).resolve())
+    return compile_tier_rules(tuple(rules)).evaluate(event.timeline, event.meta)
+
+
+class BuildOptionError(ValueError):
+    """An invalid combination of build options; the command line reports it as a usage error."""
+
+
+def check_build_options(
+    store: Optional[object], snapshot: Optional[object], window_margin: Optional[float], pyramid_levels: Sequence[int]
+) -> None:
+    """Raise `BuildOptionError` for option combinations the build cannot honour."""
+    if store and snapshot:
+        raise BuildOptionError("--store and --snapshot are alternative timeline sources; pass one")
+    if window_margin is not None and (store or snapshot):
+        raise BuildOptionError("--window-margin prunes CSV reads; --store and --snapshot hold whole event folders")
+    if window_margin is not None and window_margin < 0:
+        raise BuildOptionError("--window-margin must be zero or positive")
+    if any(level <= 10 or level % 10 for level in pyramid_levels):
+        raise BuildOptionError("--pyramid-levels must be multiples of 10 minutes above 10")
+
+
+def usable_snapshot(snapshot_path: Optional[Path], log: Callable[[str], None]) -> Optional[Path]:
+    """The snapshot to read timelines from, or None (with a warning) when it is missing or unreadable."""
+    if snapshot_path is None:
+        return None
+    if not snapshot_path.exists():
+        log(f"[warn] snapshot {snapshot_path} not found; parsing CSVs.")
+        return None
+    try:
+        open_snapshot(snapshot_path).close()
+    except ValueError as exc:
+        log(f"[warn] {exc}; parsing CSVs.")
+        return None
+    return snapshot_path
+
+
+def build_all(
+    typhoon_dir: Union[str, Path] = "typhoon_data",
+    output_dir: Union[str, Path] = "data",
+    *,
+    incremental: bool = False,
+    jobs: int = 1,
+    event_format: str = "both",
+    rules: Union[str, Path, None] = DEFAULT_TIER_RULES,
+    gap_policy: str = DEFAULT_GAP_POLICY,
+    window_margin: Optional[float] = None,
+    minify: bool = False,
+    pyramid_levels: Sequence[int] = PYRAMID_LEVELS,
+    all_stations: bool = False,
+    hashed_assets: bool = False,
+    store: Union[str, Path, None] = None,
+    snapshot: Union[str, Path, None] = None,
+    profile: bool = False,
+    log: Optional[Callable[[str], None]] = None,
+) -> List[Dict[str, object]]:
+    """Run the full site build and return the `index.json` entries.
+
+    Takes the command-line options as keyword arguments (paths relative to the project root) and
+    raises `BuildOptionError`, a `ValueError`, for invalid ones. Progress lines go to `log`
+    (`print` on the command line); by default the build is silent.
+    """
+    check_build_options(store, snapshot, window_margin, pyramid_levels)
+    if event_format not in EVENT_FORMATS:
+        raise BuildOptionError(f"--event-format must be one of {', '.join(EVENT_FORMATS)}")
+    if gap_policy not in GAP_POLICIES:
+        raise BuildOptionError(f"--gap-policy must be one of {', '.join(GAP_POLICIES)}")
+    say = log if log is not None else (lambda message: None)
+    formats = ("json", "binary") if event_format == "both" else (event_format,)
+    pyramid_levels = tuple(pyramid_levels)
+    workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+    project_root = PROJECT_ROOT
+    typhoon_root = (project_root / typhoon_dir).resolve()
+    output_root = (project_root / output_dir).resolve()
+    events_output_dir = output_root / "events"
+    manifest_path = output_root / MANIFEST_FILENAME
+    rules_path = (project_root / rules).resolve() if rules else None
+    rules_sets: Tuple[TierRule, ...] = ()
+    if rules_path is not None and (rules_path.exists() or str(rules) != DEFAULT_TIER_RULES):
+        try:
+            rules_sets = load_tier_rules(rules_path)
+        except (OSError, ValueError) as exc:
+            raise BuildOptionError(f"--rules: {exc}") from exc
+    rules_hash = tier_rules_hash(rules_sets)
+
+    profiler = BuildProfiler(profile)
+    build_wall, build_cpu = time.perf_counter(), time.process_time()
+    with profiler.stage("metadata") as record:
+        metadata = build_metadata(project_root, typhoon_root)
+        record["events"] = len(metadata)
+    with profiler.stage("discover") as record:
+        event_dirs = discover_event_directories(typhoon_root)
+        record["directories"] = len(event_dirs)
+    snapshot_path = usable_snapshot((project_root / snapshot).resolve() if snapshot else None, say)
+
+    manifest = load_manifest(manifest_path)
+    current_builder = builder_hash()
+    cached_events: Dict[str, Dict[str, object]] = manifest.get("events", {})  # type: ignore[assignment]
+    reuse_cache = (
+        incremental
+        and manifest.get("builderHash") == current_builder
+        and manifest.get("minify", False) == minify
+        and manifest.get("rulesHash") == rules_hash
+        and manifest.get("gapPolicy", DEFAULT_GAP_POLICY) == gap_policy
+        and manifest.get("windowMargin") == window_margin
+        and manifest.get("pyramidLevels") == list(pyramid_levels)
+        and manifest.get("allStations", False) == all_stations
+    )
 
-    generated_payloads: List[Dict[str, object]] = []
+    index_entries: List[Dict[str, object]] = []
+    analytics_items: Dict[str, Dict[str, object]] = {}
+    manifest_events: Dict[str, Dict[str, object]] = {}
+    pending: List[Tuple[str, Dict[str, object]]] = []
+    store_path = (project_root / store).resolve() if store else None
+    if store_path is not None:
+        with profiler.stage("ingest_store") as record, closing(open_store(store_path)) as conn:
+            loaded_files = loaded_rows = 0
+            for event_id, dir_path in sorted(event_dirs.items()):
+                files, rows = ingest_event(conn, event_id, dir_path)
+                loaded_files += files
+                loaded_rows += rows
+            record.update(files=loaded_files, rows=loaded_rows)
+        say(f"[info] store: loaded {loaded_files} new/changed CSV files ({loaded_rows} rows) into {store_path}")
+
+    event_jobs: List[
+        Tuple[
+            Dict[str, object],
+            Path,
+            Path,
+            Tuple[str, ...],
+            bool,
+            Tuple[int, ...],
+            Optional[Path],
+            bool,
+            Optional[Path],
+            bool,
+            Tuple[TierRule, ...],
+            str,
+            Optional[Tuple[str, ...]],
+        ]
+    ] = []
     for event_id, dir_path in sorted(event_dirs.items()):
         if event_id not in metadata:
-            print(f"[warn] metadata missing for event '{event_id}', skipping.")
+            say(f"[warn] metadata missing for event '{event_id}', skipping.")
             continue
-        print(f"[info] processing {event_id} ({dir_path.name}) ...")
-        readings = load_station_timelines(dir_path)
-        if not readings:
-            print(f"[warn] {event_id} has no usable CSV rows, skipping.")
+        cached = cached_events.get(event_id)
+        with profiler.stage("fingerprint", event=event_id) as record:
+            fingerprint = fingerprint_event(dir_path, metadata[event_id], cached)
+            record["files"] = len(fingerprint["files"])  # type: ignore[arg-type]
+        expected_outputs = event_output_paths(events_output_dir, event_id, formats) + pyramid_output_paths(
+            output_root, event_id, pyramid_levels
+        )
+        if all_stations:
+            expected_outputs.append(output_root / NETWORK_DIRNAME / f"{event_id}.json")
+        outputs_exist = all(path.exists() for path in expected_outputs)
+        if reuse_cache and outputs_exist and fingerprint_matches(fingerprint, cached):
+            say(f"[info] {event_id} unchanged, reusing cached output.")
+            index_entries.append(cached["summary"])  # type: ignore[index]
+            analytics_items[event_id] = cached["analytics"]  # type: ignore[index]
+            manifest_events[event_id] = {**fingerprint, "summary": cached["summary"], "analytics": cached["analytics"]}  # type: ignore[index]
             continue
-        payload = build_event_payload(metadata[event_id], readings)
-        generated_payloads.append(payload)
-        write_json(events_output_dir / f"{event_id}.json", payload)
+        say(f"[info] processing {event_id} ({dir_path.name}) ...")
+        csv_names: Optional[Tuple[str, ...]] = None
+        if window_margin is not None:
+            names = list(fingerprint["files"])  # type: ignore[call-overload]
+            kept, skipped = select_csv_files(names, signal_window(metadata[event_id], window_margin))
+            if skipped:
+                say(describe_skipped(event_id, skipped, len(names), window_margin))
+            csv_names = tuple(kept)
+        pending.append((event_id, fingerprint))
+        event_jobs.append(
+            (
+                metadata[event_id],
+                dir_path,
+                events_output_dir,
+                formats,
+                profile,
+                pyramid_levels,
+                store_path,
+                all_stations,
+                snapshot_path,
+                minify,
+                rules_sets,
+                gap_policy,
+                csv_names,
+            )
+        )
 
-    write_json(output_root / "index.json", build_index_payload(generated_payloads))
-    print(f"[done] generated {len(generated_payloads)} event files -> {output_root}")
+    rebuilt = 0
+    event_records: List[Dict[str, object]] = []
+    for (event_id, fingerprint), (summary, analytics, records) in zip(pending, run_jobs(process_event, event_jobs, workers)):
+        event_records.extend(records)
+        if summary is None:
+            say(f"[warn] {event_id} has no usable CSV rows, skipping.")
+            continue
+        index_entries.append(summary)
+        analytics_items[event_id] = analytics  # type: ignore[assignment]
+        manifest_events[event_id] = {**fingerprint, "summary": summary, "analytics": analytics}
+        rebuilt += 1
+    manifest_events = dict(sorted(manifest_events.items()))
+
+    with profiler.stage("index", events=len(index_entries)):
+        index_payload = sort_index_entries(index_entries)
+        if hashed_assets:
+            index_payload, asset_manifest = publish_hashed_assets(output_root, index_payload, formats, pyramid_levels)
+        write_json(output_root / "index.json", index_payload, compact=minify)
+    with profiler.stage("cross_event_analytics", events=len(analytics_items)):
+        analytics_payload = build_analytics(analytics_items[key] for key in sorted(analytics_items))
+        write_json(output_root / ANALYTICS_FILENAME, analytics_payload, compact=minify)
+    with profiler.stage("station_index", events=len(analytics_items)):
+        station_index = build_station_index(analytics_items[key] for key in sorted(analytics_items))
+        write_json(output_root / STATION_INDEX_FILENAME, station_index, compact=minify)
+    if hashed_assets:
+        with profiler.stage("asset_manifest"):
+            write_asset_manifest(output_root, asset_manifest)
+    with profiler.stage("manifest", events=len(manifest_events)):
+        write_json(
+            manifest_path,
+            {
+                "version": MANIFEST_VERSION,
+                "builderHash": current_builder,
+                "minify": minify,
+                "rulesPath": str(rules or ""),
+                "rulesHash": rules_hash,
+                "gapPolicy": gap_policy,
+                "windowMargin": window_margin,
+                "pyramidLevels": list(pyramid_levels),
+                "allStations": all_stations,
+                "hashedAssets": hashed_assets,
+                "events": manifest_events,
+            },
+        )
+    say(f"[done] generated {len(index_entries)} event files ({rebuilt} rebuilt) -> {output_root}")
+
+    if profile:
+        records = profiler.records + event_records
+        events: Dict[str, List[Dict[str, object]]] = {}
+        for record in records:
+            if "event" in record:
+                events.setdefault(str(record["event"]), []).append(record)
+        report = {
+            "python": platform.python_version(),
+            "numpy": np is not None,
+            "jobs": workers,
+            "incremental": incremental,
+            "eventsRebuilt": rebuilt,
+            "total": {
+                "wallMs": round((time.perf_counter() - build_wall) * 1000, 3),
+                "mainProcessCpuMs": round((time.process_time() - build_cpu) * 1000, 3),
+                "maxRssKb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None,
+            },
+            "stages": summarize_profile(records),
+            "events": {event_id: summarize_profile(rows) for event_id, rows in sorted(events.items())},
+            "records": records,
+        }
+        write_json(output_root / PROFILE_FILENAME, report)
+        say(f"[done] profile -> {output_root / PROFILE_FILENAME}")
+    return index_payload
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build HK Signal 8 JSON data.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--output-dir", default="data", help="Where to write the generated JSON")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rebuild events whose CSVs or metadata changed since the last run (see the build manifest)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for per-event parsing (0 = one per CPU core; default 1 = serial)",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Instead of the site JSON, write a threshold sensitivity matrix per event to <output-dir>/sensitivity/",
+    )
+    parser.add_argument(
+        "--sweep-thresholds",
+        type=lambda value: parse_grid(value, parse_number),
+        default="50,55,60,63,70",
+        help="Comma-separated mean-speed thresholds (km/h) for --sweep",
+    )
+    parser.add_argument(
+        "--sweep-stations",
+        type=parse_grid,
+        default="2,3,4,5,6",
+        help="Comma-separated minimum station counts for --sweep",
+    )
+    parser.add_argument(
+        "--sweep-persistence",
+        type=parse_grid,
+        default="1,2,3,4,6",
+        help="Comma-separated minimum persistence lengths (10-minute intervals) for --sweep",
+    )
+    parser.add_argument(
+        "--event-format",
+        choices=EVENT_FORMATS,
+        default="both",
+        help="Per-event outputs: verbose <id>.json, compact <id>.bin (T8EV columns), or both (default)",
+    )
+    parser.add_argument(
+        "--store",
+        nargs="?",
+        const="typhoon_data/.observations.sqlite",
+        help="Load CSVs into a SQLite observation store (only new or changed files are parsed) and build "
+        "events from it; optional path, default typhoon_data/.observations.sqlite",
+    )
+    parser.add_argument(
+        "--write-snapshot",
+        nargs="?",
+        const=DEFAULT_SNAPSHOT,
+        help="Instead of the site JSON, parse every event folder once and write the reference-station timelines to "
+        f"one memory-mappable snapshot file; optional path, default {DEFAULT_SNAPSHOT}",
+    )
+    parser.add_argument(
+        "--snapshot",
+        nargs="?",
+        const=DEFAULT_SNAPSHOT,
+        help="Read timelines from a snapshot written by --write-snapshot, parsing CSVs only for events whose files "
+        f"changed since; optional path, default {DEFAULT_SNAPSHOT}",
+    )
+    parser.add_argument(
+        "--all-stations",
+        action="store_true",
+        help=f"Also write every station's mean/gust/direction series to <output-dir>/{NETWORK_DIRNAME}/<event>.json",
+    )
+    parser.add_argument(
+        "--pyramid-levels",
+        type=parse_grid,
+        default=",".join(map(str, PYRAMID_LEVELS)),
+        help=f"Comma-separated bucket sizes in minutes for downsampled overview files under <output-dir>/{PYRAMID_DIRNAME}/ "
+        "(empty string to skip)",
+    )
+    parser.add_argument(
+        "--rules",
+        default=DEFAULT_TIER_RULES,
+        help="Tier rule sets (JSON) evaluated for every event into its ruleEvaluations; empty string to skip "
+        f"(default {DEFAULT_TIER_RULES})",
+    )
+    parser.add_argument(
+        "--gap-policy",
+        choices=GAP_POLICIES,
+        default=DEFAULT_GAP_POLICY,
+        help="How missing 10-minute slots are aligned: break persistence runs with empty intervals (default), "
+        f"bridge them by keeping observed slots only, or interpolate gaps of up to {MAX_INTERPOLATED_INTERVALS} intervals",
+    )
+    parser.add_argument(
+        "--window-margin",
+        type=float,
+        metavar="HOURS",
+        help="Only read CSVs whose file name is stamped within HOURS of the official Signal 8 period "
+        "(skipped files are reported); default reads every CSV in the folder",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Write event JSON, index.json, analytics.json and stations.json without indentation (same documents, fewer bytes)",
+    )
+    parser.add_argument(
+        "--hashed-assets",
+        action="store_true",
+        help="Also publish content-hashed event and pyramid files with .gz/.br variants plus asset-manifest.json; "
+        "index.json points at the hashed paths and, with analytics.json and stations.json, is short-TTL",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Record per-stage/per-event wall, CPU, memory and row counts to <output-dir>/{PROFILE_FILENAME} "
+        "(tracemalloc slows the build down)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        check_build_options(args.store, args.snapshot, args.window_margin, args.pyramid_levels)
+    except BuildOptionError as exc:
+        parser.error(str(exc))
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    typhoon_root = (PROJECT_ROOT / args.typhoon_dir).resolve()
+    if args.write_snapshot:
+        snapshot_target = (PROJECT_ROOT / args.write_snapshot).resolve()
+        events, intervals = write_snapshot(snapshot_target, discover_event_directories(typhoon_root), workers)
+        print(f"[done] snapshot of {events} events ({intervals} intervals) -> {snapshot_target}")
+        return
+    if args.sweep:
+        sweep_dir = (PROJECT_ROOT / args.output_dir).resolve() / "sensitivity"
+        snapshot_path = usable_snapshot((PROJECT_ROOT / args.snapshot).resolve() if args.snapshot else None, print)
+        count = run_sweep(
+            build_metadata(PROJECT_ROOT, typhoon_root),
+            discover_event_directories(typhoon_root),
+            sweep_dir,
+            args.sweep_thresholds,
+            args.sweep_stations,
+            args.sweep_persistence,
+            workers,
+            snapshot_path,
+            args.gap_policy,
+            args.window_margin,
+        )
+        combos = len(args.sweep_thresholds) * len(args.sweep_stations) * len(args.sweep_persistence)
+        print(f"[done] evaluated {combos} rule settings for {count} events -> {sweep_dir}")
+        return
 
+    try:
+        build_all(
+            args.typhoon_dir,
+            args.output_dir,
+            incremental=args.incremental,
+            jobs=args.jobs,
+            event_format=args.event_format,
+            rules=args.rules,
+            gap_policy=args.gap_policy,
+            window_margin=args.window_margin,
+            minify=args.minify,
+            pyramid_levels=args.pyramid_levels,
+            all_stations=args.all_stations,
+            hashed_assets=args.hashed_assets,
+            store=args.store,
+            snapshot=args.snapshot,
+            profile=args.profile,
+            log=print,
+        )
+    except BuildOptionError as exc:
+        parser.error(str(exc))
 
 if __name__ == "__main__":
     main()
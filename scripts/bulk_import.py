@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+HK Signal 8 Transparency Portal - bulk import of CSV archives into the SQLite observation store.
+
+Usage:
+    python scripts/bulk_import.py [--typhoon-dir typhoon_data] [--store typhoon_data/.observations.sqlite]
+        [--io-workers 16] [--prefetch 64] [--checkpoint-every 500]
+
+For backfills of many small CSVs on slow or network filesystems. Files are read on a bounded
+thread pool (`--io-workers`) up to `--prefetch` files ahead of the parser, so read latency
+overlaps parsing and inserting. Progress is committed every `--checkpoint-every` files together
+with the `loaded_files` bookkeeping, so an interrupted import (Ctrl+C, crash, lost mount) resumes
+where it stopped when rerun; files already loaded are skipped. The store is the same one that
+`build_event_data.py --store` builds from and `query_store.py` queries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+import build_event_data as builder
+
+
+def count_loaded(conn: sqlite3.Connection, event_id: str) -> int:
+    return conn.execute("SELECT COUNT(*) FROM loaded_files WHERE event = ?", (event_id,)).fetchone()[0]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load CSV folders into the observation store.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Root holding one folder per event")
+    parser.add_argument("--store", default="typhoon_data/.observations.sqlite", help="SQLite store to fill")
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        default=16,
+        help="Threads reading files concurrently (0 = read each file synchronously as it is parsed)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        help="Files read ahead of the parser at most (default 4 per I/O worker)",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=500,
+        help="Commit after this many files, so an interrupted import resumes from there (0 = once per event)",
+    )
+    args = parser.parse_args(argv)
+    if args.io_workers < 0 or args.checkpoint_every < 0 or (args.prefetch is not None and args.prefetch < 1):
+        parser.error("--io-workers and --checkpoint-every must be ≥ 0 and --prefetch ≥ 1")
+    depth = args.prefetch or 4 * max(args.io_workers, 1)
+
+    typhoon_root = (builder.PROJECT_ROOT / args.typhoon_dir).resolve()
+    store_path = (builder.PROJECT_ROOT / args.store).resolve()
+    event_dirs = builder.discover_event_directories(typhoon_root)
+    pool = ThreadPoolExecutor(max_workers=args.io_workers) if args.io_workers else None
+    fetch: Optional[Callable[[List[Path]], Iterator[bytes]]] = None
+    if pool is not None:
+        fetch = lambda paths: builder.prefetch_files(pool, paths, depth)  # noqa: E731
+
+    started = time.perf_counter()
+    total_files = total_rows = 0
+    try:
+        with closing(builder.open_store(store_path)) as conn:
+            for event_id, event_dir in sorted(event_dirs.items()):
+                resumed = count_loaded(conn, event_id)
+                event_started = time.perf_counter()
+                try:
+                    files, rows = builder.ingest_event(conn, event_id, event_dir, fetch, args.checkpoint_every)
+                except KeyboardInterrupt:
+                    committed = count_loaded(conn, event_id)
+                    print(f"[warn] interrupted in {event_id} with {committed} of its files committed; rerun to resume.")
+                    sys.exit(130)
+                total_files += files
+                total_rows += rows
+                if files:
+                    note = f" ({resumed} already loaded)" if resumed else ""
+                    print(
+                        f"[info] {event_id}: loaded {files} files ({rows} rows) in "
+                        f"{time.perf_counter() - event_started:.2f} s{note}"
+                    )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    elapsed = time.perf_counter() - started
+    rate = total_files / elapsed if elapsed > 0 else 0.0
+    print(f"[done] {total_files} files ({total_rows} rows) in {elapsed:.2f} s ({rate:,.0f} files/s) -> {store_path}")
+
+
+if __name__ == "__main__":
+    main()
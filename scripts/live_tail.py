@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+HK Signal 8 Transparency Portal - live tail for an event that is still in progress.
+
+Usage:
+    python scripts/live_tail.py --event-dir "typhoon_data/Nova 20251010" [--output-dir data] [--poll-interval 5] [--once]
+        [--pyramid-levels 30,60,180] [--minify] [--rules scripts/tier_rules.json]
+
+The script keeps the event's parsed columns, per-interval station counts and threshold runs in
+memory. Each new `*-latest_10min_wind.csv` is parsed on its own, appended to the timeline, and the
+persistence runs (which carry the Tier 1 / Tier 2 state) are extended in place. Rows are found by
+epoch minute (an offset from the first stamp), and repeated readings are counted into the event's
+`dataQuality` exactly as in a full build; only then are `data/events/<eventId>.json` / `.bin`, its
+`data/pyramids/<eventId>/` levels, that event's `index.json` entry, `data/analytics.json` and
+`data/stations.json` (other events' contributions come from the build manifest) rewritten. Pyramid levels,
+minification, gap policy and tier rules follow the last build (as recorded in
+`data/.build-manifest.json`) unless `--pyramid-levels` / `--minify` / `--gap-policy` / `--rules`
+are given; rules that hash differently from the build's are reported. When the build published
+hashed assets, the event's hashed copies, the short-TTL documents and `asset-manifest.json` are
+refreshed as well. New files are picked up through inotify when the optional `inotify_simple`
+package is installed, otherwise by polling the folder. `--once` ingests whatever is there,
+publishes, and exits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import build_event_data as builder
+
+
+class LiveEvent:
+    """Append-friendly in-memory state for one event folder."""
+
+    def __init__(
+        self,
+        event_meta: Dict[str, object],
+        event_dir: Path,
+        rules: Tuple[builder.TierRule, ...] = (),
+        gap_policy: str = builder.DEFAULT_GAP_POLICY,
+    ) -> None:
+        self.event_meta = event_meta
+        self.rules = rules
+        self.gap_policy = gap_policy
+        self.event_dir = event_dir
+        self.signatures: Dict[str, Tuple[int, int]] = {}
+        self.timestamps: List[str] = []
+        self.origin = 0  # epoch minute of row_by_minute[0]
+        self.row_by_minute = array("l")  # row of each epoch minute since `origin`, -1 when absent
+        self.written = bytearray()  # written[row * S + station]: a reading for the cell has been ingested
+        self.duplicates = self.conflicts = 0
+        self.means = [array("d") for _ in builder.REFERENCE_STATIONS]
+        self.gusts = [array("d") for _ in builder.REFERENCE_STATIONS]
+        self.counts = array("B")
+        self.runs: List[List[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def ingest(self, csv_paths: List[Path]) -> int:
+        """Parse new or rewritten CSVs; returns how many files changed.
+
+        Files arriving in name order are appended incrementally. A rewritten file, or one that sorts
+        before the newest file already ingested, reloads the folder so "the later file wins" for
+        duplicate timestamps exactly as in a full build.
+        """
+        changed: List[Tuple[Path, Tuple[int, int]]] = []
+        for csv_path in sorted(csv_paths, key=lambda path: path.name):
+            try:
+                stat = csv_path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self.signatures.get(csv_path.name) != signature:
+                changed.append((csv_path, signature))
+        if not changed:
+            return 0
+        newest = max(self.signatures, default="")
+        if any(path.name in self.signatures or path.name < newest for path, _ in changed):
+            self._reload()
+            return len(changed)
+
+        touched: Set[int] = set()
+        out_of_order = False
+        for csv_path, signature in changed:
+            self.signatures[csv_path.name] = signature
+            for timestamp, station, mean_speed, gust_speed in builder.read_csv_rows(csv_path):
+                offset = self._offset(builder.stamp_minutes(timestamp))
+                index = self.row_by_minute[offset]
+                if index < 0:
+                    if self.timestamps and timestamp < self.timestamps[-1]:
+                        out_of_order = True
+                    index = self.row_by_minute[offset] = len(self.timestamps)
+                    self.timestamps.append(timestamp)
+                    for column in self.means:
+                        column.append(builder.MISSING)
+                    for column in self.gusts:
+                        column.append(builder.MISSING)
+                    self.written.extend(bytes(len(self.means)))
+                cell = index * len(self.means) + station
+                if self.written[cell]:
+                    self.duplicates += 1
+                    if not builder.same_speed(self.means[station][index], mean_speed) or not builder.same_speed(
+                        self.gusts[station][index], gust_speed
+                    ):
+                        self.conflicts += 1
+                self.written[cell] = 1
+                self.means[station][index] = mean_speed
+                self.gusts[station][index] = gust_speed
+                touched.add(index)
+        if out_of_order:
+            self._resort()
+        else:
+            self._update_counts(sorted(touched))
+        return len(changed)
+
+    def _offset(self, minute: int) -> int:
+        """Index of `minute` in `row_by_minute`, growing it (at either end) to cover the minute."""
+        if not self.row_by_minute:
+            self.origin = minute
+        elif minute < self.origin:
+            self.row_by_minute = array("l", [-1]) * (self.origin - minute) + self.row_by_minute
+            self.origin = minute
+        offset = minute - self.origin
+        if offset >= len(self.row_by_minute):
+            self.row_by_minute.extend(array("l", [-1]) * (offset + 1 - len(self.row_by_minute)))
+        return offset
+
+    def _reload(self) -> None:
+        self.signatures = {}
+        for csv_path in self.event_dir.glob("*.csv"):
+            stat = csv_path.stat()
+            self.signatures[csv_path.name] = (stat.st_size, stat.st_mtime_ns)
+        columns = builder.read_station_columns(self.event_dir)
+        self.timestamps, self.means, self.gusts = columns.timestamps, columns.means, columns.gusts
+        self.duplicates, self.conflicts = columns.duplicate_readings, columns.conflicting_readings
+        self._recount()
+
+    def _row_count(self, index: int) -> int:
+        return sum(1 for column in self.means if column[index] >= builder.T8_THRESHOLD_KMH)
+
+    def _update_counts(self, rows: List[int]) -> None:
+        """Extend counts and runs for appended rows; rebuild the runs if an existing row flips."""
+        revised = False
+        for index in rows:
+            count = self._row_count(index)
+            if index < len(self.counts):
+                meets_before = self.counts[index] >= builder.MIN_REFERENCE_STATIONS
+                self.counts[index] = count
+                revised = revised or meets_before != (count >= builder.MIN_REFERENCE_STATIONS)
+                continue
+            self.counts.append(count)
+            if count >= builder.MIN_REFERENCE_STATIONS:
+                if self.runs and self.runs[-1][1] == index:
+                    self.runs[-1][1] = index + 1
+                else:
+                    self.runs.append([index, index + 1])
+        if revised:
+            self._rebuild_runs()
+
+    def _resort(self) -> None:
+        columns = builder.sort_station_columns(builder.StationColumns(self.timestamps, self.means, self.gusts))
+        self.timestamps, self.means, self.gusts = columns.timestamps, columns.means, columns.gusts
+        self._recount()
+
+    def _recount(self) -> None:
+        self.row_by_minute = array("l")
+        for index, timestamp in enumerate(self.timestamps):
+            self.row_by_minute[self._offset(builder.stamp_minutes(timestamp))] = index
+        # as in `merge_csv_files`, cells already holding a reading count as written
+        self.written = bytearray(
+            means[index] == means[index] or gusts[index] == gusts[index]
+            for index in range(len(self.timestamps))
+            for means, gusts in zip(self.means, self.gusts)
+        )
+        self.counts = array("B", (self._row_count(index) for index in range(len(self.timestamps))))
+        self._rebuild_runs()
+
+    def _rebuild_runs(self) -> None:
+        self.runs = [list(run) for run in builder.mask_runs(builder.interval_mask(self.counts))]
+
+    def timeline(self) -> builder.EventTimeline:
+        columns = builder.StationColumns(
+            self.timestamps,
+            self.means,
+            self.gusts,
+            duplicate_readings=self.duplicates,
+            conflicting_readings=self.conflicts,
+        )
+        return builder.EventTimeline.from_columns(columns, gap_policy=self.gap_policy)
+
+    def publish(self, site: "LiveSite") -> Dict[str, object]:
+        """Rewrite this event's outputs in `site`; returns the payload.
+
+        The incrementally kept runs are reused while the timeline rows are the ingested rows; once
+        gap alignment adds or drops rows, the runs are recomputed from the aligned timeline.
+        """
+        timeline = self.timeline()
+        runs = [tuple(run) for run in self.runs] if len(timeline) == len(self.timestamps) else None
+        payload = builder.build_event_payload(self.event_meta, timeline, runs=runs, readings=False, rules=self.rules)
+        site.publish(payload, timeline)
+        return payload
+
+
+class LiveSite:
+    """The last build's output tree, kept consistent as one event is republished.
+
+    Other events' contributions to `analytics.json` and `stations.json` come from the build
+    manifest, so only the live event is recomputed. When the build published hashed assets, the
+    live event's files are copied to new hashed names and the short-TTL documents and
+    `asset-manifest.json` are refreshed too.
+    """
+
+    def __init__(
+        self,
+        output_root: Path,
+        formats: Tuple[str, ...],
+        manifest: Dict[str, object],
+        pyramid_levels: Tuple[int, ...] = builder.PYRAMID_LEVELS,
+        minify: bool = False,
+    ) -> None:
+        self.output_root = output_root
+        self.formats = formats
+        self.pyramid_levels = pyramid_levels
+        self.minify = minify
+        self.hashed_assets = bool(manifest.get("hashedAssets", False))
+        events = manifest.get("events", {})
+        self.contributions: Dict[str, Dict[str, object]] = {
+            event_id: cached["analytics"]
+            for event_id, cached in events.items()  # type: ignore[union-attr]
+            if isinstance(cached, dict) and "analytics" in cached
+        }
+
+    def publish(self, payload: Dict[str, object], timeline: builder.EventTimeline) -> None:
+        """Rewrite the event files, pyramid levels, `index.json` entry, `analytics.json` and `stations.json`."""
+        root = self.output_root
+        builder.write_event_outputs(root / "events", payload, timeline, self.formats, compact=self.minify)
+        for name, data in builder.encode_pyramids(payload, timeline, self.pyramid_levels).items():
+            builder.write_bytes(root / builder.PYRAMID_DIRNAME / name, data)
+        entry = builder.build_index_entry(payload)
+        event_id = str(entry["id"])
+        asset_manifest: Dict[str, object] = {}
+        if self.hashed_assets:
+            published, asset_manifest = builder.publish_hashed_assets(root, [entry], self.formats, self.pyramid_levels)
+            entry = published[0]
+            asset_path = root / builder.ASSET_MANIFEST_FILENAME
+            if asset_path.exists():
+                previous = json.loads(asset_path.read_text(encoding="utf-8"))
+                asset_manifest["events"] = {**previous.get("events", {}), **asset_manifest["events"]}  # type: ignore[dict-item]
+        upsert_index_entry(root / "index.json", entry, self.minify)
+
+        self.contributions[event_id] = builder.event_analytics(payload, timeline)
+        contributions = [self.contributions[key] for key in sorted(self.contributions)]
+        builder.write_json(root / builder.ANALYTICS_FILENAME, builder.build_analytics(contributions), compact=self.minify)
+        builder.write_json(
+            root / builder.STATION_INDEX_FILENAME, builder.build_station_index(contributions), compact=self.minify
+        )
+        if self.hashed_assets:
+            builder.write_asset_manifest(root, asset_manifest)
+
+
+def upsert_index_entry(index_path: Path, entry: Dict[str, object], compact: bool = False) -> None:
+    entries: List[Dict[str, object]] = []
+    if index_path.exists():
+        entries = json.loads(index_path.read_text(encoding="utf-8"))
+    entries = [row for row in entries if row["id"] != entry["id"]]
+    entries.append(entry)
+    builder.write_json(index_path, builder.sort_index_entries(entries), compact)
+
+
+class PollingWatcher:
+    """Reports CSVs whose size has been stable for one poll, so half-written files are not read."""
+
+    def __init__(self, directory: Path, interval: float) -> None:
+        self.directory = directory
+        self.interval = interval
+        self.sizes: Dict[str, int] = {}
+
+    def wait(self) -> List[Path]:
+        time.sleep(self.interval)
+        ready: List[Path] = []
+        for csv_path in self.directory.glob("*.csv"):
+            try:
+                size = csv_path.stat().st_size
+            except FileNotFoundError:
+                continue
+            if self.sizes.get(csv_path.name) == size:
+                ready.append(csv_path)
+            self.sizes[csv_path.name] = size
+        return ready
+
+
+class InotifyWatcher:
+    """Reports CSVs as soon as they are closed after writing or moved into the folder."""
+
+    def __init__(self, directory: Path, interval: float) -> None:
+        from inotify_simple import INotify, flags
+
+        self.directory = directory
+        self.timeout_ms = int(interval * 1000)
+        self.inotify = INotify()
+        self.inotify.add_watch(str(directory), flags.CLOSE_WRITE | flags.MOVED_TO)
+
+    def wait(self) -> List[Path]:
+        names = {event.name for event in self.inotify.read(timeout=self.timeout_ms)}
+        return [self.directory / name for name in sorted(names) if name.endswith(".csv")]
+
+
+def make_watcher(directory: Path, interval: float, force_polling: bool = False):
+    if not force_polling:
+        try:
+            return InotifyWatcher(directory, interval)
+        except (ImportError, OSError):
+            pass
+    return PollingWatcher(directory, interval)
+
+
+def describe(payload: Dict[str, object]) -> str:
+    metrics = payload["derivedMetrics"]
+    return (
+        f"tier {payload['tier']}, {metrics['totalIntervals']} intervals, "  # type: ignore[index]
+        f"early warning {metrics['earlyWarningMinutes']} min"  # type: ignore[index]
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Tail a live event folder and republish its JSON as files arrive.")
+    parser.add_argument("--event-dir", required=True, help="Event folder receiving *-latest_10min_wind.csv files")
+    parser.add_argument("--output-dir", default="data", help="Where the event files and index.json live")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="Seconds between polls / inotify timeouts")
+    parser.add_argument("--polling", action="store_true", help="Poll even when inotify is available")
+    parser.add_argument("--once", action="store_true", help="Ingest the current files, publish and exit")
+    parser.add_argument(
+        "--event-format",
+        choices=builder.EVENT_FORMATS,
+        default="both",
+        help="Per-event outputs to rewrite (default both)",
+    )
+    parser.add_argument(
+        "--rules",
+        help="Tier rule sets recorded in the event's ruleEvaluations (default: those of the last build, from its "
+        f"manifest, else {builder.DEFAULT_TIER_RULES}; empty string to skip)",
+    )
+    parser.add_argument(
+        "--gap-policy",
+        choices=builder.GAP_POLICIES,
+        help="How missing 10-minute slots are aligned (see build_event_data.py --gap-policy; default: that of "
+        f"the last build, from its manifest, else {builder.DEFAULT_GAP_POLICY})",
+    )
+    parser.add_argument(
+        "--pyramid-levels",
+        type=builder.parse_grid,
+        help="Pyramid bucket sizes in minutes to rewrite (default: those of the last build, from its manifest, "
+        "else 30,60,180; empty string to skip)",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        default=None,
+        help="Write the event JSON and index.json without indentation (default: as the last build did)",
+    )
+    args = parser.parse_args(argv)
+    formats = ("json", "binary") if args.event_format == "both" else (args.event_format,)
+    if args.pyramid_levels and any(level <= 10 or level % 10 for level in args.pyramid_levels):
+        parser.error("--pyramid-levels must be multiples of 10 minutes above 10")
+
+    project_root = Path(__file__).resolve().parents[1]
+    event_dir = (project_root / args.event_dir).resolve()
+    output_root = (project_root / args.output_dir).resolve()
+    event_id = builder.event_id_for_directory(event_dir.name)
+    metadata = builder.build_metadata(project_root)
+    if event_id not in metadata:
+        sys.exit(f"[error] metadata missing for event '{event_id}'; add it to time_of_signal_8.md first.")
+
+    manifest = builder.load_manifest(output_root / builder.MANIFEST_FILENAME)
+    levels = args.pyramid_levels if args.pyramid_levels is not None else manifest.get("pyramidLevels", builder.PYRAMID_LEVELS)
+    pyramid_levels = tuple(levels)  # type: ignore[arg-type]
+    minify = args.minify if args.minify is not None else bool(manifest.get("minify", False))
+    gap_policy = args.gap_policy if args.gap_policy is not None else str(manifest.get("gapPolicy", builder.DEFAULT_GAP_POLICY))
+
+    rules_arg = args.rules if args.rules is not None else str(manifest.get("rulesPath", builder.DEFAULT_TIER_RULES))
+    rules_path = (project_root / rules_arg).resolve() if rules_arg else None
+    rules: Tuple[builder.TierRule, ...] = ()
+    if rules_path is not None and (rules_path.exists() or rules_arg != builder.DEFAULT_TIER_RULES):
+        try:
+            rules = builder.load_tier_rules(rules_path)
+        except (OSError, ValueError) as exc:
+            parser.error(f"--rules: {exc}")
+    if "rulesHash" in manifest and builder.tier_rules_hash(rules) != manifest["rulesHash"]:
+        print(
+            f"[warn] tier rules ({rules_arg or 'none'}) differ from those of the last build; "
+            "ruleEvaluations will not match the other events until the next build."
+        )
+    site = LiveSite(output_root, formats, manifest, pyramid_levels, minify)
+    live = LiveEvent(metadata[event_id], event_dir, rules, gap_policy)
+    live.ingest(list(event_dir.glob("*.csv")))
+    if live:
+        print(f"[info] {event_id}: loaded {len(live.signatures)} files; {describe(live.publish(site))}")
+    if args.once:
+        return
+
+    watcher = make_watcher(event_dir, args.poll_interval, args.polling)
+    print(f"[info] watching {event_dir} ({type(watcher).__name__}); Ctrl+C to stop.")
+    try:
+        while True:
+            ready = watcher.wait()
+            started = time.perf_counter()
+            if not ready or not live.ingest(ready) or not live:
+                continue
+            payload = live.publish(site)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"[info] {event_id}: {live.timestamps[-1]} -> {describe(payload)} ({elapsed:.0f} ms)")
+    except KeyboardInterrupt:
+        print("[done] stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+HK Signal 8 Transparency Portal - cross-event queries against the SQLite observation store.
+
+Usage:
+    python scripts/query_store.py --station cheung-chau [--min-mean 63] [--since 2018-01-01] [--until 2025-12-31]
+        [--store typhoon_data/.observations.sqlite] [--limit 20]
+
+Lists every interval, across all loaded events, where one station's 10-minute mean speed reached
+`--min-mean`. The store is filled by `build_event_data.py --store`; the query runs on the
+`(station, minute)` index, so it does not touch the CSV folders at all.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import build_event_data as builder
+
+
+def station_name(value: str) -> str:
+    """Accept a reference `stationId` (e.g. `cheung-chau`) or a CSV station name."""
+    for ref in builder.REFERENCE_STATIONS:
+        if value == ref["stationId"]:
+            return ref["csvName"]
+    return value
+
+
+def day_minutes(value: str) -> int:
+    """Epoch minutes for `--since` / `--until` (an argparse `type`)."""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an ISO date or date/time such as 2018-01-01, got {value!r}") from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=builder.HKT)
+    return builder.datetime_minutes(moment)
+
+
+def query_exceedances(
+    conn,
+    name: str,
+    min_mean: float,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+) -> List[Tuple[str, int, float, Optional[float], Optional[str]]]:
+    """`(event, minute, mean, gust, direction)` rows where station `name` had mean ≥ `min_mean`."""
+    station = builder.store_station_ids(conn).get(name)
+    if station is None:
+        return []
+    return conn.execute(
+        "SELECT event, minute, mean, gust, direction FROM observations "
+        "WHERE station = ? AND minute >= ? AND minute <= ? AND mean >= ? ORDER BY minute",
+        (station, since if since is not None else -(2**62), until if until is not None else 2**62, min_mean),
+    ).fetchall()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Query the observation store across events.")
+    parser.add_argument("--store", default="typhoon_data/.observations.sqlite", help="Store written by build_event_data.py --store")
+    parser.add_argument("--station", required=True, help="Reference stationId or CSV station name")
+    parser.add_argument("--min-mean", type=float, default=builder.T8_THRESHOLD_KMH, help="Minimum 10-minute mean (km/h)")
+    parser.add_argument("--since", type=day_minutes, help="ISO date/time (HKT unless an offset is given)")
+    parser.add_argument("--until", type=day_minutes, help="ISO date/time (HKT unless an offset is given)")
+    parser.add_argument("--limit", type=int, default=20, help="Rows to print (all are counted)")
+    args = parser.parse_args(argv)
+
+    store_path = (Path(__file__).resolve().parents[1] / args.store).resolve()
+    if not store_path.exists():
+        sys.exit(f"[error] {store_path} not found; run build_event_data.py --store first.")
+    name = station_name(args.station)
+    with closing(builder.open_store(store_path, readonly=True)) as conn:
+        started = time.perf_counter()
+        rows = query_exceedances(conn, name, args.min_mean, args.since, args.until)
+        elapsed = (time.perf_counter() - started) * 1000
+    for event_id, minute, mean_speed, gust_speed, direction in rows[: args.limit]:
+        gust = f"{gust_speed:5.0f}" if gust_speed is not None else "    -"
+        print(f"{builder.minutes_iso(minute)}  {event_id:<12} mean {mean_speed:5.0f}  gust {gust}  {direction or '-'}")
+    if len(rows) > args.limit:
+        print(f"... {len(rows) - args.limit} more")
+    events = len({row[0] for row in rows})
+    print(f"[done] {len(rows)} intervals in {events} events where {name} ≥ {args.min_mean:g} km/h ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
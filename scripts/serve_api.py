@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+HK Signal 8 Transparency Portal - local query API over the builder's in-memory model.
+
+Usage:
+    python scripts/serve_api.py [--typhoon-dir typhoon_data] [--host 127.0.0.1] [--port 8008] [--cache-size 16]
+
+Endpoints (all GET or HEAD, JSON responses):
+    /index                                          index.json entries, computed from the raw CSVs
+    /events/{id}                                    the event's index entry
+    /events/{id}/stations/{stationId}?from=&to=     one station's series, optionally sliced in time
+    /events/{id}/counts?from=&to=                   stations-meeting-threshold count per interval
+    /events/{id}/summary                            per-station statistics (peaks, minutes ≥ threshold)
+    /events/{id}/tier?threshold=&minStations=&minIntervals=
+                                                    tier evaluation under alternative rule settings
+    /events/{id}/network                            every station in the event's CSVs
+    /events/{id}/network/{stationId}?from=&to=      any station's mean, gust and wind direction
+
+`from` / `to` take an ISO-8601 time (HKT when no offset is given) or a 12-digit `YYYYMMDDHHMM`
+stamp and are inclusive. Parsed events sit in LRU caches keyed by event id (reference timelines
+and all-station observation logs separately); an entry is reused while the event folder's CSV
+names, sizes and mtimes are unchanged, and a network station's series is only materialised when
+it is first requested. Responses carry an ETag (If-None-Match gets a 304) and are gzip-compressed
+when the client accepts it. Only the standard library is used and nothing leaves the machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import math
+import re
+import threading
+import traceback
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import build_event_data as builder
+
+GZIP_MIN_BYTES = 512
+STATION_INDEX = {ref["stationId"]: index for index, ref in enumerate(builder.REFERENCE_STATIONS)}
+ROUTES = [
+    (re.compile(r"^/index/?$"), "index"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/?$"), "event"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/stations/(?P<station_id>[-a-z0-9]+)/?$"), "station"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/counts/?$"), "counts"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/summary/?$"), "summary"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/tier/?$"), "tier"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/network/?$"), "network"),
+    (re.compile(r"^/events/(?P<event_id>[-a-z0-9]+)/network/(?P<station_id>[-a-z0-9]+)/?$"), "network_station"),
+]
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def folder_signature(event_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Cheap change detector for a cached event: CSV names, sizes and mtimes (no hashing)."""
+    signature = []
+    for csv_path in event_dir.glob("*.csv"):
+        stat = csv_path.stat()
+        signature.append((csv_path.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+class EventStore:
+    """LRU caches of parsed `EventTimeline`s and `NetworkColumns`, plus the (small) index entries."""
+
+    def __init__(self, project_root: Path, typhoon_root: Path, capacity: int) -> None:
+        self.metadata = builder.build_metadata(project_root, typhoon_root)
+        self.event_dirs = {
+            event_id: path
+            for event_id, path in builder.discover_event_directories(typhoon_root).items()
+            if event_id in self.metadata
+        }
+        self.capacity = max(capacity, 1)
+        self.timelines: "OrderedDict[str, Tuple[object, builder.EventTimeline]]" = OrderedDict()
+        self.networks: "OrderedDict[str, Tuple[object, builder.NetworkColumns]]" = OrderedDict()
+        self.entries: Dict[str, Tuple[object, Optional[Dict[str, object]]]] = {}
+        self.lock = threading.Lock()
+
+    def cached(self, cache: OrderedDict, event_id: str, loader):
+        event_dir = self.event_dirs.get(event_id)
+        if event_dir is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"unknown event '{event_id}'")
+        signature = folder_signature(event_dir)
+        with self.lock:
+            cached = cache.get(event_id)
+            if cached is not None and cached[0] == signature:
+                cache.move_to_end(event_id)
+                return cached[1]
+            value = loader(event_dir)
+            cache[event_id] = (signature, value)
+            cache.move_to_end(event_id)
+            while len(cache) > self.capacity:
+                cache.popitem(last=False)
+            return value
+
+    def timeline(self, event_id: str) -> builder.EventTimeline:
+        return self.cached(self.timelines, event_id, builder.load_station_timelines)
+
+    def network(self, event_id: str) -> builder.NetworkColumns:
+        return self.cached(self.networks, event_id, builder.read_network_columns)
+
+    def entry(self, event_id: str) -> Optional[Dict[str, object]]:
+        """Index entry for one event (None when its folder has no usable rows)."""
+        event_dir = self.event_dirs.get(event_id)
+        if event_dir is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"unknown event '{event_id}'")
+        signature = folder_signature(event_dir)
+        cached = self.entries.get(event_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        timeline = self.timeline(event_id)
+        entry = None
+        if len(timeline):
+            entry = builder.build_index_entry(builder.build_event_payload(self.metadata[event_id], timeline, readings=False))
+        self.entries[event_id] = (signature, entry)
+        return entry
+
+    def index(self) -> List[Dict[str, object]]:
+        entries = (self.entry(event_id) for event_id in sorted(self.event_dirs))
+        return builder.sort_index_entries(entry for entry in entries if entry is not None)
+
+
+def parse_time(value: str) -> int:
+    """Epoch minutes for a `from` / `to` parameter."""
+    value = value.strip()
+    if value.isdigit():
+        return builder.stamp_minutes(value)
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=builder.HKT)
+    return builder.datetime_minutes(moment)
+
+
+def time_slice(minutes, query: Dict[str, List[str]]) -> range:
+    """Indices into sorted epoch `minutes` between the inclusive `from` / `to` parameters."""
+    try:
+        start = bisect_left(minutes, parse_time(query["from"][0])) if "from" in query else 0
+        stop = bisect_right(minutes, parse_time(query["to"][0])) if "to" in query else len(minutes)
+    except ValueError as exc:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"bad from/to: {exc}") from None
+    return range(start, max(start, stop))
+
+
+def number_param(query: Dict[str, List[str]], name: str, default, cast):
+    """A finite numeric parameter (`nan` / `inf` would come back as invalid JSON)."""
+    if name not in query:
+        return default
+    try:
+        value = cast(query[name][0])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{name}' must be a number") from None
+    if not math.isfinite(value):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{name}' must be a finite number")
+    return value
+
+
+def event_timeline(store: EventStore, event_id: str) -> builder.EventTimeline:
+    timeline = store.timeline(event_id)
+    if not len(timeline):
+        raise ApiError(HTTPStatus.NOT_FOUND, f"event '{event_id}' has no usable CSV rows")
+    return timeline
+
+
+def handle_index(store: EventStore, query: Dict[str, List[str]]) -> object:
+    return store.index()
+
+
+def handle_event(store: EventStore, query: Dict[str, List[str]], event_id: str) -> object:
+    entry = store.entry(event_id)
+    if entry is None:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"event '{event_id}' has no usable CSV rows")
+    return entry
+
+
+def handle_station(store: EventStore, query: Dict[str, List[str]], event_id: str, station_id: str) -> object:
+    station = STATION_INDEX.get(station_id)
+    if station is None:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"unknown station '{station_id}'")
+    timeline = event_timeline(store, event_id)
+    indices = time_slice(timeline.minutes, query)
+    return {
+        "eventId": event_id,
+        "station": {key: value for key, value in timeline.stations[station].items() if key != "csvName"},
+        "thresholdKmh": timeline.threshold,
+        "timestamps": [timeline.timestamp(index) for index in indices],
+        "meanSpeedKmh": [timeline.mean(index, station) for index in indices],
+        "gustKmh": [timeline.gust(index, station) for index in indices],
+        "meetsThreshold": [timeline.meets_threshold(index, station) for index in indices],
+    }
+
+
+def handle_counts(store: EventStore, query: Dict[str, List[str]], event_id: str) -> object:
+    timeline = event_timeline(store, event_id)
+    indices = time_slice(timeline.minutes, query)
+    return {
+        "eventId": event_id,
+        "thresholdKmh": timeline.threshold,
+        "timestamps": [timeline.timestamp(index) for index in indices],
+        "stationsMeetingThreshold": [timeline.counts[index] for index in indices],
+    }
+
+
+def handle_summary(store: EventStore, query: Dict[str, List[str]], event_id: str) -> object:
+    timeline = event_timeline(store, event_id)
+    return {
+        "eventId": event_id,
+        "thresholdKmh": timeline.threshold,
+        "stations": builder.station_statistics(timeline),
+    }
+
+
+def handle_tier(store: EventStore, query: Dict[str, List[str]], event_id: str) -> object:
+    timeline = event_timeline(store, event_id)
+    threshold = number_param(query, "threshold", builder.T8_THRESHOLD_KMH, float)
+    min_stations = number_param(query, "minStations", builder.MIN_REFERENCE_STATIONS, int)
+    min_intervals = number_param(query, "minIntervals", builder.MIN_PERSISTENCE_INTERVALS, int)
+    tier_info = builder.detect_tier(timeline, threshold, min_stations, min_intervals)
+    detection = tier_info["initialDetection"]
+    early_warning = None
+    if detection is not None:
+        official_start = datetime.fromisoformat(store.metadata[event_id]["officialSignal8Start"])  # type: ignore[arg-type]
+        early_warning = builder.minutes_delta(detection, builder.datetime_minutes(official_start))  # type: ignore[arg-type]
+    return {
+        "eventId": event_id,
+        "settings": {"thresholdKmh": threshold, "minStations": min_stations, "minIntervals": min_intervals},
+        **tier_info,
+        "tierLabel": builder.TIER_LABELS[tier_info["detectedTier"]],  # type: ignore[index]
+        "initialDetection": builder.minutes_iso(detection) if detection is not None else None,  # type: ignore[arg-type]
+        "earlyWarningMinutes": early_warning,
+    }
+
+
+def handle_network(store: EventStore, query: Dict[str, List[str]], event_id: str) -> object:
+    network = store.network(event_id)
+    reference = set(builder.STATION_COLUMN_BY_CSV)
+    return {
+        "eventId": event_id,
+        "intervalCount": len(network),
+        "stations": [
+            {"stationId": builder.slugify(name), "name": name, "reference": name in reference}
+            for name in sorted(network.stations)
+        ],
+    }
+
+
+def handle_network_station(store: EventStore, query: Dict[str, List[str]], event_id: str, station_id: str) -> object:
+    network = store.network(event_id)
+    name = next((name for name in network.stations if builder.slugify(name) == station_id), None)
+    if name is None:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"no station '{station_id}' in event '{event_id}'")
+    stamps = network.sorted_timestamps()
+    indices = time_slice([builder.stamp_minutes(stamp) for stamp in stamps], query)
+    series = network.series(name)
+    return {
+        "eventId": event_id,
+        "station": {"stationId": station_id, "name": name},
+        "timestamps": [builder.stamp_iso(stamps[index]) for index in indices],
+        "meanSpeedKmh": [builder.optional_speed(series.means[index]) for index in indices],
+        "gustKmh": [builder.optional_speed(series.gusts[index]) for index in indices],
+        "direction": [builder.WIND_DIRECTIONS[series.directions[index]] or None for index in indices],
+    }
+
+
+HANDLERS = {
+    "index": handle_index,
+    "event": handle_event,
+    "station": handle_station,
+    "counts": handle_counts,
+    "summary": handle_summary,
+    "tier": handle_tier,
+    "network": handle_network,
+    "network_station": handle_network_station,
+}
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "T8PortalAPI/1"
+    store: EventStore
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.respond()
+
+    def do_HEAD(self) -> None:  # noqa: N802 - http.server naming
+        self.respond(head=True)
+
+    def respond(self, head: bool = False) -> None:
+        """Route the request; HEAD gets the GET headers (length and ETag included) without the body."""
+        url = urlsplit(self.path)
+        try:
+            for pattern, name in ROUTES:
+                match = pattern.match(url.path)
+                if match:
+                    data = HANDLERS[name](self.store, parse_qs(url.query), **match.groupdict())
+                    break
+            else:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"no route for {url.path}")
+        except ApiError as exc:
+            self.send_json({"error": str(exc)}, exc.status, head)
+            return
+        except Exception as exc:  # noqa: BLE001 - one bad event folder must not drop the connection
+            print(f"[error] {self.command} {self.path}: {exc!r}")
+            traceback.print_exc()
+            self.send_json({"error": f"internal error: {exc}"}, HTTPStatus.INTERNAL_SERVER_ERROR, head)
+            return
+        self.send_json(data, HTTPStatus.OK, head)
+
+    def send_json(self, data: object, status: HTTPStatus, head: bool = False) -> None:
+        body = builder.encode_json(data, compact=True)
+        etag = hashlib.sha256(body).hexdigest()[: builder.ASSET_HASH_LENGTH]
+        use_gzip = len(body) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+        tag = f'"{etag}-gz"' if use_gzip else f'"{etag}"'
+        if status == HTTPStatus.OK and tag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", tag)
+            self.end_headers()
+            return
+        if use_gzip:
+            body = gzip.compress(body, mtime=0)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if status == HTTPStatus.OK:
+            self.send_header("ETag", tag)
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - http.server signature
+        print(f"[info] {self.address_string()} {format % args}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve event slices from the raw CSVs over a local HTTP API.")
+    parser.add_argument("--typhoon-dir", default="typhoon_data", help="Where raw CSV folders live")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default loopback only)")
+    parser.add_argument("--port", type=int, default=8008, help="Port to listen on")
+    parser.add_argument("--cache-size", type=int, default=16, help="Parsed events kept in the LRU cache")
+    args = parser.parse_args(argv)
+
+    project_root = Path(__file__).resolve().parents[1]
+    typhoon_root = (project_root / args.typhoon_dir).resolve()
+    ApiHandler.store = EventStore(project_root, typhoon_root, args.cache_size)
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    print(f"[info] serving {len(ApiHandler.store.event_dirs)} events on http://{args.host}:{server.server_port}; Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[done] stopped.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()